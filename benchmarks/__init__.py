@@ -0,0 +1,14 @@
+"""
+Benchmarks Module.
+
+Микро-бенчмарки горячих компонентов проекта Task Manager:
+
+- Сериализация и десериализация задач и пользователей (`TaskSerializer`, `UserSerializer`).
+- Список задач через полный цикл запроса DRF (`TaskViewSet.list`).
+- Проверка JWT-токена при аутентификации (`StatelessJWTAuthentication`).
+- Создание пользователя (`CustomUserManager.create_user`).
+- Проверка статуса задачи по `TaskStatus.choices()`.
+
+Результаты сравниваются с базовыми замерами `benchmarks/baseline.json`; бенчмарк, медиана
+которого выросла больше допустимого порога, проваливается (см. `benchmarks/conftest.py`).
+"""
@@ -0,0 +1,65 @@
+"""
+Параметры и сводка микро-бенчмарков.
+
+Запуск: `pytest benchmarks` (каталог не входит в `testpaths`, обычный `pytest` его не запускает).
+
+- `--benchmark-baseline PATH`: файл базовых замеров (по умолчанию `benchmarks/baseline.json`).
+- `--benchmark-threshold 0.25`: допустимый рост медианы; бенчмарк с большим ростом проваливается.
+- `--benchmark-save`: записать результаты прогона как новые базовые замеры.
+"""
+
+import pytest
+from tasks import perfutils
+
+from benchmarks import utils
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Очищает кэши процесса перед каждым бенчмарком (см. `tasks.perfutils.clear_caches`).
+    """
+    perfutils.clear_caches()
+    yield
+
+
+def pytest_addoption(parser) -> None:
+    group = parser.getgroup('benchmark', 'микро-бенчмарки')
+    group.addoption('--benchmark-baseline', default=utils.DEFAULT_BASELINE, help='Файл базовых замеров.')
+    group.addoption('--benchmark-threshold', type=float, default=utils.DEFAULT_THRESHOLD,
+                    help='Допустимый рост медианы относительно базового замера.')
+    group.addoption('--benchmark-save', action='store_true', help='Сохранить результаты как базовые замеры.')
+
+
+def pytest_configure(config) -> None:
+    utils.session = utils.BenchmarkSession(
+        config.getoption('benchmark_baseline'),
+        config.getoption('benchmark_threshold'),
+        config.getoption('benchmark_save'),
+    )
+
+
+def pytest_sessionfinish(session, exitstatus) -> None:
+    if utils.session.save and utils.session.results:
+        utils.session.write_baseline(perfutils.git_commit())
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    session = utils.session
+    if not session.results:
+        return
+    terminalreporter.section('benchmarks')
+    terminalreporter.write_line(
+        f'Базовые замеры: {session.baseline_path} (коммит {session.meta.get("commit") or "—"})'
+    )
+    terminalreporter.write_line(f'{"benchmark":<60} {"median us":>10} {"baseline":>10} {"change":>8}')
+    for name, result in sorted(session.results.items()):
+        base = session.baseline.get(name, {}).get('median_us')
+        change = session.change(name)
+        flag = ' !' if change is not None and change > session.threshold else ''
+        terminalreporter.write_line(
+            f'{name:<60} {result["median_us"]:>10} {base if base is not None else "—":>10} '
+            f'{f"{change:+.1%}" if change is not None else "—":>8}{flag}'
+        )
+    if session.save:
+        terminalreporter.write_line(f'Базовые замеры сохранены в {session.baseline_path}.')
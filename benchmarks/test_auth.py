@@ -0,0 +1,73 @@
+"""
+Модуль микро-бенчмарков аутентификации и создания пользователей.
+
+Содержит бенчмарки:
+- Проверки подписи и срока действия JWT-токена и аутентификации запроса по нему.
+- Создания пользователя `CustomUserManager.create_user` без пароля и с паролем.
+"""
+
+
+import itertools
+
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+from users.authentication import StatelessJWTAuthentication, add_user_claims
+from users.models import User
+
+from benchmarks.utils import BenchmarkTestCase
+from tests.test_password_hashing import FAST_HASHING, profile_hashers
+
+
+class JWTAuthenticationBenchmark(BenchmarkTestCase):
+    """
+    Бенчмарки JWT-аутентификации.
+    """
+    def setUp(self) -> None:
+        user = User.objects.create_user(email="bench-jwt@example.com", name="Бенчмарк")
+        token = AccessToken.for_user(user)
+        add_user_claims(token, user)
+        self.raw_token = str(token).encode()
+        self.request = APIRequestFactory().get('/api/tasks/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.authentication = StatelessJWTAuthentication()
+
+    def test_decode(self) -> None:
+        """
+        Бенчмарк проверки токена (подпись, срок действия, тип).
+        """
+        self.benchmark(lambda: self.authentication.get_validated_token(self.raw_token))
+
+    def test_authenticate(self) -> None:
+        """
+        Бенчмарк аутентификации запроса: разбор заголовка, проверка токена и пользователь из claims.
+        """
+        self.benchmark(lambda: self.authentication.authenticate(self.request))
+
+
+class CreateUserBenchmark(BenchmarkTestCase):
+    """
+    Бенчмарки создания пользователя.
+    """
+    def setUp(self) -> None:
+        self.numbers = itertools.count()
+
+    def test_create_user(self) -> None:
+        """
+        Бенчмарк создания пользователя без пароля (нормализация email и вставка).
+        """
+        self.benchmark(
+            lambda: User.objects.create_user(email=f'Bench-{next(self.numbers)}@Example.COM', name='Бенчмарк')
+        )
+
+    @override_settings(PASSWORD_HASHERS=profile_hashers('pbkdf2'), PASSWORD_HASHING=FAST_HASHING)
+    def test_create_user_with_password(self) -> None:
+        """
+        Бенчмарк создания пользователя с паролем при облегченном хешировании.
+
+        Стоимость хеширования рабочих профилей замеряет команда `benchmark_logins`.
+        """
+        self.benchmark(
+            lambda: User.objects.create_user(
+                email=f'bench-{next(self.numbers)}@example.com', name='Бенчмарк', password='password123',
+            )
+        )
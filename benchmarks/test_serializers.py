@@ -0,0 +1,108 @@
+"""
+Модуль микро-бенчмарков сериализаторов.
+
+Содержит бенчмарки:
+- Сериализации задачи и страницы задач `TaskSerializer` и ее проверки при создании.
+- Сериализации пользователей `UserSerializer` и проверки данных регистрации.
+- Проверки статуса задачи по `TaskStatus.choices()` в сериализаторе и модели.
+"""
+
+
+from tasks.models import Task, TaskStatus
+from users.models import User
+from users.serializers import TaskSerializer, UserSerializer
+
+from benchmarks.utils import BenchmarkTestCase
+from tests.utils import create_tasks
+
+PAGE_SIZE = 50
+
+
+class TaskSerializerBenchmark(BenchmarkTestCase):
+    """
+    Бенчмарки сериализации и десериализации задач.
+    """
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="bench-tasks@example.com", name="Бенчмарк")
+        create_tasks(self.user, PAGE_SIZE, description='Описание задачи для бенчмарка сериализации')
+        self.tasks = list(Task.objects.filter(user=self.user).order_by('id'))
+        self.payload = {
+            'title': 'Новая задача', 'description': 'Описание', 'status': TaskStatus.IN_PROGRESS.value,
+            'user': self.user.id,
+        }
+
+    def test_encode(self) -> None:
+        """
+        Бенчмарк сериализации одной задачи.
+        """
+        self.benchmark(lambda: TaskSerializer(self.tasks[0]).data)
+
+    def test_encode_page(self) -> None:
+        """
+        Бенчмарк сериализации страницы задач.
+        """
+        self.benchmark(lambda: TaskSerializer(self.tasks, many=True).data)
+
+    def test_decode(self) -> None:
+        """
+        Бенчмарк проверки данных новой задачи (включая запрос владельца по первичному ключу).
+        """
+        def decode() -> None:
+            serializer = TaskSerializer(data=self.payload)
+            serializer.is_valid(raise_exception=True)
+
+        self.benchmark(decode)
+
+
+class UserSerializerBenchmark(BenchmarkTestCase):
+    """
+    Бенчмарки сериализации и десериализации пользователей.
+    """
+    def setUp(self) -> None:
+        User.objects.bulk_create(
+            User(email=f'bench-user-{number}@example.com', name=f'Пользователь {number}') for number in range(PAGE_SIZE)
+        )
+        self.users = list(User.objects.order_by('id'))
+        self.payload = {'name': 'Новый', 'email': 'bench-new@example.com', 'password': 'password123'}
+
+    def test_encode_page(self) -> None:
+        """
+        Бенчмарк сериализации страницы пользователей.
+        """
+        self.benchmark(lambda: UserSerializer(self.users, many=True).data)
+
+    def test_decode(self) -> None:
+        """
+        Бенчмарк проверки данных регистрации (включая проверку уникальности email).
+        """
+        def decode() -> None:
+            serializer = UserSerializer(data=self.payload)
+            serializer.is_valid(raise_exception=True)
+
+        self.benchmark(decode)
+
+
+class TaskStatusBenchmark(BenchmarkTestCase):
+    """
+    Бенчмарки проверки статуса задачи по `TaskStatus.choices()`.
+    """
+    def test_choices(self) -> None:
+        """
+        Бенчмарк построения списка статусов.
+        """
+        self.benchmark(TaskStatus.choices)
+
+    def test_serializer_field(self) -> None:
+        """
+        Бенчмарк проверки статуса полем сериализатора.
+        """
+        field = TaskSerializer().fields['status']
+        self.benchmark(lambda: field.run_validation(TaskStatus.COMPLETED.value))
+
+    def test_model_field(self) -> None:
+        """
+        Бенчмарк проверки статуса полем модели (`Model.clean_fields`).
+        """
+        task = Task(title='Задача', description='Описание', status=TaskStatus.COMPLETED.value)
+        exclude = [field.name for field in Task._meta.fields if field.name != 'status']
+        self.benchmark(lambda: task.clean_fields(exclude=exclude))
@@ -0,0 +1,50 @@
+"""
+Модуль микро-бенчмарков представлений.
+
+Содержит бенчмарки `TaskViewSet.list` через полный цикл запроса DRF (согласование формата,
+аутентификация, права, ограничение частоты, пагинация и рендеринг ответа) с промахом и
+попаданием в кэш страниц списка.
+"""
+
+
+from django.core.cache import caches
+from rest_framework.test import APIRequestFactory, force_authenticate
+from users.models import User
+from users.views import TaskViewSet
+
+from benchmarks.utils import BenchmarkTestCase
+from tests.utils import create_tasks
+
+
+class TaskListBenchmark(BenchmarkTestCase):
+    """
+    Бенчмарки списка задач.
+    """
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="bench-list@example.com", name="Бенчмарк")
+        create_tasks(self.user, 200)
+        self.view = TaskViewSet.as_view({'get': 'list'})
+        self.factory = APIRequestFactory()
+
+    def list(self) -> None:
+        request = self.factory.get('/api/tasks/')
+        force_authenticate(request, user=self.user)
+        response = self.view(request)
+        response.render()
+        assert response.status_code == 200, response.status_code
+
+    def test_list(self) -> None:
+        """
+        Бенчмарк первой страницы списка с формированием ответа (промах кэша).
+        """
+        def list_uncached() -> None:
+            caches['task_lists'].clear()
+            self.list()
+
+        self.benchmark(list_uncached)
+
+    def test_list_cached(self) -> None:
+        """
+        Бенчмарк первой страницы списка из кэша страниц.
+        """
+        self.benchmark(self.list)
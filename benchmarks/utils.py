@@ -0,0 +1,169 @@
+"""
+Вспомогательные средства микро-бенчмарков.
+
+Содержит:
+- measure: замер времени одного вызова с калибровкой числа вызовов в раунде.
+- BenchmarkSession: результаты прогона, сравнение с базовыми замерами и их сохранение.
+- BenchmarkTestCase: базовый класс бенчмарков с методом `benchmark`.
+
+Время одного вызова — медиана по раундам; в каждом раунде функция вызывается столько
+раз, чтобы раунд длился не меньше `MIN_ROUND_SECONDS`, поэтому таймер не вносит
+заметной погрешности даже для вызовов в единицы микросекунд. Сборка мусора на время
+раунда отключается, как в `timeit`.
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from django.test import TestCase
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_ROUNDS = 15
+MIN_ROUND_SECONDS = 0.01
+
+
+def measure(func: Callable[[], object], rounds: int = DEFAULT_ROUNDS) -> dict:
+    """
+    Замеряет время одного вызова функции.
+
+    Args:
+        func (Callable): Вызываемый объект без аргументов.
+        rounds (int): Количество раундов.
+
+    Returns:
+        dict: Медиана, минимум и стандартное отклонение времени вызова в микросекундах,
+        число раундов и вызовов в раунде.
+    """
+    func()  # Прогрев: ленивые импорты, кэши сериализаторов и подготовленные запросы.
+    iterations = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        if time.perf_counter() - started >= MIN_ROUND_SECONDS:
+            break
+        iterations *= 2
+
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                func()
+            timings.append((time.perf_counter() - started) / iterations * 1e6)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return {
+        'median_us': round(statistics.median(timings), 3),
+        'min_us': round(min(timings), 3),
+        'stdev_us': round(statistics.stdev(timings), 3) if len(timings) > 1 else 0.0,
+        'rounds': rounds,
+        'iterations': iterations,
+    }
+
+
+class BenchmarkSession:
+    """
+    Результаты прогона бенчмарков и базовые замеры, с которыми они сравниваются.
+
+    Attributes:
+        baseline_path (str): Путь к файлу базовых замеров.
+        threshold (float): Допустимый рост медианы относительно базового замера (0.25 — 25%).
+        save (bool): Сохранить результаты прогона как новые базовые замеры.
+        baseline (dict): Базовые замеры по именам бенчмарков.
+        results (dict): Замеры текущего прогона по именам бенчмарков.
+    """
+
+    def __init__(self, baseline_path: str = DEFAULT_BASELINE, threshold: float = DEFAULT_THRESHOLD,
+                 save: bool = False) -> None:
+        self.baseline_path = baseline_path
+        self.threshold = threshold
+        self.save = save
+        self.meta = {}
+        self.baseline = {}
+        self.results = {}
+        if os.path.exists(baseline_path):
+            with open(baseline_path, encoding='utf-8') as file:
+                data = json.load(file)
+            self.meta, self.baseline = data.get('meta', {}), data.get('benchmarks', {})
+
+    def change(self, name: str) -> float | None:
+        """
+        Возвращает относительное изменение медианы бенчмарка или None без базового замера.
+        """
+        base = self.baseline.get(name)
+        if not base or not base.get('median_us'):
+            return None
+        return self.results[name]['median_us'] / base['median_us'] - 1
+
+    def record(self, name: str, result: dict) -> str | None:
+        """
+        Сохраняет замер и проверяет его по базовому.
+
+        Returns:
+            str | None: Описание регрессии, если медиана выросла больше чем на `threshold`
+            (при сохранении новых базовых замеров регрессии не учитываются).
+        """
+        self.results[name] = result
+        change = self.change(name)
+        if self.save or change is None or change <= self.threshold:
+            return None
+        return (
+            f'{name}: {result["median_us"]} мкс против {self.baseline[name]["median_us"]} мкс в базовом замере '
+            f'({change:+.1%}, порог {self.threshold:+.0%}).'
+        )
+
+    def write_baseline(self, commit: str | None) -> None:
+        """
+        Записывает результаты прогона в файл базовых замеров, сохраняя замеры других бенчмарков.
+        """
+        data = {
+            'meta': {
+                'commit': commit,
+                'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+            },
+            'benchmarks': dict(sorted({**self.baseline, **self.results}.items())),
+        }
+        with open(self.baseline_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False, indent=2)
+            file.write('\n')
+
+
+# Настраивается в benchmarks/conftest.py параметрами командной строки.
+session = BenchmarkSession()
+
+
+class BenchmarkTestCase(TestCase):
+    """
+    Базовый класс бенчмарков: данные создаются в транзакции теста и откатываются после него.
+    """
+
+    def benchmark(self, func: Callable[[], object], rounds: int = DEFAULT_ROUNDS) -> dict:
+        """
+        Замеряет функцию под именем текущего теста и проваливает тест при регрессии.
+
+        Args:
+            func (Callable): Вызываемый объект без аргументов.
+            rounds (int): Количество раундов.
+
+        Returns:
+            dict: Результат `measure`.
+        """
+        name = self.id().removeprefix('benchmarks.')
+        result = measure(func, rounds)
+        regression = session.record(name, result)
+        if regression:
+            self.fail(f'Регрессия производительности: {regression}')
+        return result
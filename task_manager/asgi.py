@@ -6,6 +6,10 @@ ASGI (асинхронный шлюзовый интерфейс сервера)
 асинхронными веб-серверами и приложениями на Python, обеспечивающий масштабируемую и эффективную связь.
 
 ASGI-приложение доступно как переменная уровня модуля с именем `application`.
+Под ASGI асинхронные эндпоинты задач (`/api/async/tasks/`) не занимают поток воркера
+на время ожидания базы данных. Запуск:
+
+    gunicorn task_manager.asgi:application -k uvicorn.workers.UvicornWorker --workers 4
 
 Подробнее см.:
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
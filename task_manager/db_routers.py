@@ -0,0 +1,144 @@
+"""
+Модуль маршрутизации запросов к базам данных для проекта task_manager.
+
+Содержит:
+- PrimaryReplicaRouter: роутер, отправляющий запись в основную базу (`default`),
+  а чтение в представлениях, разрешивших его (`use_replica_reads`), — в реплику
+  из настройки `DATABASE_REPLICAS`.
+- PrimaryPinMiddleware: хранит состояние маршрутизации текущего запроса и обеспечивает
+  чтение собственных записей (read-your-writes).
+- use_replica_reads / routing_state: управление состоянием текущего запроса.
+
+Чтение собственных записей:
+- после записи в рамках запроса все последующие чтения этого запроса идут в основную базу;
+- ответ на такой запрос устанавливает cookie `DATABASE_PRIMARY_PIN_COOKIE` на
+  `DATABASE_REPLICA_LAG_SECONDS` секунд, и следующие запросы клиента в течение этого
+  времени (пока реплика может отставать) тоже читают из основной базы.
+
+Вне запросов (команды, фоновые задачи) и без реплик чтение идет в основную базу.
+"""
+
+import random
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpRequest, HttpResponse
+
+
+@dataclass
+class RoutingState:
+    """
+    Состояние маршрутизации запроса.
+
+    Attributes:
+        replica_reads (bool): Представление разрешило чтение из реплики.
+        pinned (bool): Чтение закреплено за основной базой (была запись или cookie).
+        wrote (bool): В ходе запроса выполнялась запись.
+    """
+    replica_reads: bool = False
+    pinned: bool = False
+    wrote: bool = False
+
+
+_state: ContextVar[RoutingState | None] = ContextVar('db_routing_state', default=None)
+
+
+def routing_state() -> RoutingState | None:
+    """
+    Возвращает состояние маршрутизации текущего запроса или None вне запроса.
+    """
+    return _state.get()
+
+
+def use_replica_reads() -> None:
+    """
+    Разрешает чтение из реплики до конца текущего запроса.
+    """
+    state = _state.get()
+    if state is not None:
+        state.replica_reads = True
+
+
+class PrimaryReplicaRouter:
+    """
+    Роутер основной базы и реплик для чтения.
+    """
+
+    def db_for_read(self, model, **hints) -> str | None:
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        state = _state.get()
+        replicas = settings.DATABASE_REPLICAS
+        if state is None or not state.replica_reads or state.pinned or not replicas:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints) -> str:
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+            state.pinned = True
+        # Объекты, явно связанные с другой базой (`using()`), пишутся туда же, но не в реплику.
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db and instance._state.db not in settings.DATABASE_REPLICAS:
+            return instance._state.db
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool | None:
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+
+class PrimaryPinMiddleware:
+    """
+    Middleware состояния маршрутизации и закрепления чтения за основной базой после записи.
+
+    Поддерживает синхронные и асинхронные обработчики, чтобы не переводить асинхронные
+    представления в поток.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = self._start(request)
+        try:
+            return self._finish(self.get_response(request))
+        finally:
+            _state.reset(token)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        token = self._start(request)
+        try:
+            return self._finish(await self.get_response(request))
+        finally:
+            _state.reset(token)
+
+    def _start(self, request: HttpRequest):
+        """
+        Создает состояние запроса; cookie закрепления переводит чтение в основную базу.
+        """
+        return _state.set(RoutingState(pinned=settings.DATABASE_PRIMARY_PIN_COOKIE in request.COOKIES))
+
+    def _finish(self, response: HttpResponse) -> HttpResponse:
+        """
+        Устанавливает cookie закрепления, если в ходе запроса выполнялась запись.
+        """
+        if _state.get().wrote and settings.DATABASE_REPLICAS:
+            response.set_cookie(
+                settings.DATABASE_PRIMARY_PIN_COOKIE, '1',
+                max_age=settings.DATABASE_REPLICA_LAG_SECONDS, httponly=True, samesite='Lax',
+            )
+        return response
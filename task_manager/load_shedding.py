@@ -0,0 +1,127 @@
+"""
+Модуль сброса нагрузки (load shedding) для проекта task_manager.
+
+Содержит:
+- LoadSheddingMiddleware: отвечает 503 с заголовком `Retry-After`, не выполняя запрос,
+  когда воркер перегружен. Пути из `LOAD_SHEDDING['EXEMPT_PATHS']` (например, `/metrics`)
+  обслуживаются всегда.
+- in_flight: число запросов, обрабатываемых процессом в данный момент.
+
+Перегрузка определяется по двум признакам:
+- число одновременно обрабатываемых процессом запросов достигло
+  `LOAD_SHEDDING['MAX_IN_FLIGHT']` (потоковые и ASGI-воркеры);
+- запрос ждал в очереди перед воркером дольше `LOAD_SHEDDING['MAX_QUEUE_MS']`. Время
+  ожидания берется из заголовка `X-Request-Start` (`t=<время>`), который выставляет
+  обратный прокси (nginx: `proxy_set_header X-Request-Start "t=${msec}";`). Это единственный
+  признак переполнения для синхронных воркеров, у которых очередь — backlog сокета.
+
+Ответ на запрос, который клиент уже перестал ждать, лишь задерживает следующие запросы
+очереди. Отказ без выполнения стоит доли миллисекунды, поэтому под перегрузкой воркер
+быстро разбирает очередь, и задержка принятых запросов остается ограниченной.
+Нулевое значение порога отключает соответствующую проверку.
+"""
+
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, JsonResponse
+
+SHED_DETAIL = 'Сервис перегружен, повторите запрос позже.'
+
+_lock = threading.Lock()
+_in_flight = 0
+
+
+def in_flight() -> int:
+    """
+    Возвращает число запросов, обрабатываемых процессом в данный момент.
+    """
+    return _in_flight
+
+
+def queue_milliseconds(request: HttpRequest, now: float) -> float | None:
+    """
+    Возвращает время ожидания запроса в очереди по заголовку `X-Request-Start`.
+
+    Прокси передают время в секундах, миллисекундах или микросекундах; единица
+    определяется по величине значения.
+
+    Returns:
+        float | None: Время ожидания в миллисекундах или None, если заголовка нет.
+    """
+    raw = request.META.get('HTTP_X_REQUEST_START', '')
+    try:
+        started = float(raw.removeprefix('t='))
+    except ValueError:
+        return None
+    if started > 1e14:
+        started /= 1e6
+    elif started > 1e11:
+        started /= 1e3
+    return max(0.0, (now - started) * 1000)
+
+
+class LoadSheddingMiddleware:
+    """
+    Middleware сброса нагрузки по числу запросов в обработке и времени в очереди.
+
+    Поддерживает синхронные и асинхронные обработчики.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if request.path in settings.LOAD_SHEDDING['EXEMPT_PATHS']:
+            return self.get_response(request)
+        if not self._acquire(request):
+            return self._shed()
+        try:
+            return self.get_response(request)
+        finally:
+            self._release()
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if request.path in settings.LOAD_SHEDDING['EXEMPT_PATHS']:
+            return await self.get_response(request)
+        if not self._acquire(request):
+            return self._shed()
+        try:
+            return await self.get_response(request)
+        finally:
+            self._release()
+
+    def _acquire(self, request: HttpRequest) -> bool:
+        """
+        Принимает запрос и учитывает его в числе запросов в обработке или отказывает в нем.
+        """
+        global _in_flight
+        config = settings.LOAD_SHEDDING
+        if config['MAX_QUEUE_MS']:
+            waited = queue_milliseconds(request, time.time())
+            if waited is not None and waited > config['MAX_QUEUE_MS']:
+                return False
+        with _lock:
+            if config['MAX_IN_FLIGHT'] and _in_flight >= config['MAX_IN_FLIGHT']:
+                return False
+            _in_flight += 1
+        return True
+
+    def _release(self) -> None:
+        global _in_flight
+        with _lock:
+            _in_flight -= 1
+
+    def _shed(self) -> HttpResponse:
+        response = JsonResponse({'detail': SHED_DETAIL}, status=503, json_dumps_params={'ensure_ascii': False})
+        response['Retry-After'] = str(settings.LOAD_SHEDDING['RETRY_AFTER'])
+        response['Cache-Control'] = 'no-store'
+        return response
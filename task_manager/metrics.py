@@ -0,0 +1,365 @@
+"""
+Модуль метрик производительности запросов для проекта task_manager.
+
+Содержит:
+- PerformanceMiddleware: замеряет для каждого запроса общее время, число и время
+  SQL-запросов (через `connection.execute_wrapper`), время рендеринга ответа
+  (сериализации данных в JSON или HTML) и размер ответа. Замеры отдаются клиенту
+  в заголовке `Server-Timing` и накапливаются по представлениям.
+- MetricsRegistry: потокобезопасные агрегаты по представлениям в памяти процесса.
+- metrics_view: эндпоинт `/metrics` в текстовом формате Prometheus.
+- query_budget / QueryBudgetExceeded: бюджет SQL-запросов представления.
+
+Представление обозначается как `<класс>.<действие>` для viewset'ов
+(`TaskViewSet.list`), `<класс>.<метод>` для остальных классовых представлений
+(`TokenObtainPairView.post`) и именем функции для функциональных.
+
+Бюджет запросов задается атрибутом `query_budget` класса представления — числом или
+словарем `{действие: число}` — либо декоратором `query_budget` на функции представления
+или методе действия (`@action`). Бюджет ограничивает число SQL-запросов за весь HTTP-запрос,
+включая аутентификацию. При превышении middleware пишет предупреждение в журнал, а при
+`QUERY_BUDGET_RAISE` (включен в тестах) выбрасывает `QueryBudgetExceeded`. Так рост числа
+запросов с числом строк (N+1) обнаруживается до выката.
+
+Метрики хранятся в памяти процесса: при нескольких воркерах каждый отдает свои агрегаты.
+Для потоковых ответов учитываются только запросы к базе до начала отправки тела.
+"""
+
+import logging
+import threading
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+UNMATCHED_VIEW = 'unmatched'
+
+
+class QueryBudgetExceeded(Exception):
+    """
+    Исключение превышения бюджета SQL-запросов представления.
+    """
+
+
+def query_budget(limit: int):
+    """
+    Декоратор, задающий бюджет SQL-запросов функции представления или метода действия.
+
+    Args:
+        limit (int): Максимальное число SQL-запросов за HTTP-запрос.
+
+    Returns:
+        Callable: Декоратор, возвращающий ту же функцию.
+    """
+    def decorator(func):
+        func.query_budget = limit
+        return func
+    return decorator
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Замеры текущего запроса.
+
+    Attributes:
+        queries (int): Число SQL-запросов.
+        db_seconds (float): Время выполнения SQL-запросов.
+        render_seconds (float): Время рендеринга ответа.
+    """
+    queries: int = 0
+    db_seconds: float = 0.0
+    render_seconds: float = 0.0
+
+
+@dataclass
+class ViewStats:
+    """
+    Накопленные метрики представления.
+    """
+    statuses: dict = field(default_factory=dict)
+    buckets: list = field(default_factory=lambda: [0] * len(DURATION_BUCKETS))
+    count: int = 0
+    duration_seconds: float = 0.0
+    queries: int = 0
+    db_seconds: float = 0.0
+    render_seconds: float = 0.0
+    response_bytes: int = 0
+
+
+class MetricsRegistry:
+    """
+    Потокобезопасный реестр метрик по представлениям.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def observe(self, view: str, status: int, duration: float, metrics: RequestMetrics, size: int) -> None:
+        """
+        Учитывает завершенный запрос.
+
+        Args:
+            view (str): Имя представления.
+            status (int): Код ответа.
+            duration (float): Общее время запроса в секундах.
+            metrics (RequestMetrics): Замеры запроса.
+            size (int): Размер тела ответа в байтах.
+        """
+        with self._lock:
+            stats = self._views.get(view)
+            if stats is None:
+                stats = self._views[view] = ViewStats()
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if duration <= bound:
+                    stats.buckets[index] += 1
+                    break
+            stats.count += 1
+            stats.duration_seconds += duration
+            stats.queries += metrics.queries
+            stats.db_seconds += metrics.db_seconds
+            stats.render_seconds += metrics.render_seconds
+            stats.response_bytes += size
+
+    def clear(self) -> None:
+        """
+        Сбрасывает накопленные метрики.
+        """
+        with self._lock:
+            self._views.clear()
+
+    def render(self) -> str:
+        """
+        Возвращает метрики в текстовом формате Prometheus.
+        """
+        with self._lock:
+            views = sorted(self._views.items())
+            lines = [
+                '# HELP task_manager_requests_total Число обработанных запросов.',
+                '# TYPE task_manager_requests_total counter',
+            ]
+            for view, stats in views:
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(f'task_manager_requests_total{{view="{_escape(view)}",status="{status}"}} {count}')
+
+            lines += [
+                '# HELP task_manager_request_duration_seconds Общее время обработки запроса.',
+                '# TYPE task_manager_request_duration_seconds histogram',
+            ]
+            for view, stats in views:
+                label = f'view="{_escape(view)}"'
+                cumulative = 0
+                for bound, count in zip(DURATION_BUCKETS, stats.buckets):
+                    cumulative += count
+                    lines.append(f'task_manager_request_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+                lines.append(f'task_manager_request_duration_seconds_bucket{{{label},le="+Inf"}} {stats.count}')
+                lines.append(f'task_manager_request_duration_seconds_sum{{{label}}} {stats.duration_seconds:.6f}')
+                lines.append(f'task_manager_request_duration_seconds_count{{{label}}} {stats.count}')
+
+            for name, attribute, help_text in (
+                ('db_queries_total', 'queries', 'Число SQL-запросов.'),
+                ('db_duration_seconds_total', 'db_seconds', 'Время выполнения SQL-запросов.'),
+                ('render_duration_seconds_total', 'render_seconds', 'Время рендеринга ответов.'),
+                ('response_bytes_total', 'response_bytes', 'Размер тел ответов в байтах.'),
+            ):
+                lines += [f'# HELP task_manager_{name} {help_text}', f'# TYPE task_manager_{name} counter']
+                for view, stats in views:
+                    value = getattr(stats, attribute)
+                    value = f'{value:.6f}' if isinstance(value, float) else value
+                    lines.append(f'task_manager_{name}{{view="{_escape(view)}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+_current: ContextVar[RequestMetrics | None] = ContextVar('request_metrics', default=None)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _record_query(execute, sql, params, many, context):
+    """
+    Обертка выполнения SQL, учитывающая запрос в замерах текущего HTTP-запроса.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_seconds += time.perf_counter() - started
+        metrics.queries += 1
+
+
+def _resolve_view(request: HttpRequest) -> tuple:
+    """
+    Возвращает функцию, класс и действие (или метод) представления, обработавшего запрос.
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return None, None, None
+    func = match.func
+    view_class = getattr(func, 'cls', None) or getattr(func, 'view_class', None)
+    if view_class is None:
+        return func, None, None
+    method = request.method.lower()
+    actions = getattr(func, 'actions', None)
+    return func, view_class, actions.get(method, method) if actions else method
+
+
+def get_view_name(request: HttpRequest) -> str:
+    """
+    Возвращает имя представления, обработавшего запрос.
+
+    Args:
+        request (HttpRequest): Запрос.
+
+    Returns:
+        str: `<класс>.<действие>`, `<класс>.<метод>`, имя функции или `unmatched`.
+    """
+    func, view_class, action = _resolve_view(request)
+    if func is None:
+        return UNMATCHED_VIEW
+    if view_class is None:
+        return getattr(func, '__name__', request.resolver_match.view_name)
+    return f'{view_class.__name__}.{action}'
+
+
+def get_query_budget(request: HttpRequest) -> int | None:
+    """
+    Возвращает бюджет SQL-запросов представления, обработавшего запрос.
+
+    Args:
+        request (HttpRequest): Запрос.
+
+    Returns:
+        int | None: Бюджет или None, если он не задан.
+    """
+    func, view_class, action = _resolve_view(request)
+    if view_class is None:
+        return getattr(func, 'query_budget', None)
+    budget = getattr(getattr(view_class, action, None), 'query_budget', None)
+    if budget is None:
+        budget = getattr(view_class, 'query_budget', None)
+    return budget.get(action) if isinstance(budget, dict) else budget
+
+
+class PerformanceMiddleware:
+    """
+    Middleware замеров производительности запросов.
+
+    Должен стоять первым в `MIDDLEWARE`, чтобы учитывать время остальных middleware.
+    Поддерживает синхронные и асинхронные обработчики, чтобы не переводить асинхронные
+    представления в поток.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+            # Асинхронный обработчик вызывает синхронные хуки через поток.
+            self.process_template_response = self._aprocess_template_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started, token = time.perf_counter(), _current.set(RequestMetrics())
+        try:
+            with self._wrap_connections():
+                response = self.get_response(request)
+            return self._finish(request, response, started)
+        finally:
+            _current.reset(token)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        started, token = time.perf_counter(), _current.set(RequestMetrics())
+        try:
+            with self._wrap_connections():
+                response = await self.get_response(request)
+            return self._finish(request, response, started)
+        finally:
+            _current.reset(token)
+
+    def process_template_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        """
+        Замеряет рендеринг ответа (DRF `Response`, `TemplateResponse`).
+        """
+        metrics = _current.get()
+        if metrics is not None:
+            started = time.perf_counter()
+
+            def rendered(response: HttpResponse) -> None:
+                metrics.render_seconds += time.perf_counter() - started
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    async def _aprocess_template_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        return self.process_template_response(request, response)
+
+    def _wrap_connections(self) -> ExitStack:
+        """
+        Подключает учет SQL-запросов ко всем соединениям с базами данных.
+        """
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(_record_query))
+        return stack
+
+    def _finish(self, request: HttpRequest, response: HttpResponse, started: float) -> HttpResponse:
+        """
+        Добавляет заголовок `Server-Timing`, учитывает запрос в реестре и проверяет бюджет запросов.
+
+        Raises:
+            QueryBudgetExceeded: Бюджет превышен и включен `QUERY_BUDGET_RAISE`.
+        """
+        metrics = _current.get()
+        duration = time.perf_counter() - started
+        size = 0 if response.streaming else len(response.content)
+        if settings.SERVER_TIMING_ENABLED:
+            response['Server-Timing'] = (
+                f'db;dur={metrics.db_seconds * 1000:.2f};desc="{metrics.queries} queries", '
+                f'render;dur={metrics.render_seconds * 1000:.2f}, total;dur={duration * 1000:.2f}'
+            )
+        view = get_view_name(request)
+        registry.observe(view, response.status_code, duration, metrics, size)
+
+        budget = get_query_budget(request)
+        if budget is not None and metrics.queries > budget:
+            message = f'{view}: {metrics.queries} SQL-запросов при бюджете {budget} ({request.get_full_path()}).'
+            if settings.QUERY_BUDGET_RAISE:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Отдает метрики процесса в текстовом формате Prometheus.
+
+    Доступ разрешен только с адресов из настройки `METRICS_ALLOWED_IPS` (по умолчанию
+    локальный адрес): метрики раскрывают задержки и объем трафика по эндпоинтам.
+
+    Raises:
+        PermissionDenied: Адрес клиента не входит в `METRICS_ALLOWED_IPS`.
+    """
+    if request.META.get('REMOTE_ADDR') not in settings.METRICS_ALLOWED_IPS:
+        raise PermissionDenied
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
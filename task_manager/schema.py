@@ -0,0 +1,107 @@
+"""
+Модуль документации API (OpenAPI) для проекта task_manager.
+
+Содержит:
+- swagger_ui, redoc_ui: представления `/docs/` и `/redoc/`; спецификация в JSON
+  доступна по `?format=openapi`.
+- get_schema: схема OpenAPI, сгенерированная один раз на процесс.
+- clear_schema_cache: сброс сгенерированной схемы.
+
+Схема строится интроспекцией всех маршрутов API, поэтому генерируется лениво при первом
+обращении к документации и затем переиспользуется. drf_yasg импортируется только при
+первом запросе документации, а не при загрузке настроек и URL-конфигурации.
+Схема генерируется без привязки к запросу: адрес сервера в ней не указывается, и
+интерфейс документации использует адрес страницы.
+"""
+
+import functools
+import threading
+
+_lock = threading.Lock()
+_schemas = {}
+
+
+def _get_info():
+    """
+    Возвращает описание API для схемы.
+    """
+    from drf_yasg import openapi
+
+    return openapi.Info(
+        title="My API",
+        default_version='v1',
+        description="Описание и тестирование вашего API",
+        terms_of_service="https://www.example.com/terms/",
+        contact=openapi.Contact(email="contact@example.com"),
+        license=openapi.License(name="BSD License"),
+    )
+
+
+def get_schema(generator_class, version: str = ''):
+    """
+    Возвращает схему OpenAPI, генерируя ее при первом вызове для версии API.
+
+    Args:
+        generator_class: Класс генератора схемы drf_yasg.
+        version (str): Версия API.
+
+    Returns:
+        openapi.Swagger: Схема API.
+    """
+    schema = _schemas.get(version)
+    if schema is None:
+        with _lock:
+            schema = _schemas.get(version)
+            if schema is None:
+                generator = generator_class(_get_info(), version)
+                schema = _schemas[version] = generator.get_schema(request=None, public=True)
+    return schema
+
+
+def clear_schema_cache() -> None:
+    """
+    Сбрасывает сгенерированные схемы; следующее обращение сгенерирует их заново.
+    """
+    with _lock:
+        _schemas.clear()
+
+
+@functools.cache
+def _get_view(renderer: str):
+    """
+    Создает представление документации с интерфейсом `renderer` (`swagger` или `redoc`).
+    """
+    from drf_yasg.views import get_schema_view
+    from rest_framework import permissions
+    from rest_framework.response import Response
+
+    base = get_schema_view(
+        _get_info(),
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+        authentication_classes=(),
+    )
+
+    class CachedSchemaView(base):
+        """
+        Представление документации, отдающее схему, сгенерированную один раз на процесс.
+        """
+
+        def get(self, request, version='', format=None):
+            return Response(get_schema(self.generator_class, version))
+
+    return CachedSchemaView.with_ui(renderer, cache_timeout=0)
+
+
+def swagger_ui(request, *args, **kwargs):
+    """
+    Интерфейс Swagger UI; `?format=openapi` возвращает спецификацию в JSON.
+    """
+    return _get_view('swagger')(request, *args, **kwargs)
+
+
+def redoc_ui(request, *args, **kwargs):
+    """
+    Интерфейс ReDoc.
+    """
+    return _get_view('redoc')(request, *args, **kwargs)
@@ -12,11 +12,9 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 import os
 from datetime import timedelta
+from importlib.util import find_spec
 
 from dotenv import load_dotenv
-from drf_yasg import openapi
-from drf_yasg.views import get_schema_view
-from rest_framework import permissions
 
 load_dotenv()
 
@@ -33,8 +31,13 @@ DEBUG = True
 ALLOWED_HOSTS = []
 
 
+# Админка — необязательный компонент: ADMIN_ENABLED=False убирает ее из приложений и
+# маршрутов воркеров, обслуживающих только API, и сокращает их холодный старт.
+ADMIN_ENABLED = os.getenv('ADMIN_ENABLED', 'True') == 'True'
+
+
 INSTALLED_APPS = [
-    'django.contrib.admin',
+    *(['django.contrib.admin'] if ADMIN_ENABLED else []),
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
@@ -43,16 +46,24 @@ INSTALLED_APPS = [
     'rest_framework',
     'users',
     'tasks',
-    'drf_yasg',
 ]
 
 
+# drf_yasg не подключается как приложение: импорт пакета тянет pkg_resources (~150 мс
+# на старте воркера). Шаблоны и статика документации подключаются по пути пакета,
+# без его импорта; сам drf_yasg загружается при первом обращении к документации.
+DRF_YASG_DIR = find_spec('drf_yasg').submodule_search_locations[0]
+
+
 AUTH_USER_MODEL = 'users.User'
 
 
 MIDDLEWARE = [
+    'task_manager.metrics.PerformanceMiddleware',
+    'task_manager.load_shedding.LoadSheddingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'task_manager.db_routers.PrimaryPinMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -61,13 +72,27 @@ MIDDLEWARE = [
 ]
 
 
+# Заголовок Server-Timing с временем запросов к базе и рендеринга в каждом ответе.
+SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'True') == 'True'
+# Адреса, с которых доступен `/metrics`, через запятую; по умолчанию только локальный
+# адрес, пусто — доступ закрыт для всех.
+METRICS_ALLOWED_IPS = [ip for ip in os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',') if ip]
+# Превышение бюджета SQL-запросов представления (`query_budget`) вызывает исключение;
+# иначе только пишется предупреждение в журнал. Проверка выполняется после того, как
+# представление уже зафиксировало запись, поэтому исключение включается только в тестах.
+QUERY_BUDGET_RAISE = os.getenv('QUERY_BUDGET_RAISE', 'False') == 'True'
+
+
 ROOT_URLCONF = 'task_manager.urls'
 
 
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [os.path.join(BASE_DIR, 'templates')],  # Путь к корневой папке с шаблонами.
+        'DIRS': [
+            os.path.join(BASE_DIR, 'templates'),  # Путь к корневой папке с шаблонами.
+            os.path.join(DRF_YASG_DIR, 'templates'),
+        ],
         'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
@@ -84,11 +109,145 @@ TEMPLATES = [
 WSGI_APPLICATION = 'task_manager.wsgi.application'
 
 
-DATABASES = {
-    'default': {
+# Профили подключения к SQLite. `default` — настройки Django по умолчанию.
+# `performance` рассчитан на несколько воркеров gunicorn: журнал WAL позволяет читать
+# во время записи, busy_timeout ждет освобождения блокировки вместо ошибки
+# "database is locked", транзакции сразу берут блокировку записи (IMMEDIATE), а
+# соединения переиспользуются между запросами (CONN_MAX_AGE).
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,  # В килобайтах (отрицательное значение), т.е. 64 МБ.
+    'temp_store': 'MEMORY',
+}
+
+
+SQLITE_PROFILES = {
+    'default': {},
+    'performance': {
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': ';'.join(f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items()),
+            'transaction_mode': 'IMMEDIATE',
+        },
+    },
+}
+
+
+# База данных выбирается переменной окружения DB_ENGINE: `sqlite` (по умолчанию) или `postgresql`.
+DB_ENGINE = os.getenv('DB_ENGINE', 'sqlite')
+
+
+if DB_ENGINE == 'postgresql':
+    # Соединения берутся из пула psycopg (требует `psycopg[pool]`); с пулом CONN_MAX_AGE должен быть 0.
+    POSTGRES = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.getenv('POSTGRES_DB', 'task_manager'),
+        'USER': os.getenv('POSTGRES_USER', 'task_manager'),
+        'PASSWORD': os.getenv('POSTGRES_PASSWORD', ''),
+        'HOST': os.getenv('POSTGRES_HOST', 'localhost'),
+        'PORT': os.getenv('POSTGRES_PORT', '5432'),
+        'CONN_MAX_AGE': 0,
+        'OPTIONS': {
+            'pool': {
+                'min_size': int(os.getenv('DB_POOL_MIN_SIZE', 2)),
+                'max_size': int(os.getenv('DB_POOL_MAX_SIZE', 10)),
+                'timeout': int(os.getenv('DB_POOL_TIMEOUT', 10)),
+            },
+        },
+    }
+    DATABASES = {'default': POSTGRES}
+    # Реплики для чтения: хосты через запятую, алиасы `replica`, `replica_2`, ...
+    REPLICA_HOSTS = [host for host in os.getenv('POSTGRES_REPLICA_HOSTS', '').split(',') if host]
+    for number, host in enumerate(REPLICA_HOSTS, start=1):
+        DATABASES['replica' if number == 1 else f'replica_{number}'] = {
+            **POSTGRES,
+            'HOST': host,
+            'TEST': {'MIRROR': 'default'},
+        }
+    DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+else:
+    SQLITE = {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+        **SQLITE_PROFILES[os.getenv('SQLITE_PROFILE', 'default')],
     }
+    # Алиас `replica` указывает на тот же файл и по умолчанию не используется для чтения;
+    # тесты маршрутизации включают его через DATABASE_REPLICAS.
+    DATABASES = {
+        'default': SQLITE,
+        'replica': {**SQLITE},
+    }
+    DATABASE_REPLICAS = []
+
+
+# Чтение из реплик в представлениях API и закрепление чтения за основной базой после
+# записи (см. `task_manager.db_routers`). DATABASE_REPLICA_LAG_SECONDS — время, в течение
+# которого клиент после записи читает из основной базы.
+DATABASE_ROUTERS = ['task_manager.db_routers.PrimaryReplicaRouter']
+DATABASE_PRIMARY_PIN_COOKIE = 'db_primary_pin'
+DATABASE_REPLICA_LAG_SECONDS = int(os.getenv('DATABASE_REPLICA_LAG_SECONDS', 5))
+
+
+# Кэш ответов списка задач. По умолчанию файловый: версия списка хранится в том же кэше,
+# и инвалидация после записи должна быть видна всем воркерам gunicorn. Локальная память
+# (TASK_LIST_CACHE=locmem) подходит только для одного процесса.
+TASK_LIST_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'task-lists',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('TASK_LIST_CACHE_DIR', os.path.join(BASE_DIR, '.cache', 'task-lists')),
+    },
+}
+
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'task_lists': {
+        **TASK_LIST_CACHE_BACKENDS[os.getenv('TASK_LIST_CACHE', 'file')],
+        'TIMEOUT': int(os.getenv('TASK_LIST_CACHE_TTL', 300)),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('TASK_LIST_CACHE_MAX_ENTRIES', 10000)),
+        },
+    },
+}
+
+
+# Инкрементальная синхронизация задач (`/api/tasks/changes/`, см. `tasks.sync`).
+# TASK_SYNC_LAG_SECONDS — окно, изменения из которого отдаются повторно, чтобы не пропустить
+# записи, зафиксированные с опозданием. Отметки об удалении хранятся
+# TASK_TOMBSTONE_RETENTION_DAYS дней; клиент с более старым курсором загружает задачи заново.
+TASK_SYNC_PAGE_SIZE = 500
+TASK_SYNC_MAX_PAGE_SIZE = 1000
+TASK_SYNC_LAG_SECONDS = int(os.getenv('TASK_SYNC_LAG_SECONDS', 2))
+TASK_TOMBSTONE_RETENTION_DAYS = int(os.getenv('TASK_TOMBSTONE_RETENTION_DAYS', 30))
+
+# Размер порции при удалении задач пользователя (см. `tasks.deletion`): каждая порция
+# удаляется в отдельной короткой транзакции.
+TASK_DELETE_CHUNK_SIZE = int(os.getenv('TASK_DELETE_CHUNK_SIZE', 1000))
+
+
+# Фоновые задания в таблице базы данных (см. `tasks.jobs`), выполняемые командой run_workers.
+# Взятое воркером задание скрыто от других воркеров VISIBILITY_TIMEOUT секунд; если воркер
+# не завершил его и не продлил аренду, задание выполняется повторно. Неудачные попытки
+# повторяются до MAX_ATTEMPTS раз с задержкой RETRY_DELAY * 2^(попытка - 1) секунд.
+JOB_QUEUE = {
+    'VISIBILITY_TIMEOUT': int(os.getenv('JOB_VISIBILITY_TIMEOUT', 300)),
+    'MAX_ATTEMPTS': int(os.getenv('JOB_MAX_ATTEMPTS', 3)),
+    'RETRY_DELAY': int(os.getenv('JOB_RETRY_DELAY', 10)),
+    'POLL_INTERVAL': float(os.getenv('JOB_POLL_INTERVAL', 1)),
+}
+# Обработчики заданий по виду задания.
+JOB_HANDLERS = {
+    'delete_user': 'users.jobs.delete_user',
 }
 
 
@@ -108,6 +267,40 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Хеширование паролей (см. `users.hashers`). PASSWORD_HASHER_PROFILE выбирает алгоритм
+# новых хешей: pbkdf2 (по умолчанию), scrypt или argon2 (пакет argon2-cffi).
+# Хеши остальных алгоритмов и хеши с прежними параметрами стоимости проверяются
+# и перехешируются по текущему профилю при следующем успешном входе.
+PASSWORD_HASHER_PROFILES = {
+    'pbkdf2': 'users.hashers.TunedPBKDF2PasswordHasher',
+    'scrypt': 'users.hashers.TunedScryptPasswordHasher',
+    'argon2': 'users.hashers.TunedArgon2PasswordHasher',
+}
+PASSWORD_HASHER_PROFILE = os.getenv('PASSWORD_HASHER_PROFILE', 'pbkdf2')
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_PROFILES[PASSWORD_HASHER_PROFILE],
+    *(path for name, path in PASSWORD_HASHER_PROFILES.items() if name != PASSWORD_HASHER_PROFILE),
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+# Параметры стоимости хешей и необязательный пул процессов для их вычисления (выключен при
+# POOL_SIZE = 0). POOL_SIZE > 0 ограничивает число одновременно вычисляемых хешей; при
+# заполненной очереди (POOL_SIZE + POOL_QUEUE) дольше POOL_TIMEOUT секунд регистрация
+# и вход отвечают 503.
+PASSWORD_HASHING = {
+    'PBKDF2_ITERATIONS': int(os.getenv('PBKDF2_ITERATIONS', 1_000_000)),
+    'SCRYPT_WORK_FACTOR': int(os.getenv('SCRYPT_WORK_FACTOR', 2 ** 14)),
+    'SCRYPT_BLOCK_SIZE': 8,
+    'SCRYPT_PARALLELISM': 1,
+    'ARGON2_TIME_COST': int(os.getenv('ARGON2_TIME_COST', 2)),
+    'ARGON2_MEMORY_COST': int(os.getenv('ARGON2_MEMORY_COST', 19456)),
+    'ARGON2_PARALLELISM': 1,
+    'POOL_SIZE': int(os.getenv('PASSWORD_HASHING_POOL_SIZE', 0)),
+    'POOL_QUEUE': int(os.getenv('PASSWORD_HASHING_POOL_QUEUE', 16)),
+    'POOL_TIMEOUT': float(os.getenv('PASSWORD_HASHING_POOL_TIMEOUT', 5)),
+}
+
+
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True
@@ -115,18 +308,56 @@ USE_TZ = True
 
 
 STATIC_URL = 'static/'
+STATICFILES_DIRS = [os.path.join(DRF_YASG_DIR, 'static')]
+
+
+# Бюджет времени холодного старта воркера до ответа на первый запрос (см. команду profile_startup).
+STARTUP_TIME_BUDGET_MS = int(os.getenv('STARTUP_TIME_BUDGET_MS', 1500))
 
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
 REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': (
+        'users.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'rest_framework.authentication.SessionAuthentication',
+        'users.authentication.StatelessJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_THROTTLE_CLASSES': (
+        'task_manager.throttling.UserRateThrottle',
+        'task_manager.throttling.IPRateThrottle',
+    ),
+    # Частоты корзин токенов (см. `task_manager.throttling`); login и login_account — для /api/token/.
+    'DEFAULT_THROTTLE_RATES': {
+        'user': os.getenv('THROTTLE_USER_RATE', '1200/min'),
+        'ip': os.getenv('THROTTLE_IP_RATE', '3000/min'),
+        'login': os.getenv('THROTTLE_LOGIN_RATE', '20/min'),
+        'login_account': os.getenv('THROTTLE_LOGIN_ACCOUNT_RATE', '10/min'),
+    },
+    # Число доверенных прокси перед приложением; 0 — адрес клиента берется из REMOTE_ADDR,
+    # а X-Forwarded-For, который клиент может подделать, не учитывается.
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', 0)),
+}
+
+# Хранилище корзин ограничения частоты: memory — в памяти каждого воркера,
+# sqlite — общий файл для всех воркеров хоста.
+THROTTLE_STORE = os.getenv('THROTTLE_STORE', 'memory')
+THROTTLE_SQLITE_PATH = os.getenv('THROTTLE_SQLITE_PATH', os.path.join(BASE_DIR, 'throttle.sqlite3'))
+
+# Сброс нагрузки (см. `task_manager.load_shedding`): 503 с Retry-After, если процесс уже
+# обрабатывает MAX_IN_FLIGHT запросов или запрос ждал в очереди прокси дольше MAX_QUEUE_MS.
+LOAD_SHEDDING = {
+    'MAX_IN_FLIGHT': int(os.getenv('LOAD_SHEDDING_MAX_IN_FLIGHT', 64)),
+    'MAX_QUEUE_MS': int(os.getenv('LOAD_SHEDDING_MAX_QUEUE_MS', 2000)),
+    'RETRY_AFTER': int(os.getenv('LOAD_SHEDDING_RETRY_AFTER', 1)),
+    'EXEMPT_PATHS': ['/metrics'],
 }
 
 
@@ -134,6 +365,17 @@ SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
     'AUTH_HEADER_TYPES': ('Bearer',),
+    'TOKEN_OBTAIN_SERIALIZER': 'users.serializers.ClaimsTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'users.serializers.ClaimsTokenRefreshSerializer',
+}
+
+
+# Аутентификация по claims токена без запроса пользователя к базе данных.
+# Состояние пользователя читается из базы не чаще раза за USER_STATE_TTL секунд: за это время
+# деактивация или удаление пользователя доходит до всех воркеров. 0 — только claims токена.
+STATELESS_JWT = {
+    'USER_STATE_TTL': int(os.getenv('JWT_USER_STATE_TTL', 30)),
+    'USER_STATE_CACHE_SIZE': 10000,
 }
 
 
@@ -147,17 +389,3 @@ SWAGGER_SETTINGS = {
         },
     },
 }
-
-
-schema_view = get_schema_view(
-    openapi.Info(
-        title="My API",
-        default_version='v1',
-        description="Описание вашего API",
-        terms_of_service="https://www.example.com/terms/",
-        contact=openapi.Contact(email="contact@example.com"),
-        license=openapi.License(name="BSD License"),
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
@@ -0,0 +1,253 @@
+"""
+Модуль ограничения частоты запросов к API для проекта task_manager.
+
+Содержит:
+- MemoryBucketStore: хранилище корзин токенов в памяти процесса.
+- SQLiteBucketStore: общее для всех воркеров хоста хранилище корзин в файле SQLite
+  (замена Redis для развертывания на одной машине).
+- get_bucket_store: хранилище, выбранное настройкой `THROTTLE_STORE`.
+- TokenBucketThrottle: базовый throttle DRF по алгоритму token bucket.
+- UserRateThrottle, IPRateThrottle: ограничения на пользователя и на адрес клиента.
+- LoginRateThrottle, LoginAccountRateThrottle: ограничения входа (`/api/token/`) на адрес
+  клиента и на учетную запись, защищающие от перебора паролей.
+
+Частота задается в `REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']` в формате DRF (`'100/min'`):
+корзина вмещает 100 токенов и пополняется со скоростью 100 токенов в минуту, поэтому
+кратковременные всплески до размера корзины пропускаются, а средняя частота ограничена.
+Для области без частоты (None) ограничение не применяется. При исчерпании корзины
+DRF отвечает 429 с заголовком `Retry-After` — временем до появления токена.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate: str | None) -> tuple[int, float] | None:
+    """
+    Разбирает частоту в формате DRF.
+
+    Args:
+        rate (str | None): Частота вида `'<число>/<s|sec|m|min|h|hour|d|day>'`.
+
+    Returns:
+        tuple[int, float] | None: Размер корзины и скорость пополнения (токенов в секунду)
+        или None, если частота не задана.
+    """
+    if rate is None:
+        return None
+    count, period = rate.split('/')
+    capacity = int(count)
+    return capacity, capacity / PERIODS[period[0]]
+
+
+def _refill(tokens: float, updated: float, now: float, capacity: int, refill_rate: float) -> float:
+    return min(capacity, tokens + max(0.0, now - updated) * refill_rate)
+
+
+def _take(tokens: float, refill_rate: float) -> tuple[float, float]:
+    # Возвращает остаток токенов и время ожидания (0 — запрос разрешен).
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / refill_rate
+
+
+class MemoryBucketStore:
+    """
+    Потокобезопасное хранилище корзин в памяти процесса с вытеснением по LRU.
+
+    Каждый воркер считает запросы отдельно, поэтому фактический предел на хост равен
+    частоте, умноженной на число воркеров.
+    """
+
+    def __init__(self, max_size: int = 100000) -> None:
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()
+        self._max_size = max_size
+
+    def consume(self, key: str, capacity: int, refill_rate: float, now: float) -> float:
+        """
+        Забирает токен из корзины.
+
+        Args:
+            key (str): Ключ корзины.
+            capacity (int): Размер корзины.
+            refill_rate (float): Скорость пополнения в токенах в секунду.
+            now (float): Текущее время в секундах.
+
+        Returns:
+            float: 0, если токен получен, иначе время до появления токена в секундах.
+        """
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (capacity, now))
+            tokens, wait = _take(_refill(tokens, updated, now, capacity, refill_rate), refill_rate)
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self._max_size:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def clear(self) -> None:
+        """
+        Удаляет все корзины.
+        """
+        with self._lock:
+            self._buckets.clear()
+
+
+class SQLiteBucketStore:
+    """
+    Хранилище корзин в файле SQLite, общее для всех процессов, открывших тот же файл.
+
+    Чтение и обновление корзины выполняются в транзакции `BEGIN IMMEDIATE`, поэтому
+    параллельные воркеры не теряют списания. Соединение открывается отдельно для
+    каждого потока; корзины, не менявшиеся сутки (заведомо полные), периодически удаляются.
+    """
+    prune_every = 1000
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+        self._calls = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS throttle_bucket (key TEXT PRIMARY KEY, tokens REAL, updated REAL)'
+            )
+            self._local.connection = connection
+        return connection
+
+    def consume(self, key: str, capacity: int, refill_rate: float, now: float) -> float:
+        """
+        Забирает токен из корзины (см. `MemoryBucketStore.consume`).
+        """
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            row = connection.execute('SELECT tokens, updated FROM throttle_bucket WHERE key = ?', (key,)).fetchone()
+            tokens, updated = row if row is not None else (capacity, now)
+            tokens, wait = _take(_refill(tokens, updated, now, capacity, refill_rate), refill_rate)
+            connection.execute(
+                'INSERT INTO throttle_bucket (key, tokens, updated) VALUES (?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated',
+                (key, tokens, now),
+            )
+            self._calls += 1
+            if self._calls % self.prune_every == 0:
+                connection.execute('DELETE FROM throttle_bucket WHERE updated < ?', (now - PERIODS['d'],))
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        return wait
+
+    def clear(self) -> None:
+        """
+        Удаляет все корзины.
+        """
+        self._connection().execute('DELETE FROM throttle_bucket')
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_bucket_store() -> MemoryBucketStore | SQLiteBucketStore:
+    """
+    Возвращает хранилище корзин, выбранное настройками `THROTTLE_STORE` и `THROTTLE_SQLITE_PATH`.
+    """
+    key = (settings.THROTTLE_STORE, settings.THROTTLE_SQLITE_PATH)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            if settings.THROTTLE_STORE == 'sqlite':
+                store = SQLiteBucketStore(settings.THROTTLE_SQLITE_PATH)
+            else:
+                store = MemoryBucketStore()
+            _stores[key] = store
+    return store
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Базовый throttle DRF с корзиной токенов на ключ запроса.
+
+    Подклассы задают `scope` (имя частоты в `DEFAULT_THROTTLE_RATES`) и `get_key`.
+    Работает и с `rest_framework.request.Request`, и с `HttpRequest` (асинхронные представления).
+    """
+    scope = None
+
+    def __init__(self) -> None:
+        self.wait_seconds = None
+
+    def get_key(self, request, view) -> str | None:
+        """
+        Возвращает ключ корзины или None, если запрос не ограничивается.
+        """
+        raise NotImplementedError('.get_key() must be overridden')
+
+    def allow_request(self, request, view) -> bool:
+        rate = parse_rate(api_settings.DEFAULT_THROTTLE_RATES.get(self.scope))
+        if rate is None:
+            return True
+        key = self.get_key(request, view)
+        if key is None:
+            return True
+        self.wait_seconds = get_bucket_store().consume(f'{self.scope}:{key}', *rate, time.time())
+        return self.wait_seconds == 0
+
+    def wait(self) -> float | None:
+        return self.wait_seconds or None
+
+
+class UserRateThrottle(TokenBucketThrottle):
+    """
+    Ограничение на аутентифицированного пользователя.
+    """
+    scope = 'user'
+
+    def get_key(self, request, view) -> str | None:
+        user = getattr(request, 'user', None)
+        return str(user.pk) if user is not None and user.is_authenticated else None
+
+
+class IPRateThrottle(TokenBucketThrottle):
+    """
+    Ограничение на адрес клиента (с учетом `NUM_PROXIES` для X-Forwarded-For).
+    """
+    scope = 'ip'
+
+    def get_key(self, request, view) -> str | None:
+        return self.get_ident(request)
+
+
+class LoginRateThrottle(IPRateThrottle):
+    """
+    Ограничение попыток входа с одного адреса.
+    """
+    scope = 'login'
+
+
+class LoginAccountRateThrottle(TokenBucketThrottle):
+    """
+    Ограничение попыток входа в одну учетную запись с любых адресов.
+    """
+    scope = 'login_account'
+
+    def get_key(self, request, view) -> str | None:
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        return email.strip().lower() if isinstance(email, str) and email.strip() else None
+
+
+LOGIN_THROTTLE_CLASSES = (IPRateThrottle, LoginRateThrottle, LoginAccountRateThrottle)
@@ -2,7 +2,8 @@
 Конфигурация приложения Tasks.
 
 Этот модуль определяет конфигурацию приложения Tasks, включая настройки имени
-и автоматического поля первичного ключа по умолчанию.
+и автоматического поля первичного ключа по умолчанию, а также подключает
+обработчики сигналов модели Task.
 """
 
 
@@ -12,3 +13,6 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tasks'
+
+    def ready(self) -> None:
+        from tasks import signals  # noqa: F401
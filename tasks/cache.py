@@ -0,0 +1,125 @@
+"""
+Модуль кэширования списков задач.
+
+Кэш хранит уже сериализованные страницы списка задач отдельно для каждого пользователя.
+Для каждого пользователя хранится версия — момент последнего изменения его задач.
+Версия входит в ключи страниц и в ETag, поэтому после записи достаточно обновить
+версию: старые страницы становятся недостижимыми и вытесняются по LRU/TTL.
+
+Бэкенд задается псевдонимом `task_lists` в настройке `CACHES`.
+"""
+
+import hashlib
+import math
+import time
+
+from django.core.cache import caches
+from django.db import transaction
+
+CACHE_ALIAS = 'task_lists'
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+def _version_key(user_id: int) -> str:
+    return f'tasks:version:{user_id}'
+
+
+def get_list_version(user_id: int) -> float:
+    """
+    Возвращает версию списка задач пользователя (время последнего изменения).
+
+    Если версия отсутствует в кэше (первое обращение или вытеснение), она создается
+    заново; клиенты в этом случае просто получат ответ целиком.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+
+    Returns:
+        float: Временная метка последнего изменения в секундах.
+    """
+    key = _version_key(user_id)
+    version = _cache().get(key)
+    if version is None:
+        version = time.time()
+        if not _cache().add(key, version, timeout=None):
+            # Версию успел создать параллельный запрос.
+            version = _cache().get(key, version)
+    return version
+
+
+def last_modified(version: float) -> int | None:
+    """
+    Возвращает дату изменения списка для заголовка Last-Modified или None.
+
+    HTTP-даты имеют точность в секунду, поэтому версия округляется вверх. Пока эта
+    секунда не закончилась, дата не отдается: запись в ту же секунду получила бы ту же
+    дату, и If-Modified-Since вернул бы 304 с устаревшими данными. Такие ответы
+    проверяются только по ETag.
+
+    Args:
+        version (float): Версия списка задач пользователя.
+
+    Returns:
+        int | None: Время в целых секундах, если все последующие записи получат более позднюю дату.
+    """
+    rounded = math.ceil(version)
+    return rounded if time.time() >= rounded else None
+
+
+def _bump_version(user_id: int) -> None:
+    _cache().set(_version_key(user_id), time.time(), timeout=None)
+
+
+def invalidate_user_tasks(user_id: int, using: str | None = None) -> None:
+    """
+    Инвалидирует кэш списка задач пользователя.
+
+    Версия обновляется сразу и еще раз после фиксации транзакции: иначе параллельный
+    запрос мог бы закэшировать данные до коммита под уже новой версией.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+        using (str | None): Псевдоним базы данных, в транзакции которой изменены задачи.
+    """
+    _bump_version(user_id)
+    transaction.on_commit(lambda: _bump_version(user_id), using=using)
+
+
+def list_cache_key(user_id: int, version: float, signature: str) -> str:
+    """
+    Возвращает ключ кэша страницы списка.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+        version (float): Версия списка задач пользователя.
+        signature (str): Строка, однозначно описывающая запрос (URL, формат ответа).
+
+    Returns:
+        str: Ключ кэша.
+    """
+    digest = hashlib.md5(signature.encode(), usedforsecurity=False).hexdigest()
+    return f'tasks:list:{user_id}:{version!r}:{digest}'
+
+
+def make_etag(cache_key: str) -> str:
+    """
+    Возвращает ETag страницы списка по ключу кэша.
+    """
+    return '"%s"' % hashlib.md5(cache_key.encode(), usedforsecurity=False).hexdigest()
+
+
+def get_cached_list(cache_key: str):
+    """
+    Возвращает сериализованную страницу из кэша или None.
+    """
+    return _cache().get(cache_key)
+
+
+def set_cached_list(cache_key: str, data) -> None:
+    """
+    Сохраняет сериализованную страницу в кэш.
+    """
+    _cache().set(cache_key, data)
@@ -0,0 +1,104 @@
+"""
+Модуль счетчиков задач по статусам.
+
+Таблица `TaskStatusCounter` хранит число задач пользователя в каждом статусе и
+обновляется триггерами базы данных при вставке, изменении статуса или владельца и
+удалении задач (см. миграцию `0004_task_status_counters`). Поэтому сводка по статусам
+читается одним запросом по индексу `(user, status)` независимо от числа задач.
+
+Содержит:
+- get_status_counts: сводка по статусам для пользователя.
+- count_from_tasks: эталонный подсчет по таблице задач (`GROUP BY`).
+- find_mismatches: расхождения счетчиков с эталонным подсчетом.
+- rebuild_counters: пересчет счетчиков по таблице задач.
+"""
+
+from django.db import transaction
+from django.db.models import Count
+
+from tasks.models import Task, TaskStatus, TaskStatusCounter
+
+
+def get_status_counts(user_id: int) -> dict:
+    """
+    Возвращает число задач пользователя в каждом статусе.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+
+    Returns:
+        dict: Число задач по значению статуса; отсутствующие статусы равны 0.
+    """
+    counts = dict.fromkeys((tag.value for tag in TaskStatus), 0)
+    counts.update(TaskStatusCounter.objects.filter(user_id=user_id).values_list('status', 'count'))
+    return counts
+
+
+def _scope(queryset, user_ids: list | None):
+    return queryset if user_ids is None else queryset.filter(user_id__in=user_ids)
+
+
+def count_from_tasks(user_ids: list | None = None) -> dict:
+    """
+    Подсчитывает задачи по таблице задач.
+
+    Args:
+        user_ids (list | None): Ограничить подсчет пользователями; None — все пользователи.
+
+    Returns:
+        dict: Число задач по паре `(user_id, status)`.
+    """
+    rows = _scope(Task.objects.order_by(), user_ids).values_list('user_id', 'status').annotate(total=Count('id'))
+    return {(user_id, task_status): total for user_id, task_status, total in rows}
+
+
+def find_mismatches(user_ids: list | None = None) -> list:
+    """
+    Сравнивает счетчики с эталонным подсчетом по таблице задач.
+
+    Нулевой счетчик равнозначен отсутствующему: строки счетчиков не удаляются, когда
+    у пользователя не остается задач в статусе.
+
+    Args:
+        user_ids (list | None): Ограничить проверку пользователями; None — все пользователи.
+
+    Returns:
+        list: Тройки `(user_id, status, (счетчик, фактически))` для расхождений.
+    """
+    expected = count_from_tasks(user_ids)
+    counters = _scope(TaskStatusCounter.objects.all(), user_ids).values_list('user_id', 'status', 'count')
+    stored = {(user_id, task_status): count for user_id, task_status, count in counters}
+    return [
+        (*key, (stored.get(key, 0), expected.get(key, 0)))
+        for key in sorted(expected.keys() | stored.keys())
+        if stored.get(key, 0) != expected.get(key, 0)
+    ]
+
+
+def rebuild_counters(user_ids: list | None = None) -> int:
+    """
+    Пересчитывает счетчики по таблице задач.
+
+    Счетчики удаляются и создаются заново в одной транзакции; на PostgreSQL таблица задач
+    блокируется от записи на время пересчета, чтобы триггеры не изменили счетчики между
+    подсчетом и вставкой.
+
+    Args:
+        user_ids (list | None): Пересчитать только этих пользователей; None — всех.
+
+    Returns:
+        int: Число созданных строк счетчиков.
+    """
+    with transaction.atomic():
+        if transaction.get_connection().vendor == 'postgresql':
+            with transaction.get_connection().cursor() as cursor:
+                cursor.execute('LOCK TABLE tasks_task IN SHARE MODE')
+        _scope(TaskStatusCounter.objects.all(), user_ids).delete()
+        counters = TaskStatusCounter.objects.bulk_create(
+            [
+                TaskStatusCounter(user_id=user_id, status=task_status, count=total)
+                for (user_id, task_status), total in count_from_tasks(user_ids).items()
+            ],
+            batch_size=300,
+        )
+    return len(counters)
@@ -0,0 +1,152 @@
+"""
+Модуль удаления пользователя вместе с задачами порциями.
+
+Каскадное удаление пользователя сборщиком Django (`Collector`) загружает в память все
+задачи пользователя, чтобы отправить сигналы удаления, и удаляет их в одной транзакции.
+На аккаунтах с сотнями тысяч задач это гигабайты памяти и блокировка записи SQLite на
+все время удаления. Здесь задачи удаляются порциями по `TASK_DELETE_CHUNK_SIZE` в
+отдельных коротких транзакциях, поэтому память и время удержания блокировки ограничены
+размером порции, а другие запросы выполняются между порциями.
+
+Если сборщик не нужен (см. `bulk_delete_supported`), порция удаляется одним `DELETE` по
+идентификаторам без загрузки задач, а отметки об удалении и инвалидация кэша списка
+выполняются для всей порции сразу. Счетчики по статусам и поисковый индекс обновляют
+триггеры базы данных. Иначе порция удаляется через `QuerySet.delete()` со всеми сигналами.
+
+Содержит:
+- bulk_delete_supported: можно ли удалять задачи без сборщика.
+- delete_tasks: удаление задач пользователя по идентификаторам (пакетное удаление API).
+- delete_user_tasks: удаление задач пользователя порциями с отчетом о прогрессе.
+- delete_user: удаление задач порциями, затем самого пользователя.
+
+Удаление не атомарно в целом: прерванное удаление продолжается повторным вызовом.
+"""
+
+from typing import Callable
+
+from django.conf import settings
+from django.db import connections, models, transaction
+from django.db.models.signals import post_delete, pre_delete
+from django.utils import timezone
+
+from tasks.cache import invalidate_user_tasks
+from tasks.counters import get_status_counts
+from tasks.models import Task, TaskTombstone
+from tasks.signals import BULK_DELETE_HANDLED
+from users.models import User
+
+
+def bulk_delete_supported() -> bool:
+    """
+    Проверяет, можно ли удалять задачи без сборщика Django.
+
+    Сборщик не нужен, если на задачи не ссылаются другие модели (кроме `DO_NOTHING`), а
+    получатели сигналов удаления задач — только обработчики из `BULK_DELETE_HANDLED`.
+    """
+    if any(relation.on_delete is not models.DO_NOTHING for relation in Task._meta.related_objects):
+        return False
+    for signal in (pre_delete, post_delete):
+        sync_receivers, async_receivers = signal._live_receivers(Task)
+        if async_receivers or not set(sync_receivers) <= set(BULK_DELETE_HANDLED):
+            return False
+    return True
+
+
+def _record_tombstones(ids: list, using: str) -> None:
+    # Отметки создаются одним INSERT ... SELECT: создание экземпляров модели для bulk_create
+    # занимает большую часть времени удаления порции.
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    tombstone, task = TaskTombstone._meta, Task._meta
+    columns = ', '.join(quote(tombstone.get_field(name).column) for name in ('task_id', 'user_id', 'deleted_at'))
+    task_id, user_id = quote(task.pk.column), quote(task.get_field('user').column)
+    placeholders = ', '.join(['%s'] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {quote(tombstone.db_table)} ({columns}) '
+            f'SELECT {task_id}, {user_id}, %s FROM {quote(task.db_table)} WHERE {task_id} IN ({placeholders})',
+            [connection.ops.adapt_datetimefield_value(timezone.now()), *ids],
+        )
+
+
+def delete_tasks(user_id: int, ids: list, bulk: bool = None) -> int:
+    """
+    Удаляет задачи пользователя по идентификаторам.
+
+    Без сборщика задачи удаляются одним `DELETE`, отметки об удалении создаются одним
+    `INSERT ... SELECT`, а кэш списка владельца инвалидируется один раз; число запросов не
+    зависит от числа задач. Вызывается внутри транзакции.
+
+    Args:
+        user_id (int): Идентификатор владельца задач.
+        ids (list): Идентификаторы задач.
+        bulk (bool, optional): Результат `bulk_delete_supported`, если уже известен.
+
+    Returns:
+        int: Число удаленных задач.
+    """
+    tasks = Task.objects.filter(user_id=user_id, id__in=ids)
+    if not (bulk_delete_supported() if bulk is None else bulk):
+        return tasks.delete()[1].get(Task._meta.label, 0)
+    _record_tombstones(ids, tasks.db)
+    # Тот же путь, что у сборщика Django для объектов без сигналов и связей.
+    deleted = tasks._raw_delete(tasks.db)
+    invalidate_user_tasks(user_id)
+    return deleted
+
+
+def delete_user_tasks(
+    user_id: int, chunk_size: int = None, on_progress: Callable[[int, int], bool | None] = None,
+) -> tuple[int, bool]:
+    """
+    Удаляет задачи пользователя порциями, каждую в отдельной транзакции.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+        chunk_size (int, optional): Размер порции; по умолчанию `TASK_DELETE_CHUNK_SIZE`.
+        on_progress (Callable, optional): Вызывается после каждой порции с числом удаленных
+            задач и числом задач на начало удаления; возврат False прерывает удаление.
+
+    Returns:
+        tuple[int, bool]: Число удаленных задач и признак того, что удалены все задачи.
+    """
+    chunk_size = chunk_size or settings.TASK_DELETE_CHUNK_SIZE
+    total = sum(get_status_counts(user_id).values())
+    bulk = bulk_delete_supported()
+    deleted = 0
+    while True:
+        with transaction.atomic():
+            # Без сортировки порция читается по индексу с ведущим `user` без обхода всех задач.
+            ids = list(Task.objects.filter(user_id=user_id).order_by().values_list('id', flat=True)[:chunk_size])
+            if not ids:
+                return deleted, True
+            delete_tasks(user_id, ids, bulk)
+        deleted += len(ids)
+        if on_progress is not None and on_progress(deleted, total) is False:
+            return deleted, False
+
+
+def delete_user(
+    user_id: int, chunk_size: int = None, on_progress: Callable[[int, int], bool | None] = None,
+) -> dict:
+    """
+    Удаляет задачи пользователя порциями, затем самого пользователя.
+
+    Повторный вызов безопасен: уже удаленные объекты не учитываются.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+        chunk_size (int, optional): Размер порции задач.
+        on_progress (Callable, optional): См. `delete_user_tasks`.
+
+    Returns:
+        dict: Число удаленных объектов (`deleted`), их число по моделям (`per_model`) и
+        признак завершения (`completed`); при прерывании пользователь не удаляется.
+    """
+    tasks_deleted, completed = delete_user_tasks(user_id, chunk_size, on_progress)
+    per_model = {Task._meta.label: tasks_deleted} if tasks_deleted else {}
+    if completed:
+        _, remaining = User.objects.filter(pk=user_id).delete()
+        for label, count in remaining.items():
+            per_model[label] = per_model.get(label, 0) + count
+    return {'deleted': sum(per_model.values()), 'per_model': per_model, 'completed': completed}
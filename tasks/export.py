@@ -0,0 +1,91 @@
+"""
+Модуль потоковой выгрузки задач.
+
+Содержит:
+- EXPORT_FORMATS: поддерживаемые форматы выгрузки и их MIME-типы.
+- EXPORT_WRITERS: функции выгрузки для каждого формата.
+- iter_ndjson: построчная выгрузка в формате NDJSON (один JSON-объект на строку).
+- iter_csv: построчная выгрузка в формате CSV с заголовком.
+
+Функции принимают итератор словарей (например, `QuerySet.values().iterator()`) и
+возвращают генератор фрагментов текста. Строки объединяются в фрагменты по
+`rows_per_chunk`, поэтому объем памяти не зависит от общего числа задач.
+"""
+
+import csv
+import itertools
+import json
+from typing import Iterable, Iterator
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+ROWS_PER_CHUNK = 500
+
+
+class _Echo:
+    """
+    Псевдобуфер для `csv.writer`: возвращает записанную строку вместо ее хранения.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _chunked(lines: Iterable[str], rows_per_chunk: int) -> Iterator[str]:
+    """
+    Объединяет строки в фрагменты по `rows_per_chunk` штук.
+    """
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= rows_per_chunk:
+            yield ''.join(buffer)
+            buffer.clear()
+    if buffer:
+        yield ''.join(buffer)
+
+
+def iter_ndjson(rows: Iterable[dict], fields: list, rows_per_chunk: int = ROWS_PER_CHUNK) -> Iterator[str]:
+    """
+    Возвращает генератор фрагментов выгрузки в формате NDJSON.
+
+    Args:
+        rows (Iterable[dict]): Строки задач.
+        fields (list): Выгружаемые поля в порядке вывода.
+        rows_per_chunk (int): Количество строк в одном фрагменте.
+
+    Returns:
+        Iterator[str]: Фрагменты выгрузки.
+    """
+    lines = (
+        json.dumps({name: row[name] for name in fields}, ensure_ascii=False) + '\n'
+        for row in rows
+    )
+    return _chunked(lines, rows_per_chunk)
+
+
+def iter_csv(rows: Iterable[dict], fields: list, rows_per_chunk: int = ROWS_PER_CHUNK) -> Iterator[str]:
+    """
+    Возвращает генератор фрагментов выгрузки в формате CSV; первая строка — заголовок.
+
+    Args:
+        rows (Iterable[dict]): Строки задач.
+        fields (list): Выгружаемые поля в порядке вывода.
+        rows_per_chunk (int): Количество строк в одном фрагменте.
+
+    Returns:
+        Iterator[str]: Фрагменты выгрузки.
+    """
+    writer = csv.writer(_Echo())
+    header = writer.writerow(fields)
+    lines = (writer.writerow([row[name] for name in fields]) for row in rows)
+    return _chunked(itertools.chain([header], lines), rows_per_chunk)
+
+
+EXPORT_WRITERS = {
+    'ndjson': iter_ndjson,
+    'csv': iter_csv,
+}
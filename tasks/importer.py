@@ -0,0 +1,209 @@
+"""
+Модуль потоковой загрузки задач из NDJSON и CSV.
+
+Содержит:
+- RowError: ошибка проверки отдельной строки.
+- ImportResult: итог загрузки (создано, пропущено, ошибки, скорость).
+- read_rows: потоковое чтение строк файла в формате NDJSON или CSV.
+- import_tasks: проверка и вставка задач порциями.
+
+Каждая строка содержит поля `title`, `description`, `status` и `user` (email владельца).
+Строки читаются и обрабатываются порциями по `chunk_size`: для порции выполняется один
+запрос пользователей по email, затем задачи вставляются через `bulk_create` пачками по
+`batch_size` в отдельной транзакции. Память не зависит от размера файла, а уже
+загруженные порции сохраняются, даже если загрузка прервана.
+"""
+
+import csv
+import itertools
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, TextIO
+
+from django.db import transaction
+from tasks import cache as task_cache
+from tasks.models import Task, TaskStatus
+from users.models import User
+
+IMPORT_FORMATS = ('ndjson', 'csv')
+
+TITLE_MAX_LENGTH = Task._meta.get_field('title').max_length
+STATUSES = {status.value for status in TaskStatus}
+MAX_REPORTED_ERRORS = 1000
+
+
+class RowError(ValueError):
+    """
+    Ошибка проверки строки загрузки.
+    """
+
+
+@dataclass
+class ImportResult:
+    """
+    Итог загрузки задач.
+
+    Attributes:
+        created (int): Число созданных задач.
+        skipped (int): Число пропущенных некорректных строк.
+        errors (list): Первые `MAX_REPORTED_ERRORS` ошибок в виде пар (номер строки, сообщение).
+        duration (float): Длительность загрузки в секундах.
+    """
+    created: int = 0
+    skipped: int = 0
+    errors: list = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """
+        Возвращает скорость загрузки в строках в секунду.
+        """
+        total = self.created + self.skipped
+        return round(total / self.duration, 1) if self.duration else 0.0
+
+    def add_error(self, line_number: int, message: str) -> None:
+        """
+        Учитывает пропущенную строку и сохраняет ее ошибку, пока не достигнут предел.
+        """
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line_number, message))
+
+
+def read_rows(file: TextIO, fmt: str) -> Iterator[tuple[int, dict | RowError]]:
+    """
+    Возвращает генератор строк файла с их номерами.
+
+    Некорректные строки (например, невалидный JSON) возвращаются как экземпляры `RowError`,
+    чтобы загрузка могла пропустить их и продолжить.
+
+    Args:
+        file (TextIO): Открытый текстовый файл.
+        fmt (str): Формат файла: `ndjson` или `csv`.
+
+    Returns:
+        Iterator[tuple[int, dict | RowError]]: Пары (номер строки, данные или ошибка).
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield line_number, RowError('Некорректный JSON.')
+            continue
+        if not isinstance(row, dict):
+            yield line_number, RowError('Ожидается JSON-объект.')
+            continue
+        yield line_number, row
+
+
+def _text(row: dict, name: str) -> str:
+    # В NDJSON значения могут быть любого JSON-типа; отсутствующее поле или null — пустая строка.
+    value = row.get(name)
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        raise RowError(f'Поле {name} должно быть строкой.')
+    return value
+
+
+def validate_row(row: dict | RowError) -> dict:
+    """
+    Проверяет строку и возвращает поля задачи с email владельца в ключе `user`.
+
+    Raises:
+        RowError: Если строка некорректна.
+    """
+    if isinstance(row, RowError):
+        raise row
+    title = _text(row, 'title').strip()
+    if not title:
+        raise RowError('Не указан заголовок.')
+    if len(title) > TITLE_MAX_LENGTH:
+        raise RowError(f'Заголовок длиннее {TITLE_MAX_LENGTH} символов.')
+    status = _text(row, 'status') or TaskStatus.NEW.value
+    if status not in STATUSES:
+        raise RowError(f'Неизвестный статус: {status}.')
+    email = _text(row, 'user').strip()
+    if not email:
+        raise RowError('Не указан email пользователя.')
+    return {
+        'title': title,
+        'description': _text(row, 'description'),
+        'status': status,
+        'user': User.objects.normalize_email(email),
+    }
+
+
+def import_tasks(
+    rows: Iterable[tuple[int, dict | RowError]],
+    chunk_size: int = 10000,
+    batch_size: int = 1000,
+    strict: bool = False,
+    progress: Callable[[ImportResult], None] = None,
+) -> ImportResult:
+    """
+    Загружает задачи порциями.
+
+    Args:
+        rows (Iterable): Пары (номер строки, данные), например из `read_rows`.
+        chunk_size (int): Количество строк в одной транзакции.
+        batch_size (int): Размер пачки для `bulk_create`.
+        strict (bool): Остановить загрузку на первой некорректной строке.
+        progress (Callable, optional): Вызывается с текущим итогом после каждой порции.
+
+    Returns:
+        ImportResult: Итог загрузки.
+
+    Raises:
+        RowError: Если `strict` и встретилась некорректная строка; порции до нее уже сохранены.
+    """
+    result = ImportResult()
+    started = time.perf_counter()
+    rows = iter(rows)
+    while chunk := list(itertools.islice(rows, chunk_size)):
+        valid = []
+        for line_number, row in chunk:
+            try:
+                valid.append((line_number, validate_row(row)))
+            except RowError as exc:
+                if strict:
+                    raise RowError(f'Строка {line_number}: {exc}') from exc
+                result.add_error(line_number, str(exc))
+
+        user_ids = dict(
+            User.objects.filter(email__in={attrs['user'] for _, attrs in valid}).values_list('email', 'id')
+        )
+        tasks = []
+        for line_number, attrs in valid:
+            user_id = user_ids.get(attrs['user'])
+            if user_id is None:
+                message = f'Пользователь {attrs["user"]} не найден.'
+                if strict:
+                    raise RowError(f'Строка {line_number}: {message}')
+                result.add_error(line_number, message)
+                continue
+            tasks.append(Task(title=attrs['title'], description=attrs['description'],
+                              status=attrs['status'], user_id=user_id))
+
+        with transaction.atomic():
+            Task.objects.bulk_create(tasks, batch_size=batch_size)
+            # bulk_create не отправляет сигналы, поэтому кэш списков сбрасывается явно.
+            for user_id in {task.user_id for task in tasks}:
+                task_cache.invalidate_user_tasks(user_id)
+        result.created += len(tasks)
+        result.duration = time.perf_counter() - started
+        if progress is not None:
+            progress(result)
+
+    result.duration = time.perf_counter() - started
+    return result
@@ -0,0 +1,194 @@
+"""
+Модуль очереди фоновых заданий в базе данных.
+
+Медленные операции (например, удаление пользователя с тысячами задач) ставятся в
+очередь запросом API, который сразу отвечает 202, и выполняются воркерами команды
+`run_workers` без отдельного брокера: очередью служит таблица `Job`.
+
+Содержит:
+- enqueue: постановка задания в очередь.
+- claim_job: захват ближайшего доступного задания воркером.
+- run_job: выполнение задания с повтором при ошибке.
+- report_progress: сохранение прогресса и продление аренды выполняющегося задания.
+- run_worker: цикл воркера (процессы воркеров запускаются через `tasks.worker`).
+
+Захват выполняется условным `UPDATE` по статусу и `available_at`, поэтому из
+нескольких воркеров задание получает только один (без `SELECT ... FOR UPDATE`,
+которого нет в SQLite). Захваченное задание скрыто от других воркеров на время аренды
+(`JOB_QUEUE['VISIBILITY_TIMEOUT']`): если воркер завершился, не закончив задание,
+после окончания аренды его возьмет другой воркер. Итог попытки записывается только
+при совпадении `lease_token`, поэтому воркер, потерявший аренду, не перезапишет
+результат нового владельца. Обработчики должны быть идемпотентны.
+
+Обработчик задания — функция `handler(job) -> dict | None`, путь к которой задан в
+`JOB_HANDLERS` по виду задания; возвращенный словарь сохраняется в `Job.result`.
+"""
+
+import logging
+import threading
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from tasks.models import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+CLAIM_BATCH = 10
+ACTIVE_STATUSES = (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+
+
+def enqueue(kind: str, payload: dict = None, user_id: int = None, max_attempts: int = None) -> Job:
+    """
+    Ставит задание в очередь.
+
+    Args:
+        kind (str): Вид задания (ключ `JOB_HANDLERS`).
+        payload (dict, optional): Параметры задания.
+        user_id (int, optional): Идентификатор пользователя, поставившего задание.
+        max_attempts (int, optional): Число попыток; по умолчанию `JOB_QUEUE['MAX_ATTEMPTS']`.
+
+    Returns:
+        Job: Созданное задание.
+
+    Raises:
+        ValueError: Если для вида задания не задан обработчик.
+    """
+    if kind not in settings.JOB_HANDLERS:
+        raise ValueError(f'Неизвестный вид задания: {kind}')
+    return Job.objects.create(
+        kind=kind,
+        payload=payload or {},
+        user_id=user_id,
+        max_attempts=max_attempts or settings.JOB_QUEUE['MAX_ATTEMPTS'],
+    )
+
+
+def _lease_until(now):
+    return now + timedelta(seconds=settings.JOB_QUEUE['VISIBILITY_TIMEOUT'])
+
+
+def _finish(job: Job, **fields) -> bool:
+    # Записывает итог попытки, если аренда задания все еще принадлежит этому воркеру.
+    fields['updated_at'] = timezone.now()
+    return bool(Job.objects.filter(pk=job.pk, lease_token=job.lease_token).update(**fields))
+
+
+def claim_job() -> Job | None:
+    """
+    Захватывает ближайшее доступное задание: новое, ожидающее повтора или с истекшей арендой.
+
+    Задание с истекшей арендой, у которого исчерпаны попытки, помечается неудачным.
+
+    Returns:
+        Job | None: Захваченное задание или None, если доступных заданий нет.
+    """
+    while True:
+        now = timezone.now()
+        candidates = list(
+            Job.objects.filter(status__in=ACTIVE_STATUSES, available_at__lte=now)
+            .order_by('available_at', 'id').values_list('id', flat=True)[:CLAIM_BATCH]
+        )
+        if not candidates:
+            return None
+        for pk in candidates:
+            token = uuid.uuid4().hex
+            claimed = Job.objects.filter(pk=pk, status__in=ACTIVE_STATUSES, available_at__lte=now).update(
+                status=JobStatus.RUNNING.value,
+                attempts=F('attempts') + 1,
+                available_at=_lease_until(now),
+                lease_token=token,
+                updated_at=now,
+            )
+            if not claimed:
+                continue
+            job = Job.objects.get(pk=pk)
+            if job.attempts <= job.max_attempts:
+                return job
+            # Предыдущий воркер не завершил последнюю попытку до окончания аренды.
+            _finish(
+                job, status=JobStatus.FAILED.value, attempts=job.max_attempts, finished_at=now,
+                error=job.error or 'Аренда задания истекла до завершения последней попытки.',
+            )
+
+
+def report_progress(job: Job, **progress) -> bool:
+    """
+    Сохраняет прогресс задания и продлевает его аренду.
+
+    Обработчики долгих заданий вызывают функцию между порциями работы, чтобы задание
+    не считалось брошенным.
+
+    Args:
+        job (Job): Выполняемое задание.
+        **progress: Значения прогресса, например `deleted=1000, total=5000`.
+
+    Returns:
+        bool: False, если аренда потеряна и работу следует прекратить.
+    """
+    job.progress = {**job.progress, **progress}
+    return _finish(job, progress=job.progress, available_at=_lease_until(timezone.now()))
+
+
+def run_job(job: Job) -> str:
+    """
+    Выполняет захваченное задание и записывает результат.
+
+    При ошибке задание возвращается в очередь с экспоненциальной задержкой, пока не
+    исчерпаны попытки. Задание неизвестного вида завершается ошибкой без повтора.
+
+    Args:
+        job (Job): Задание, захваченное `claim_job`.
+
+    Returns:
+        str: Итоговый статус задания после попытки.
+    """
+    path = settings.JOB_HANDLERS.get(job.kind)
+    if path is None:
+        error = f'Неизвестный вид задания: {job.kind}'
+        _finish(job, status=JobStatus.FAILED.value, finished_at=timezone.now(), error=error)
+        return JobStatus.FAILED.value
+    try:
+        result = import_string(path)(job)
+    except Exception as error:
+        logger.exception('Задание %s завершилось ошибкой (попытка %s из %s)', job, job.attempts, job.max_attempts)
+        message = f'{type(error).__name__}: {error}'
+        if job.attempts < job.max_attempts:
+            retry_at = timezone.now() + timedelta(seconds=settings.JOB_QUEUE['RETRY_DELAY'] * 2 ** (job.attempts - 1))
+            _finish(job, status=JobStatus.QUEUED.value, available_at=retry_at, error=message)
+            return JobStatus.QUEUED.value
+        _finish(job, status=JobStatus.FAILED.value, finished_at=timezone.now(), error=message)
+        return JobStatus.FAILED.value
+    _finish(job, status=JobStatus.SUCCEEDED.value, finished_at=timezone.now(), result=result, error='')
+    return JobStatus.SUCCEEDED.value
+
+
+def run_worker(stop: threading.Event, once: bool = False) -> int:
+    """
+    Выполняет задания, пока не установлено событие остановки.
+
+    Args:
+        stop (Event): Событие остановки; текущее задание выполняется до конца.
+        once (bool): Завершиться, когда доступных заданий не останется.
+
+    Returns:
+        int: Число выполненных попыток.
+    """
+    processed = 0
+    while not stop.is_set():
+        close_old_connections()
+        job = claim_job()
+        if job is None:
+            if once:
+                break
+            stop.wait(settings.JOB_QUEUE['POLL_INTERVAL'])
+            continue
+        status = run_job(job)
+        logger.info('Задание %s: %s', job, status)
+        processed += 1
+    return processed
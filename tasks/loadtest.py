@@ -0,0 +1,312 @@
+"""
+Модуль генерации HTTP-нагрузки для нагрузочных замеров API.
+
+Содержит:
+- LoadResult: результат прогона с числом запросов, ошибками и задержками.
+- percentile: перцентиль по списку задержек.
+- run_load: прогон, в котором заданное число одновременных соединений в течение
+  заданного времени повторяет один и тот же запрос.
+- run_scenario: прогон сценария API (вход, список, создание, изменение и удаление задач),
+  в котором виртуальные пользователи выполняют операции в заданной пропорции.
+- parse_mix: разбор пропорции операций сценария.
+
+Каждое соединение обслуживается отдельным потоком с постоянным (keep-alive)
+HTTP-соединением, поэтому модуль не требует внешних зависимостей.
+"""
+
+import base64
+import http.client
+import json
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+SCENARIO_OPERATIONS = ('token', 'list', 'create', 'update', 'delete')
+DEFAULT_MIX = {'list': 60, 'create': 15, 'update': 15, 'delete': 5, 'token': 5}
+
+
+def percentile(values: list, pct: float) -> float:
+    """
+    Возвращает перцентиль `pct` (0-100) по методу ближайшего ранга.
+
+    Args:
+        values (list): Значения.
+        pct (float): Перцентиль.
+
+    Returns:
+        float: Значение перцентиля или 0.0 для пустого списка.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class LoadResult:
+    """
+    Результат нагрузочного прогона.
+
+    Attributes:
+        target (str): Имя цели (например, `wsgi` или `asgi`).
+        connections (int): Число одновременных соединений.
+        duration (float): Фактическая длительность прогона в секундах.
+        completed (int): Число успешных (2xx/3xx) ответов.
+        errors (int): Число ошибок: ответы 4xx/5xx, таймауты и разрывы соединения.
+        latencies (list): Задержки успешных запросов в секундах.
+        error_statuses (dict): Число ошибок по коду ответа (`connection` — сетевые ошибки).
+    """
+    target: str
+    connections: int
+    duration: float = 0.0
+    completed: int = 0
+    errors: int = 0
+    latencies: list = field(default_factory=list)
+    error_statuses: dict = field(default_factory=dict)
+
+    def add_error(self, reason: str) -> None:
+        """
+        Учитывает ошибку с кодом ответа или причиной `reason`.
+        """
+        self.errors += 1
+        self.error_statuses[reason] = self.error_statuses.get(reason, 0) + 1
+
+    def merge(self, other: 'LoadResult') -> None:
+        """
+        Добавляет к результату запросы, ошибки и задержки другого результата.
+        """
+        self.completed += other.completed
+        self.latencies.extend(other.latencies)
+        for reason, count in other.error_statuses.items():
+            self.errors += count
+            self.error_statuses[reason] = self.error_statuses.get(reason, 0) + count
+
+    def summary(self) -> dict:
+        """
+        Возвращает сводку прогона: пропускную способность и перцентили задержки в миллисекундах.
+        """
+        total = self.completed + self.errors
+        return {
+            'target': self.target,
+            'connections': self.connections,
+            'requests': total,
+            'errors': self.errors,
+            'error_rate': round(self.errors / total, 4) if total else 0.0,
+            'rps': round(self.completed / self.duration, 1) if self.duration else 0.0,
+            'p50_ms': round(percentile(self.latencies, 50) * 1000, 2),
+            'p95_ms': round(percentile(self.latencies, 95) * 1000, 2),
+            'p99_ms': round(percentile(self.latencies, 99) * 1000, 2),
+            'error_statuses': dict(sorted(self.error_statuses.items())),
+        }
+
+
+def _connect(url: str, timeout: float) -> http.client.HTTPConnection:
+    parts = urlsplit(url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+    return connection_class(parts.hostname, parts.port, timeout=timeout)
+
+
+def run_load(target: str, url: str, connections: int, duration: float,
+             headers: dict = None, method: str = 'GET', body: bytes = None, timeout: float = 10.0) -> LoadResult:
+    """
+    Выполняет нагрузочный прогон одного запроса.
+
+    Args:
+        target (str): Имя цели для отчета.
+        url (str): Полный URL запроса.
+        connections (int): Число одновременных соединений.
+        duration (float): Длительность прогона в секундах.
+        headers (dict, optional): Заголовки запроса.
+        method (str): HTTP-метод.
+        body (bytes, optional): Тело запроса.
+        timeout (float): Таймаут одного запроса в секундах.
+
+    Returns:
+        LoadResult: Результат прогона.
+    """
+    parts = urlsplit(url)
+    path = parts.path + (f'?{parts.query}' if parts.query else '')
+    result = LoadResult(target=target, connections=connections)
+    lock = threading.Lock()
+    started = time.perf_counter()
+    deadline = started + duration
+
+    def worker() -> None:
+        local = LoadResult(target=target, connections=connections)
+        connection = _connect(url, timeout)
+        while time.perf_counter() < deadline:
+            request_started = time.perf_counter()
+            try:
+                connection.request(method, path, body=body, headers=headers or {})
+                response = connection.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException):
+                local.add_error('connection')
+                connection.close()
+                connection = _connect(url, timeout)
+                continue
+            if response.status >= 400:
+                local.add_error(str(response.status))
+            else:
+                local.completed += 1
+                local.latencies.append(time.perf_counter() - request_started)
+        connection.close()
+        with lock:
+            result.merge(local)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.duration = time.perf_counter() - started
+    return result
+
+
+def parse_mix(value: str) -> dict:
+    """
+    Разбирает пропорцию операций сценария.
+
+    Args:
+        value (str): Веса операций вида `list=60,create=15,update=15,delete=5,token=5`.
+
+    Returns:
+        dict: Вес каждой операции.
+
+    Raises:
+        ValueError: Если операция неизвестна, вес не является неотрицательным числом или
+            все веса равны нулю.
+    """
+    mix = {}
+    for item in filter(None, (part.strip() for part in value.split(','))):
+        operation, _, weight = item.partition('=')
+        if operation not in SCENARIO_OPERATIONS:
+            raise ValueError(f'Неизвестная операция {operation!r}; допустимые: {", ".join(SCENARIO_OPERATIONS)}.')
+        mix[operation] = float(weight)
+        if mix[operation] < 0:
+            raise ValueError(f'Вес операции {operation} не может быть отрицательным.')
+    if not any(mix.values()):
+        raise ValueError('Нужна хотя бы одна операция с положительным весом.')
+    return mix
+
+
+def _token_user_id(token: str) -> int:
+    # Идентификатор пользователя из claims access-токена (подпись проверяет сервер).
+    payload = token.split('.')[1]
+    return json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))['user_id']
+
+
+def run_scenario(base_url: str, credentials: list, connections: int, duration: float, mix: dict,
+                 seed: int = 0, timeout: float = 10.0) -> dict:
+    """
+    Выполняет прогон сценария API виртуальными пользователями.
+
+    Каждое соединение — виртуальный пользователь: он входит с учетными данными
+    `credentials[номер % len(credentials)]` (операция `token`), затем до конца прогона
+    выбирает операции с весами `mix`: `list` — первая страница задач, `create` — новая
+    задача, `update` и `delete` — изменение и удаление задачи, созданной этим пользователем
+    (пока таких нет, выполняется `create`), `token` — повторный вход. Выбор операций
+    определяется `seed` и номером пользователя, поэтому последовательность воспроизводима.
+
+    Args:
+        base_url (str): Адрес сервера, например `http://127.0.0.1:8000`.
+        credentials (list): Пары (email, пароль).
+        connections (int): Число виртуальных пользователей (одновременных соединений).
+        duration (float): Длительность прогона в секундах.
+        mix (dict): Веса операций (см. `parse_mix`).
+        seed (int): Зерно выбора операций.
+        timeout (float): Таймаут одного запроса в секундах.
+
+    Returns:
+        dict: Результат `LoadResult` по каждой операции сценария.
+    """
+    prefix = urlsplit(base_url).path.rstrip('/')
+    operations = [operation for operation in SCENARIO_OPERATIONS if mix.get(operation)]
+    weights = [mix[operation] for operation in operations]
+    results = {operation: LoadResult(target=operation, connections=connections) for operation in SCENARIO_OPERATIONS}
+    lock = threading.Lock()
+    started = time.perf_counter()
+    deadline = started + duration
+
+    def virtual_user(number: int) -> None:
+        rng = random.Random(seed * 100003 + number)
+        email, password = credentials[number % len(credentials)]
+        local = {operation: LoadResult(target=operation, connections=connections) for operation in SCENARIO_OPERATIONS}
+        connection = _connect(base_url, timeout)
+        state = {'token': None, 'user_id': None}
+        own_tasks = []
+
+        def call(operation: str, method: str, path: str, payload: dict = None) -> dict | None:
+            nonlocal connection
+            headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+            if state['token'] and operation != 'token':
+                headers['Authorization'] = f'Bearer {state["token"]}'
+            body = json.dumps(payload).encode() if payload is not None else None
+            request_started = time.perf_counter()
+            try:
+                connection.request(method, prefix + path, body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (OSError, http.client.HTTPException):
+                local[operation].add_error('connection')
+                connection.close()
+                connection = _connect(base_url, timeout)
+                return None
+            if response.status >= 400:
+                local[operation].add_error(str(response.status))
+                return None
+            local[operation].completed += 1
+            local[operation].latencies.append(time.perf_counter() - request_started)
+            return json.loads(data) if data else {}
+
+        def login() -> bool:
+            data = call('token', 'POST', '/api/token/', {'email': email, 'password': password})
+            if data is None:
+                return False
+            state['token'], state['user_id'] = data['access'], _token_user_id(data['access'])
+            return True
+
+        def task_payload(status: str) -> dict:
+            return {
+                'title': f'Нагрузка {number}-{rng.randrange(10 ** 6)}',
+                'description': 'Задача, созданная сценарием нагрузки',
+                'status': status,
+                'user': state['user_id'],
+            }
+
+        if login():
+            while time.perf_counter() < deadline:
+                operation = rng.choices(operations, weights)[0]
+                if operation in ('update', 'delete') and not own_tasks:
+                    operation = 'create'
+                if operation == 'token':
+                    login()
+                elif operation == 'list':
+                    call('list', 'GET', '/api/tasks/?page_size=50')
+                elif operation == 'create':
+                    data = call('create', 'POST', '/api/tasks/', task_payload('новая'))
+                    if data is not None:
+                        own_tasks.append(data['id'])
+                elif operation == 'update':
+                    payload = task_payload(rng.choice(['в процессе', 'завершена']))
+                    call('update', 'PUT', f'/api/tasks/{rng.choice(own_tasks)}/', payload)
+                else:
+                    call('delete', 'DELETE', f'/api/tasks/{own_tasks.pop(rng.randrange(len(own_tasks)))}/')
+        connection.close()
+        with lock:
+            for operation, result in local.items():
+                results[operation].merge(result)
+
+    threads = [threading.Thread(target=virtual_user, args=(number,), daemon=True) for number in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    for result in results.values():
+        result.duration = elapsed
+    return results
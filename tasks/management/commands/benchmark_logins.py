@@ -0,0 +1,111 @@
+"""
+Команда замера пропускной способности входа для профилей хеширования паролей.
+
+Пример:
+
+    python manage.py benchmark_logins
+    python manage.py benchmark_logins --profiles pbkdf2 scrypt --logins 50 --threads 4 --pool-size 4
+
+Для каждого профиля создаются временные пользователи (удаляются по завершении), после
+чего `--threads` потоков выполняют `--logins` входов через `django.contrib.auth.authenticate` —
+ту же проверку пароля, что и `/api/token/`.
+Отчет содержит время хеширования пароля при регистрации, число входов в секунду
+и число входов в секунду на ядро (входы в секунду, деленные на число занятых ядер:
+`min(threads, pool-size or threads, cpu_count)`).
+
+Профиль argon2 пропускается, если пакет argon2-cffi не установлен.
+"""
+
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from users.hashers import hashing_pool
+from users.models import User
+
+PASSWORD = 'benchmark-password-123'
+
+
+class Command(BaseCommand):
+    help = 'Замеряет число входов в секунду (на ядро) для профилей хеширования паролей.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--profiles', nargs='+', default=list(settings.PASSWORD_HASHER_PROFILES),
+                            choices=list(settings.PASSWORD_HASHER_PROFILES), help='Профили хеширования.')
+        parser.add_argument('--logins', type=int, default=20, help='Число входов на профиль.')
+        parser.add_argument('--threads', type=int, default=1, help='Число одновременных входов.')
+        parser.add_argument('--pool-size', type=int, default=0,
+                            help='Размер пула процессов хеширования (0 — хешировать в потоке запроса).')
+        parser.add_argument('--json', dest='json_path', help='Путь для сохранения отчета в JSON.')
+
+    def handle(self, *args, **options) -> None:
+        if options['logins'] < 1 or options['threads'] < 1 or options['pool_size'] < 0:
+            raise CommandError('Число входов и потоков должно быть положительным, размер пула — неотрицательным.')
+        cores = min(options['threads'], options['pool_size'] or options['threads'], os.cpu_count() or 1)
+
+        report = []
+        self.stdout.write(f'{"profile":<8} {"hash ms":>8} {"logins/s":>9} {"per core":>9}')
+        for profile in options['profiles']:
+            if profile == 'argon2' and find_spec('argon2') is None:
+                self.stdout.write(f'{profile:<8} пропущен: не установлен пакет argon2-cffi')
+                continue
+            hashers = [
+                settings.PASSWORD_HASHER_PROFILES[profile],
+                *(path for name, path in settings.PASSWORD_HASHER_PROFILES.items() if name != profile),
+            ]
+            hashing = {**settings.PASSWORD_HASHING, 'POOL_SIZE': options['pool_size']}
+            try:
+                with override_settings(PASSWORD_HASHERS=hashers, PASSWORD_HASHING=hashing):
+                    result = self._measure(profile, options['logins'], options['threads'], cores)
+            finally:
+                # Входы выполняются в других потоках, поэтому данные нельзя держать в откатываемой транзакции.
+                User.objects.filter(email__startswith='benchmark-login-').delete()
+                hashing_pool.shutdown()
+            report.append(result)
+            self.stdout.write(
+                f'{profile:<8} {result["hash_ms"]:>8} {result["logins_per_second"]:>9} '
+                f'{result["logins_per_second_per_core"]:>9}'
+            )
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+
+    def _measure(self, profile: str, logins: int, threads: int, cores: int) -> dict:
+        """
+        Создает пользователя и замеряет хеширование и входы для текущего профиля.
+        """
+        hash_durations = []
+        for number in range(3):
+            started = time.perf_counter()
+            user = User.objects.create_user(
+                email=f'benchmark-login-{number}@example.com', name='Benchmark', password=PASSWORD,
+            )
+            hash_durations.append(time.perf_counter() - started)
+
+        def login(_number: int) -> None:
+            if authenticate(email=user.email, password=PASSWORD) is None:
+                raise CommandError(f'Вход с профилем {profile} не удался.')
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            started = time.perf_counter()
+            list(executor.map(login, range(logins)))
+            elapsed = time.perf_counter() - started
+
+        rate = logins / elapsed
+        return {
+            'profile': profile,
+            'hash_ms': round(statistics.median(hash_durations) * 1000, 1),
+            'logins': logins,
+            'threads': threads,
+            'logins_per_second': round(rate, 1),
+            'logins_per_second_per_core': round(rate / cores, 1),
+        }
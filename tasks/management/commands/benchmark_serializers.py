@@ -0,0 +1,109 @@
+"""
+Команда сравнения обычной и быстрой сериализации списков задач и пользователей.
+
+Пример:
+
+    python manage.py benchmark_serializers --rows 1000 10000 100000
+
+Для каждого числа строк во временной транзакции (откатывается по завершении) создаются
+задачи и пользователи, после чего замеряется построение JSON-ответа двумя способами:
+- обычный: экземпляры модели, `ModelSerializer(many=True)` и `JSONRenderer` DRF;
+- быстрый: строки `QuerySet.values()` и `FastJSONRenderer`.
+
+Перед замерами проверяется, что оба способа дают побайтно одинаковый результат.
+"""
+
+import json
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from tasks.models import Task
+from users.models import User
+from users.renderers import FastJSONRenderer
+from users.serializers import TaskSerializer, UserSerializer, get_values_fields
+
+
+class Rollback(Exception):
+    """
+    Исключение для отката транзакции с тестовыми данными.
+    """
+
+
+class Command(BaseCommand):
+    help = 'Сравнивает обычную и быструю (values + orjson) сериализацию списков.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000], help='Числа строк.')
+        parser.add_argument('--repeat', type=int, default=5, help='Число замеров (берется медиана).')
+        parser.add_argument('--json', dest='json_path', help='Путь для сохранения отчета в JSON.')
+
+    def handle(self, *args, **options) -> None:
+        report = []
+        self.stdout.write(f'{"model":<6} {"rows":>7} {"serializer ms":>14} {"fast ms":>9} {"speedup":>8}')
+        for rows in options['rows']:
+            try:
+                with transaction.atomic():
+                    report.extend(self._measure(rows, options['repeat']))
+                    raise Rollback
+            except Rollback:
+                pass
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+
+    def _measure(self, rows: int, repeat: int) -> list:
+        """
+        Создает данные и замеряет оба способа сериализации для задач и пользователей.
+        """
+        owner = User.objects.create_user(email='benchmark-owner@example.com', name='Benchmark')
+        Task.objects.bulk_create(
+            (Task(user=owner, title=f'Задача {i}', description='Описание', status='новая') for i in range(rows)),
+            batch_size=200,
+        )
+        User.objects.bulk_create(
+            (User(email=f'benchmark-{i}@example.com', name=f'Пользователь {i}') for i in range(rows)),
+            batch_size=300,
+        )
+
+        results = []
+        for label, serializer_class, queryset in (
+            ('task', TaskSerializer, Task.objects.filter(user=owner).order_by('id')),
+            ('user', UserSerializer, User.objects.exclude(pk=owner.pk).order_by('id')),
+        ):
+            fields = get_values_fields(serializer_class())
+
+            def serializer_path() -> bytes:
+                return JSONRenderer().render(serializer_class(queryset, many=True).data)
+
+            def fast_path() -> bytes:
+                return FastJSONRenderer().render(list(queryset.values(*fields)))
+
+            if serializer_path() != fast_path():
+                raise CommandError(f'Результаты сериализации {label} различаются.')
+            slow = self._median(serializer_path, repeat)
+            fast = self._median(fast_path, repeat)
+            result = {
+                'model': label,
+                'rows': rows,
+                'serializer_ms': round(slow * 1000, 1),
+                'fast_ms': round(fast * 1000, 1),
+                'speedup': round(slow / fast, 1),
+            }
+            results.append(result)
+            self.stdout.write(
+                f'{label:<6} {rows:>7} {result["serializer_ms"]:>14} {result["fast_ms"]:>9} {result["speedup"]:>7}x'
+            )
+        return results
+
+    def _median(self, func, repeat: int) -> float:
+        durations = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            durations.append(time.perf_counter() - started)
+        return statistics.median(durations)
@@ -0,0 +1,141 @@
+"""
+Команда сравнения профилей подключения к SQLite под конкурентной нагрузкой чтения и записи.
+
+Пример:
+
+    python manage.py benchmark_sqlite --threads 8 --duration 10 --write-ratio 0.2
+
+Для каждого профиля из `settings.SQLITE_PROFILES` создается временная база данных, к которой
+применяются миграции проекта (со счетчиками статусов и полнотекстовым индексом на триггерах,
+как в рабочей базе). Затем `--threads` потоков в течение `--duration` секунд
+выполняют «запросы»: с вероятностью `--write-ratio` — создание задачи в транзакции,
+иначе — чтение страницы задач пользователя. Как и в обработчике HTTP-запроса, после
+каждого запроса соединение закрывается, если профиль не разрешает его переиспользовать.
+
+Выводятся пропускная способность, перцентили задержки и число ошибок (в том числе
+"database is locked").
+"""
+
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections, transaction
+
+from tasks.loadtest import LoadResult
+from tasks.models import Task
+from users.models import User
+
+USERS = 20
+
+
+class Command(BaseCommand):
+    help = 'Сравнивает профили SQLite (SQLITE_PROFILES) под конкурентным чтением и записью.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--profiles', nargs='+', help='Профили для сравнения; по умолчанию все.')
+        parser.add_argument('--threads', type=int, default=8, help='Число одновременных потоков.')
+        parser.add_argument('--duration', type=float, default=10.0, help='Длительность прогона, с.')
+        parser.add_argument('--write-ratio', type=float, default=0.2, help='Доля запросов на запись.')
+        parser.add_argument('--seed-tasks', type=int, default=20000, help='Число задач в базе перед прогоном.')
+        parser.add_argument('--json', dest='json_path', help='Путь для сохранения отчета в JSON.')
+
+    def handle(self, *args, **options) -> None:
+        profiles = options['profiles'] or list(settings.SQLITE_PROFILES)
+        directory = tempfile.mkdtemp(prefix='sqlite-bench-')
+        report = []
+        try:
+            self.stdout.write(f'{"profile":<12} {"rps":>9} {"p50 ms":>9} {"p99 ms":>9} {"errors":>8}')
+            for profile in profiles:
+                alias = f'benchmark_{profile}'
+                connections.settings[alias] = connections.configure_settings({
+                    DEFAULT_DB_ALIAS: settings.DATABASES[DEFAULT_DB_ALIAS],
+                    alias: {
+                        'ENGINE': 'django.db.backends.sqlite3',
+                        'NAME': os.path.join(directory, f'{profile}.sqlite3'),
+                        **settings.SQLITE_PROFILES[profile],
+                    },
+                })[alias]
+                try:
+                    self._prepare(alias, options['seed_tasks'])
+                    summary = self._run(alias, profile, options).summary()
+                finally:
+                    connections[alias].close()
+                    del connections.settings[alias]
+                report.append(summary)
+                self.stdout.write(
+                    f'{profile:<12} {summary["rps"]:>9} {summary["p50_ms"]:>9} '
+                    f'{summary["p99_ms"]:>9} {summary["errors"]:>8}'
+                )
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+
+    def _prepare(self, alias: str, seed_tasks: int) -> None:
+        """
+        Применяет миграции к базе данных профиля и заполняет ее начальными данными.
+        """
+        call_command('migrate', database=alias, interactive=False, verbosity=0)
+        users = User.objects.using(alias).bulk_create(
+            User(email=f'bench{i}@example.com', name=f'Bench {i}') for i in range(USERS)
+        )
+        Task.objects.using(alias).bulk_create(
+            (Task(user=users[i % USERS], title=f'Task {i}', description='Description') for i in range(seed_tasks)),
+            batch_size=200,
+        )
+
+    def _run(self, alias: str, profile: str, options: dict) -> LoadResult:
+        """
+        Выполняет прогон смешанной нагрузки в нескольких потоках.
+        """
+        result = LoadResult(target=profile, connections=options['threads'])
+        lock = threading.Lock()
+        deadline = time.perf_counter() + options['duration']
+
+        def request(rng: random.Random) -> None:
+            user_id = rng.randint(1, USERS)
+            if rng.random() < options['write_ratio']:
+                with transaction.atomic(using=alias):
+                    Task.objects.using(alias).create(user_id=user_id, title='New', description='Description')
+            else:
+                list(Task.objects.using(alias).filter(user_id=user_id).order_by('-id')[:50])
+
+        def worker(seed: int) -> None:
+            rng = random.Random(seed)
+            completed, errors, latencies = 0, 0, []
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    request(rng)
+                except DatabaseError:
+                    errors += 1
+                else:
+                    completed += 1
+                    latencies.append(time.perf_counter() - started)
+                finally:
+                    # То же, что делает Django по сигналу request_finished.
+                    connections[alias].close_if_unusable_or_obsolete()
+            connections[alias].close()
+            with lock:
+                result.completed += completed
+                result.errors += errors
+                result.latencies.extend(latencies)
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(options['threads'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        result.duration = time.perf_counter() - started
+        return result
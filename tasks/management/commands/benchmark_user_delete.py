@@ -0,0 +1,129 @@
+"""
+Команда замера удаления пользователя с большим числом задач.
+
+Пример:
+
+    python manage.py benchmark_user_delete --tasks 1000000 --memory-budget-mb 64
+    python manage.py benchmark_user_delete --tasks 100000 --collector
+
+Создается временный пользователь с `--tasks` задачами (вставка порциями без сигналов;
+триггеры счетчиков и поискового индекса срабатывают), затем он удаляется порциями
+(`tasks.deletion.delete_user`). С `--collector` то же повторяется для каскадного удаления
+сборщиком Django (`User.delete()`) для сравнения.
+
+Отчет содержит время удаления, число задач в секунду, пик памяти Python (tracemalloc) и
+самую долгую транзакцию — время, на которое удаление блокирует запись в SQLite.
+Если пик памяти удаления порциями превышает `--memory-budget-mb`, команда завершается
+ошибкой. Временные пользователи и отметки об удалении их задач удаляются по завершении.
+"""
+
+import json
+import time
+import tracemalloc
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from tasks import deletion
+from tasks.models import Task, TaskStatus, TaskTombstone
+from users.models import User
+
+INSERT_BATCH = 10000
+STATUSES = [status.value for status in TaskStatus]
+
+
+class Command(BaseCommand):
+    help = 'Замеряет время, память и длительность транзакций при удалении пользователя с задачами.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--tasks', type=int, default=1000000, help='Число задач пользователя.')
+        parser.add_argument('--chunk-size', type=int, default=settings.TASK_DELETE_CHUNK_SIZE,
+                            help='Размер порции удаления.')
+        parser.add_argument('--memory-budget-mb', type=float, default=64.0,
+                            help='Допустимый пик памяти удаления порциями, МБ.')
+        parser.add_argument('--collector', action='store_true',
+                            help='Также замерить каскадное удаление сборщиком Django.')
+        parser.add_argument('--json', dest='json_path', help='Путь для сохранения отчета в JSON.')
+
+    def handle(self, *args, **options) -> None:
+        if options['tasks'] < 1 or options['chunk_size'] < 1:
+            raise CommandError('Число задач и размер порции должны быть положительными.')
+        methods = ['chunked', 'collector'] if options['collector'] else ['chunked']
+
+        report = []
+        self.stdout.write(f'{"method":<10} {"tasks":>9} {"seconds":>8} {"tasks/s":>9} {"peak MB":>8} {"max tx ms":>10}')
+        for method in methods:
+            user = self._create_user(method, options['tasks'])
+            try:
+                result = self._measure(method, user.pk, options['tasks'], options['chunk_size'])
+            finally:
+                # Удаление могло прерваться ошибкой; остаток удаляется порциями.
+                if User.objects.filter(pk=user.pk).exists():
+                    deletion.delete_user(user.pk)
+                TaskTombstone.objects.filter(user_id=user.pk).delete()
+            report.append(result)
+            self.stdout.write(
+                f'{method:<10} {result["tasks"]:>9} {result["seconds"]:>8} {result["tasks_per_second"]:>9} '
+                f'{result["peak_memory_mb"]:>8} {result["max_transaction_ms"]:>10}'
+            )
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+
+        chunked = report[0]
+        if chunked['peak_memory_mb'] > options['memory_budget_mb']:
+            raise CommandError(
+                f'Пик памяти удаления порциями {chunked["peak_memory_mb"]} МБ превышает бюджет '
+                f'{options["memory_budget_mb"]} МБ.'
+            )
+
+    def _create_user(self, method: str, tasks: int) -> User:
+        """
+        Создает временного пользователя с заданным числом задач.
+        """
+        user = User.objects.create_user(email=f'benchmark-delete-{method}@example.com', name='Benchmark')
+        for start in range(0, tasks, INSERT_BATCH):
+            with transaction.atomic():
+                Task.objects.bulk_create(
+                    Task(user=user, title=f'Задача {number}', description='Описание задачи для замера удаления',
+                         status=STATUSES[number % len(STATUSES)])
+                    for number in range(start, min(tasks, start + INSERT_BATCH))
+                )
+        return user
+
+    def _measure(self, method: str, user_id: int, tasks: int, chunk_size: int) -> dict:
+        """
+        Удаляет пользователя выбранным способом и замеряет время, память и самую долгую транзакцию.
+        """
+        longest = 0.0
+        last = time.perf_counter()
+
+        def on_progress(deleted: int, total: int) -> None:
+            nonlocal longest, last
+            now = time.perf_counter()
+            longest, last = max(longest, now - last), now
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            if method == 'chunked':
+                deletion.delete_user(user_id, chunk_size, on_progress)
+            else:
+                User.objects.get(pk=user_id).delete()
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            'method': method,
+            'tasks': tasks,
+            'chunk_size': chunk_size if method == 'chunked' else None,
+            'seconds': round(elapsed, 2),
+            'tasks_per_second': round(tasks / elapsed),
+            'peak_memory_mb': round(peak / 2 ** 20, 3),
+            # Сборщик удаляет все задачи в одной транзакции.
+            'max_transaction_ms': round((longest if method == 'chunked' else elapsed) * 1000, 1),
+        }
@@ -0,0 +1,67 @@
+"""
+Команда сравнения емкости по одновременным соединениям для WSGI и ASGI развертываний.
+
+Пример (оба сервера запущены заранее, например через docker-compose: `web` и `web-asgi`):
+
+    python manage.py compare_concurrency \\
+        --wsgi-url http://localhost:8000/api/tasks/ \\
+        --asgi-url http://localhost:8001/api/async/tasks/ \\
+        --token <access-токен> --connections 10 50 100 200
+
+Для каждого числа соединений выводятся пропускная способность, перцентили задержки
+и доля ошибок. Емкость цели — наибольшее число соединений, при котором p99 укладывается
+в `--slo-ms`, а доля ошибок не превышает 1%.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from tasks.loadtest import run_load
+
+MAX_ERROR_RATE = 0.01
+
+
+class Command(BaseCommand):
+    help = 'Сравнивает емкость WSGI и ASGI развертываний по числу одновременных соединений.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--wsgi-url', required=True, help='URL списка задач на WSGI-сервере.')
+        parser.add_argument('--asgi-url', required=True, help='URL асинхронного списка задач на ASGI-сервере.')
+        parser.add_argument('--token', help='JWT access-токен для заголовка Authorization.')
+        parser.add_argument('--connections', type=int, nargs='+', default=[10, 50, 100, 200],
+                            help='Числа одновременных соединений.')
+        parser.add_argument('--duration', type=float, default=10.0, help='Длительность каждого прогона, с.')
+        parser.add_argument('--timeout', type=float, default=10.0, help='Таймаут одного запроса, с.')
+        parser.add_argument('--slo-ms', type=float, default=500.0, help='Допустимый p99, мс.')
+        parser.add_argument('--json', dest='json_path', help='Путь для сохранения отчета в JSON.')
+
+    def handle(self, *args, **options) -> None:
+        headers = {'Authorization': f'Bearer {options["token"]}'} if options['token'] else {}
+        targets = {'wsgi': options['wsgi_url'], 'asgi': options['asgi_url']}
+        report = {'runs': [], 'capacity': {}}
+
+        self.stdout.write(f'{"target":<6} {"conn":>5} {"rps":>9} {"p50 ms":>9} {"p99 ms":>9} {"errors":>8}')
+        for connections in options['connections']:
+            for target, url in targets.items():
+                summary = run_load(
+                    target, url, connections, options['duration'], headers=headers, timeout=options['timeout']
+                ).summary()
+                report['runs'].append(summary)
+                self.stdout.write(
+                    f'{target:<6} {connections:>5} {summary["rps"]:>9} {summary["p50_ms"]:>9} '
+                    f'{summary["p99_ms"]:>9} {summary["error_rate"]:>8.2%}'
+                )
+
+        for target in targets:
+            passing = [
+                run['connections'] for run in report['runs']
+                if run['target'] == target and run['p99_ms'] <= options['slo_ms']
+                and run['error_rate'] <= MAX_ERROR_RATE
+            ]
+            report['capacity'][target] = max(passing, default=0)
+            self.stdout.write(f'Емкость {target}: {report["capacity"][target]} соединений')
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
@@ -0,0 +1,73 @@
+"""
+Команда потоковой загрузки задач из файла NDJSON или CSV.
+
+Пример:
+
+    python manage.py import_tasks tasks.ndjson
+    python manage.py import_tasks tasks.csv --chunk-size 20000
+    cat tasks.ndjson | python manage.py import_tasks - --format ndjson
+
+Каждая строка содержит `title`, `description`, `status` (по умолчанию `новая`) и
+`user` — email владельца. Некорректные строки пропускаются и перечисляются в отчете;
+с `--strict` загрузка останавливается на первой из них (уже загруженные порции сохраняются).
+"""
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.importer import IMPORT_FORMATS, RowError, import_tasks, read_rows
+
+REPORTED_ERRORS = 20
+
+
+class Command(BaseCommand):
+    help = 'Загружает задачи из файла NDJSON или CSV порциями через bulk_create.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('path', help='Путь к файлу или `-` для чтения из stdin.')
+        parser.add_argument('--format', choices=IMPORT_FORMATS,
+                            help='Формат файла; по умолчанию определяется по расширению.')
+        parser.add_argument('--chunk-size', type=int, default=10000, help='Строк в одной транзакции.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Размер пачки bulk_create.')
+        parser.add_argument('--strict', action='store_true', help='Остановиться на первой некорректной строке.')
+
+    def handle(self, *args, **options) -> None:
+        path = options['path']
+        fmt = options['format'] or ('csv' if path.lower().endswith('.csv') else 'ndjson')
+        if options['chunk_size'] < 1 or options['batch_size'] < 1:
+            raise CommandError('Размеры порции и пачки должны быть положительными.')
+
+        def progress(result) -> None:
+            self.stdout.write(f'Загружено {result.created}, пропущено {result.skipped} '
+                              f'({result.rows_per_second} строк/с)')
+
+        file = sys.stdin if path == '-' else self._open(path)
+        try:
+            result = import_tasks(
+                read_rows(file, fmt),
+                chunk_size=options['chunk_size'],
+                batch_size=options['batch_size'],
+                strict=options['strict'],
+                progress=progress,
+            )
+        except RowError as exc:
+            raise CommandError(str(exc))
+        finally:
+            if file is not sys.stdin:
+                file.close()
+
+        for line_number, message in result.errors[:REPORTED_ERRORS]:
+            self.stderr.write(f'Строка {line_number}: {message}')
+        if result.skipped > REPORTED_ERRORS:
+            self.stderr.write(f'... и еще {result.skipped - REPORTED_ERRORS} ошибок')
+        self.stdout.write(self.style.SUCCESS(
+            f'Создано задач: {result.created}, пропущено строк: {result.skipped}, '
+            f'{result.duration:.1f} с ({result.rows_per_second} строк/с)'
+        ))
+
+    def _open(self, path: str):
+        try:
+            return open(path, encoding='utf-8', newline='')
+        except OSError as exc:
+            raise CommandError(f'Не удалось открыть файл: {exc}')
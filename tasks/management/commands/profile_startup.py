@@ -0,0 +1,206 @@
+"""
+Команда профилирования холодного старта WSGI-воркера.
+
+Пример:
+
+    python manage.py profile_startup --repeat 5 --top 15
+    python manage.py profile_startup --env ADMIN_ENABLED=False --json startup.json
+
+Каждый прогон запускается в отдельном процессе интерпретатора, который импортирует
+`task_manager.wsgi` (как это делает воркер gunicorn) и сразу обрабатывает один запрос
+через WSGI-приложение. Замеряются:
+- startup_ms: импорт `task_manager.wsgi`, включая загрузку настроек и приложений;
+- first_request_ms: обработка первого запроса, включая ленивые импорты URL-конфигурации,
+  представлений и аутентификации;
+- ttfr_ms: время до первого ответа (сумма двух предыдущих);
+- process_ms: полное время жизни процесса, включая запуск и завершение интерпретатора.
+
+Затем выполняется еще один прогон с `python -X importtime`, и время импорта модулей
+разбивается по фазам (старт и первый запрос) и по пакетам верхнего уровня.
+`-X importtime` само замедляет импорт, поэтому время прогонов считается без него.
+
+Если медиана ttfr_ms превышает бюджет (`--budget-ms`, по умолчанию
+`settings.STARTUP_TIME_BUDGET_MS`), команда завершается с ошибкой.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+PHASE_MARKER = '# first request'
+
+# Код дочернего процесса: импорт WSGI-приложения и один запрос к нему.
+CHILD_CODE = f"""
+import json, sys, time
+started = time.perf_counter()
+from task_manager.wsgi import application
+imported = time.perf_counter()
+sys.stderr.write({PHASE_MARKER!r} + '\\n')
+sys.stderr.flush()
+from wsgiref.util import setup_testing_defaults
+environ = {{'PATH_INFO': sys.argv[1]}}
+setup_testing_defaults(environ)
+statuses = []
+response = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+b''.join(response)
+response.close()
+finished = time.perf_counter()
+print(json.dumps({{
+    'status': int(statuses[0].split()[0]),
+    'startup_ms': (imported - started) * 1000,
+    'first_request_ms': (finished - imported) * 1000,
+}}))
+"""
+
+
+def parse_importtime(lines) -> dict:
+    """
+    Разбирает вывод `python -X importtime` по фазам холодного старта.
+
+    Строки до маркера `PHASE_MARKER` относятся к фазе `startup`, после — к `first_request`.
+
+    Args:
+        lines (Iterable[str]): Строки stderr дочернего процесса.
+
+    Returns:
+        dict: Для каждой фазы — список модулей с полями `module`, `depth`, `self_us`
+        и `cumulative_us` в порядке завершения импорта.
+    """
+    phases = {'startup': [], 'first_request': []}
+    phase = 'startup'
+    for line in lines:
+        if line.startswith(PHASE_MARKER):
+            phase = 'first_request'
+            continue
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if not self_us.strip().isdigit():  # Заголовок таблицы.
+            continue
+        module = name.strip()
+        phases[phase].append({
+            'module': module,
+            'depth': (len(name.rstrip()) - len(module) - 1) // 2,
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+        })
+    return phases
+
+
+def summarize_imports(modules: list, top: int) -> dict:
+    """
+    Сводит время импорта фазы: общее, по пакетам верхнего уровня и самые медленные модули.
+
+    Args:
+        modules (list): Модули фазы из `parse_importtime`.
+        top (int): Число пакетов и модулей в сводке.
+
+    Returns:
+        dict: `total_ms`, `modules` (число модулей), `packages` и `slowest` —
+        пакеты и модули, упорядоченные по собственному времени импорта.
+    """
+    packages = defaultdict(int)
+    for entry in modules:
+        packages[entry['module'].split('.')[0]] += entry['self_us']
+    return {
+        'total_ms': round(sum(entry['self_us'] for entry in modules) / 1000, 1),
+        'modules': len(modules),
+        'packages': [
+            {'package': name, 'self_ms': round(us / 1000, 1)}
+            for name, us in sorted(packages.items(), key=lambda item: -item[1])[:top]
+        ],
+        'slowest': [
+            {
+                'module': entry['module'],
+                'self_ms': round(entry['self_us'] / 1000, 1),
+                'cumulative_ms': round(entry['cumulative_us'] / 1000, 1),
+            }
+            for entry in sorted(modules, key=lambda entry: -entry['self_us'])[:top]
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = 'Замеряет время холодного старта WSGI-воркера до первого ответа и разбивает его по модулям.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--path', default='/api/tasks/', help='Путь первого запроса.')
+        parser.add_argument('--repeat', type=int, default=5, help='Число прогонов (берется медиана).')
+        parser.add_argument('--top', type=int, default=10, help='Число пакетов и модулей в отчете.')
+        parser.add_argument(
+            '--env', action='append', default=[], metavar='KEY=VALUE',
+            help='Переменная окружения дочернего процесса, например ADMIN_ENABLED=False.',
+        )
+        parser.add_argument('--budget-ms', type=float, help='Бюджет медианы ttfr_ms в миллисекундах.')
+        parser.add_argument('--json', dest='json_path', help='Путь для сохранения отчета в JSON.')
+
+    def handle(self, *args, **options) -> None:
+        env = {'DJANGO_SETTINGS_MODULE': 'task_manager.settings', **os.environ}
+        for item in options['env']:
+            key, sep, value = item.partition('=')
+            if not sep:
+                raise CommandError(f'Ожидается KEY=VALUE, получено: {item}')
+            env[key] = value
+        budget = options['budget_ms'] if options['budget_ms'] is not None else settings.STARTUP_TIME_BUDGET_MS
+
+        runs = [self._run(options['path'], env) for _ in range(max(options['repeat'], 1))]
+        timings = {
+            key: round(statistics.median(run[key] for run in runs), 1)
+            for key in ('startup_ms', 'first_request_ms', 'ttfr_ms', 'process_ms')
+        }
+        phases = parse_importtime(self._run(options['path'], env, importtime=True)['stderr'].splitlines())
+        report = {
+            'path': options['path'],
+            'status': runs[-1]['status'],
+            'runs': len(runs),
+            'budget_ms': budget,
+            **timings,
+            'imports': {phase: summarize_imports(modules, options['top']) for phase, modules in phases.items()},
+        }
+        self._print(report)
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+
+        if report['ttfr_ms'] > budget:
+            raise CommandError(f'Время до первого ответа {report["ttfr_ms"]} мс превышает бюджет {budget} мс.')
+
+    def _run(self, path: str, env: dict, importtime: bool = False) -> dict:
+        """
+        Запускает дочерний процесс холодного старта и возвращает его замеры.
+        """
+        command = [sys.executable, *(['-X', 'importtime'] if importtime else []), '-c', CHILD_CODE, path]
+        started = time.perf_counter()
+        result = subprocess.run(command, cwd=settings.BASE_DIR, env=env, capture_output=True, text=True)
+        process_ms = (time.perf_counter() - started) * 1000
+        if result.returncode:
+            raise CommandError(f'Дочерний процесс завершился с ошибкой:\n{result.stderr}')
+        run = json.loads(result.stdout.strip().splitlines()[-1])
+        run['ttfr_ms'] = run['startup_ms'] + run['first_request_ms']
+        run['process_ms'] = process_ms
+        run['stderr'] = result.stderr
+        return run
+
+    def _print(self, report: dict) -> None:
+        self.stdout.write(f'{report["path"]} -> {report["status"]}, медиана {report["runs"]} прогонов:')
+        for key in ('startup_ms', 'first_request_ms', 'ttfr_ms', 'process_ms'):
+            self.stdout.write(f'  {key:<17} {report[key]:>8}')
+        self.stdout.write(f'  {"budget_ms":<17} {report["budget_ms"]:>8}')
+        for phase, summary in report['imports'].items():
+            self.stdout.write(
+                f'\nИмпорт, фаза {phase}: {summary["modules"]} модулей, {summary["total_ms"]} мс (-X importtime)'
+            )
+            self.stdout.write(f'  {"package":<28} {"self ms":>8}')
+            for entry in summary['packages']:
+                self.stdout.write(f'  {entry["package"]:<28} {entry["self_ms"]:>8}')
+            self.stdout.write(f'  {"module":<48} {"self ms":>8} {"cumul ms":>9}')
+            for entry in summary['slowest']:
+                self.stdout.write(f'  {entry["module"]:<48} {entry["self_ms"]:>8} {entry["cumulative_ms"]:>9}')
@@ -0,0 +1,34 @@
+"""
+Команда удаления устаревших отметок об удалении задач.
+
+Пример:
+
+    python manage.py prune_task_tombstones
+    python manage.py prune_task_tombstones --days 7
+
+Удаляются отметки старше `--days` дней (по умолчанию `TASK_TOMBSTONE_RETENTION_DAYS`).
+Клиенты с курсором старше этого срока получают ответ 410 и загружают задачи заново.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from tasks.models import TaskTombstone
+
+
+class Command(BaseCommand):
+    help = 'Удаляет отметки об удалении задач старше срока хранения.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--days', type=int, default=settings.TASK_TOMBSTONE_RETENTION_DAYS,
+                            help='Срок хранения отметок в днях.')
+
+    def handle(self, *args, **options) -> None:
+        if options['days'] < 0:
+            raise CommandError('Срок хранения не может быть отрицательным.')
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        deleted, _ = TaskTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+        self.stdout.write(f'Удалено отметок: {deleted}')
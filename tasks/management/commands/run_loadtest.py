@@ -0,0 +1,179 @@
+"""
+Команда нагрузочного прогона сценария API на синтетических данных.
+
+Пример (данные созданы командой `seed_perf_data`):
+
+    python manage.py run_loadtest --gunicorn --workers 4 --connections 50 --duration 60 --json after.json
+    python manage.py run_loadtest --base-url http://localhost:8000 --mix list=80,create=10,update=10 \\
+        --compare before.json
+
+Виртуальные пользователи входят как `perf-user-<n>@example.com` (первые `--users`
+пользователей, начиная с тяжелых) и выполняют операции в пропорции `--mix`
+(см. `tasks.loadtest.run_scenario`). С `--gunicorn` команда сама запускает
+`gunicorn task_manager.wsgi:application` из текущего каталога с `--workers` процессами,
+ждет готовности и останавливает его по завершении; иначе нагружается уже запущенный
+сервер `--base-url`. Ограничения частоты запросов сервера (`THROTTLE_*_RATE`) должны
+быть выше создаваемой нагрузки; запущенному командой gunicorn они поднимаются, если не
+заданы в окружении явно.
+
+Отчет содержит p50/p95/p99 и пропускную способность по операциям и в целом, а также
+коммит, время и параметры прогона. `--json` сохраняет отчет, `--compare` выводит
+изменение задержек и пропускной способности относительно ранее сохраненного отчета.
+"""
+
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.loadtest import DEFAULT_MIX, SCENARIO_OPERATIONS, LoadResult, parse_mix, run_scenario
+from tasks.perfdata import PERF_PASSWORD, user_email
+from tasks.perfutils import git_commit
+
+SERVER_START_TIMEOUT = 30.0
+UNTHROTTLED_RATE = '1000000/s'
+THROTTLE_ENV = ('THROTTLE_USER_RATE', 'THROTTLE_IP_RATE', 'THROTTLE_LOGIN_RATE', 'THROTTLE_LOGIN_ACCOUNT_RATE')
+COMPARED_METRICS = ('rps', 'p50_ms', 'p95_ms', 'p99_ms')
+
+
+class Command(BaseCommand):
+    help = 'Выполняет нагрузочный прогон сценария API и выводит перцентили задержки и пропускную способность.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000', help='Адрес нагружаемого сервера.')
+        parser.add_argument('--gunicorn', action='store_true', help='Запустить gunicorn на время прогона.')
+        parser.add_argument('--bind', default='127.0.0.1:8765', help='Адрес запускаемого gunicorn.')
+        parser.add_argument('--workers', type=int, default=4, help='Число процессов запускаемого gunicorn.')
+        parser.add_argument('--users', type=int, default=100, help='Число синтетических пользователей для входа.')
+        parser.add_argument('--password', default=PERF_PASSWORD, help='Пароль синтетических пользователей.')
+        parser.add_argument('--connections', type=int, default=20, help='Число виртуальных пользователей.')
+        parser.add_argument('--duration', type=float, default=30.0, help='Длительность прогона, с.')
+        parser.add_argument('--mix', default=','.join(f'{op}={weight}' for op, weight in DEFAULT_MIX.items()),
+                            help='Веса операций: token, list, create, update, delete.')
+        parser.add_argument('--seed', type=int, default=0, help='Зерно выбора операций.')
+        parser.add_argument('--timeout', type=float, default=10.0, help='Таймаут одного запроса, с.')
+        parser.add_argument('--json', dest='json_path', help='Путь для сохранения отчета в JSON.')
+        parser.add_argument('--compare', dest='baseline_path', help='Отчет в JSON для сравнения.')
+
+    def handle(self, *args, **options) -> None:
+        try:
+            mix = parse_mix(options['mix'])
+        except ValueError as error:
+            raise CommandError(f'Неверная пропорция операций: {error}')
+        if options['users'] < 1 or options['connections'] < 1 or options['duration'] <= 0:
+            raise CommandError('Число пользователей, соединений и длительность должны быть положительными.')
+        baseline = None
+        if options['baseline_path']:
+            with open(options['baseline_path'], encoding='utf-8') as file:
+                baseline = json.load(file)
+
+        base_url = f'http://{options["bind"]}' if options['gunicorn'] else options['base_url']
+        credentials = [(user_email(number), options['password']) for number in range(options['users'])]
+        started_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        server = self._start_gunicorn(options['bind'], options['workers']) if options['gunicorn'] else None
+        try:
+            results = run_scenario(
+                base_url, credentials, options['connections'], options['duration'], mix,
+                seed=options['seed'], timeout=options['timeout'],
+            )
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait(timeout=SERVER_START_TIMEOUT)
+
+        report = self._report(results, options, base_url, mix, started_at)
+        self._print(report, baseline)
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+
+    def _start_gunicorn(self, bind: str, workers: int) -> subprocess.Popen:
+        """
+        Запускает gunicorn с поднятыми ограничениями частоты и ждет, пока он начнет принимать запросы.
+        """
+        env = {**os.environ, **{name: os.environ.get(name, UNTHROTTLED_RATE) for name in THROTTLE_ENV}}
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', 'task_manager.wsgi:application', '--bind', bind,
+             '--workers', str(workers)],
+            cwd=settings.BASE_DIR, env=env,
+        )
+        host, _, port = bind.rpartition(':')
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError(f'gunicorn завершился с кодом {server.returncode}.')
+            try:
+                connection = http.client.HTTPConnection(host, int(port), timeout=1)
+                connection.request('GET', '/')
+                connection.getresponse().read()
+                connection.close()
+                return server
+            except (OSError, http.client.HTTPException, socket.timeout):
+                time.sleep(0.2)
+        server.terminate()
+        server.wait(timeout=SERVER_START_TIMEOUT)
+        raise CommandError(f'gunicorn не начал принимать запросы за {SERVER_START_TIMEOUT:.0f} с.')
+
+    def _report(self, results: dict, options: dict, base_url: str, mix: dict, started_at: str) -> dict:
+        """
+        Собирает отчет: параметры прогона, сводки по операциям и общую сводку.
+        """
+        total = LoadResult(target='total', connections=options['connections'])
+        for result in results.values():
+            total.merge(result)
+            total.duration = result.duration
+        return {
+            'meta': {
+                'commit': git_commit(),
+                'started_at': started_at,
+                'base_url': base_url,
+                'gunicorn_workers': options['workers'] if options['gunicorn'] else None,
+                'users': options['users'],
+                'connections': options['connections'],
+                'duration': options['duration'],
+                'mix': mix,
+                'seed': options['seed'],
+            },
+            'operations': {
+                operation: results[operation].summary() for operation in SCENARIO_OPERATIONS
+                if results[operation].completed or results[operation].errors
+            },
+            'total': total.summary(),
+        }
+
+    def _print(self, report: dict, baseline: dict | None) -> None:
+        """
+        Выводит таблицу сводок и, если задан базовый отчет, изменение метрик относительно него.
+        """
+        rows = {**report['operations'], 'total': report['total']}
+        self.stdout.write(f'Коммит: {report["meta"]["commit"] or "—"}, {report["meta"]["started_at"]}')
+        self.stdout.write(
+            f'{"operation":<10} {"requests":>9} {"rps":>9} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"errors":>8}'
+        )
+        for operation, summary in rows.items():
+            self.stdout.write(
+                f'{operation:<10} {summary["requests"]:>9} {summary["rps"]:>9} {summary["p50_ms"]:>9} '
+                f'{summary["p95_ms"]:>9} {summary["p99_ms"]:>9} {summary["error_rate"]:>8.2%}'
+            )
+        if baseline is None:
+            return
+
+        base_rows = {**baseline.get('operations', {}), 'total': baseline.get('total', {})}
+        self.stdout.write(f'Сравнение с коммитом {baseline.get("meta", {}).get("commit") or "—"}:')
+        self.stdout.write(f'{"operation":<10} ' + ' '.join(f'{metric:>9}' for metric in COMPARED_METRICS))
+        for operation, summary in rows.items():
+            base = base_rows.get(operation)
+            if not base:
+                continue
+            changes = []
+            for metric in COMPARED_METRICS:
+                change = (summary[metric] - base[metric]) / base[metric] if base.get(metric) else None
+                changes.append(f'{change:>+9.1%}' if change is not None else f'{"—":>9}')
+            self.stdout.write(f'{operation:<10} ' + ' '.join(changes))
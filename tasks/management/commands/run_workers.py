@@ -0,0 +1,85 @@
+"""
+Команда запуска воркеров очереди фоновых заданий (см. `tasks.jobs`).
+
+Пример:
+
+    python manage.py run_workers
+    python manage.py run_workers --processes 4
+    python manage.py run_workers --once
+
+С `--processes 1` (по умолчанию) задания выполняются в текущем процессе, иначе
+запускается пул процессов-воркеров (см. `tasks.worker`); завершившийся с ошибкой
+процесс перезапускается.
+SIGINT и SIGTERM останавливают воркеры после текущего задания. С `--once` воркеры
+завершаются, когда доступных заданий не останется (удобно для cron и тестов).
+"""
+
+import multiprocessing
+import signal
+import threading
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from tasks.jobs import run_worker
+from tasks.worker import worker_process
+
+SUPERVISE_INTERVAL = 1.0
+RESTART_DELAY = 1.0
+
+
+class Command(BaseCommand):
+    help = 'Запускает воркеры очереди фоновых заданий.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--processes', type=int, default=1, help='Число процессов-воркеров.')
+        parser.add_argument('--once', action='store_true', help='Завершиться, когда очередь опустеет.')
+
+    def handle(self, *args, **options) -> None:
+        if options['processes'] < 1:
+            raise CommandError('Число процессов должно быть положительным.')
+        previous = {signum: signal.getsignal(signum) for signum in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            if options['processes'] == 1:
+                stop = threading.Event()
+                self._handle_signals(stop)
+                processed = run_worker(stop, options['once'])
+                self.stdout.write(f'Выполнено попыток: {processed}')
+            else:
+                self._run_pool(options['processes'], options['once'])
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+    def _run_pool(self, processes: int, once: bool) -> None:
+        """
+        Запускает процессы-воркеры и перезапускает аварийно завершившиеся до остановки.
+        """
+        # Дочерние процессы открывают собственные соединения с базой.
+        connections.close_all()
+        context = multiprocessing.get_context('spawn')
+        stop = context.Event()
+        self._handle_signals(stop)
+        workers = [self._start(context, stop, once) for _ in range(processes)]
+        self.stdout.write(f'Запущено воркеров: {len(workers)}')
+        while any(worker.is_alive() for worker in workers):
+            for number, worker in enumerate(workers):
+                worker.join(SUPERVISE_INTERVAL / len(workers))
+                if not worker.is_alive() and worker.exitcode != 0 and not stop.is_set():
+                    self.stderr.write(f'Воркер {worker.pid} завершился с кодом {worker.exitcode}, перезапуск.')
+                    # Задержка не дает процессу, падающему при старте, перезапускаться непрерывно.
+                    stop.wait(RESTART_DELAY)
+                    workers[number] = self._start(context, stop, once)
+
+    def _start(self, context, stop, once: bool):
+        worker = context.Process(target=worker_process, args=(stop, once), daemon=True)
+        worker.start()
+        return worker
+
+    def _handle_signals(self, stop) -> None:
+        def request_stop(signum, frame) -> None:
+            self.stdout.write('Остановка после текущих заданий...')
+            stop.set()
+
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
@@ -0,0 +1,59 @@
+"""
+Команда создания воспроизводимого синтетического набора данных для нагрузочных замеров.
+
+Пример:
+
+    python manage.py seed_perf_data --users 1000 --tasks 1000000
+    python manage.py seed_perf_data --users 200 --tasks 50000 --heavy-users 3 --heavy-share 0.6 --seed 7 --reset
+
+Создаются пользователи `perf-user-<n>@example.com` с паролем `perf-password-123` и их
+задачи (см. `tasks.perfdata`): первые `--heavy-users` пользователей владеют долей
+`--heavy-share` задач, остальные задачи распределены по закону Ципфа. При тех же
+параметрах и `--seed` набор данных совпадает. `--reset` удаляет ранее созданный набор.
+Сценарий нагрузки для этих данных запускает команда `run_loadtest`.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.perfdata import PERF_PASSWORD, delete_perf_data, seed_perf_data, user_email
+
+
+class Command(BaseCommand):
+    help = 'Создает синтетических пользователей и задачи с перекосом для нагрузочных замеров.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--users', type=int, default=1000, help='Число пользователей.')
+        parser.add_argument('--tasks', type=int, default=100000, help='Общее число задач.')
+        parser.add_argument('--heavy-users', type=int, default=None,
+                            help='Число «тяжелых» пользователей; по умолчанию 1%% пользователей.')
+        parser.add_argument('--heavy-share', type=float, default=0.5, help='Доля задач тяжелых пользователей.')
+        parser.add_argument('--seed', type=int, default=0, help='Зерно генератора случайных чисел.')
+        parser.add_argument('--reset', action='store_true', help='Удалить ранее созданный набор данных.')
+
+    def handle(self, *args, **options) -> None:
+        heavy_users = options['heavy_users']
+        if heavy_users is None:
+            heavy_users = max(1, options['users'] // 100)
+        if options['users'] < 1 or options['tasks'] < 0 or not 0 <= heavy_users <= options['users']:
+            raise CommandError('Число пользователей должно быть положительным, тяжелых — не больше пользователей.')
+        if not 0 <= options['heavy_share'] <= 1:
+            raise CommandError('Доля задач тяжелых пользователей должна быть от 0 до 1.')
+
+        if options['reset']:
+            self.stdout.write(f'Удалено пользователей: {delete_perf_data()}')
+        started = time.perf_counter()
+        try:
+            counts = seed_perf_data(
+                options['users'], options['tasks'], heavy_users, options['heavy_share'], options['seed'],
+            )
+        except ValueError as error:
+            raise CommandError(f'{error} Используйте --reset.')
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f'Создано пользователей: {options["users"]}, задач: {options["tasks"]} за {elapsed:.1f} с.'
+        )
+        self.stdout.write(f'Задач у тяжелых пользователей: {sum(counts[:heavy_users])}, максимум: {max(counts)}.')
+        self.stdout.write(f'Вход: {user_email(0)} … {user_email(options["users"] - 1)}, пароль {PERF_PASSWORD}')
@@ -0,0 +1,42 @@
+"""
+Команда проверки и пересчета счетчиков задач по статусам.
+
+Пример:
+
+    python manage.py task_counters --verify
+    python manage.py task_counters --rebuild
+    python manage.py task_counters --rebuild --user 42
+
+`--verify` сравнивает счетчики с подсчетом по таблице задач и завершается ошибкой при
+расхождениях; `--rebuild` пересчитывает счетчики. Без параметров выполняется проверка.
+Пересчет нужен после изменения задач в обход триггеров (например, восстановления таблицы
+из резервной копии без счетчиков).
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks import counters
+
+
+class Command(BaseCommand):
+    help = 'Проверяет или пересчитывает счетчики задач по статусам.'
+
+    def add_arguments(self, parser) -> None:
+        mode = parser.add_mutually_exclusive_group()
+        mode.add_argument('--verify', action='store_true', help='Проверить счетчики (по умолчанию).')
+        mode.add_argument('--rebuild', action='store_true', help='Пересчитать счетчики по таблице задач.')
+        parser.add_argument('--user', type=int, action='append', dest='users',
+                            help='Ограничиться пользователем (можно указать несколько раз).')
+
+    def handle(self, *args, **options) -> None:
+        if options['rebuild']:
+            created = counters.rebuild_counters(options['users'])
+            self.stdout.write(f'Счетчики пересчитаны, строк: {created}')
+            return
+
+        mismatches = counters.find_mismatches(options['users'])
+        for user_id, status, (stored, actual) in mismatches:
+            self.stdout.write(f'Пользователь {user_id}, статус "{status}": счетчик {stored}, задач {actual}')
+        if mismatches:
+            raise CommandError(f'Расхождений: {len(mismatches)}. Выполните task_counters --rebuild.')
+        self.stdout.write('Счетчики совпадают с задачами.')
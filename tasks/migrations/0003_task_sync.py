@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_task_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskTombstone',
+            fields=[
+                ('task_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('user_id', models.IntegerField()),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='task_user_updated_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tasktombstone',
+            index=models.Index(fields=['user_id', 'deleted_at', 'task_id'], name='tombstone_user_deleted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tasktombstone',
+            index=models.Index(fields=['deleted_at'], name='tombstone_deleted_at_idx'),
+        ),
+    ]
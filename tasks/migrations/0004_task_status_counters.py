@@ -0,0 +1,113 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Счетчики задач по статусам поддерживаются триггерами: так они обновляются в той же
+# транзакции при любом пути записи, включая `bulk_create`, `QuerySet.update()`/`delete()`
+# и каскадное удаление пользователя без загрузки задач в Python.
+SQLITE_TRIGGERS = [
+    '''
+    CREATE TRIGGER task_counter_insert AFTER INSERT ON tasks_task
+    BEGIN
+        INSERT INTO tasks_taskstatuscounter (user_id, status, "count") VALUES (NEW.user_id, NEW.status, 1)
+        ON CONFLICT (user_id, status) DO UPDATE SET "count" = "count" + 1;
+    END
+    ''',
+    '''
+    CREATE TRIGGER task_counter_delete AFTER DELETE ON tasks_task
+    BEGIN
+        UPDATE tasks_taskstatuscounter SET "count" = "count" - 1
+        WHERE user_id = OLD.user_id AND status = OLD.status;
+    END
+    ''',
+    '''
+    CREATE TRIGGER task_counter_update AFTER UPDATE OF status, user_id ON tasks_task
+    WHEN OLD.status IS NOT NEW.status OR OLD.user_id IS NOT NEW.user_id
+    BEGIN
+        UPDATE tasks_taskstatuscounter SET "count" = "count" - 1
+        WHERE user_id = OLD.user_id AND status = OLD.status;
+        INSERT INTO tasks_taskstatuscounter (user_id, status, "count") VALUES (NEW.user_id, NEW.status, 1)
+        ON CONFLICT (user_id, status) DO UPDATE SET "count" = "count" + 1;
+    END
+    ''',
+]
+SQLITE_DROP = [
+    'DROP TRIGGER IF EXISTS task_counter_insert',
+    'DROP TRIGGER IF EXISTS task_counter_delete',
+    'DROP TRIGGER IF EXISTS task_counter_update',
+]
+
+POSTGRES_TRIGGERS = [
+    '''
+    CREATE FUNCTION task_counter_apply() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('DELETE', 'UPDATE') THEN
+            UPDATE tasks_taskstatuscounter SET "count" = "count" - 1
+            WHERE user_id = OLD.user_id AND status = OLD.status;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO tasks_taskstatuscounter (user_id, status, "count") VALUES (NEW.user_id, NEW.status, 1)
+            ON CONFLICT (user_id, status) DO UPDATE SET "count" = tasks_taskstatuscounter."count" + 1;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    ''',
+    '''
+    CREATE TRIGGER task_counter_insert_delete AFTER INSERT OR DELETE ON tasks_task
+    FOR EACH ROW EXECUTE FUNCTION task_counter_apply()
+    ''',
+    '''
+    CREATE TRIGGER task_counter_update AFTER UPDATE OF status, user_id ON tasks_task
+    FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status OR OLD.user_id IS DISTINCT FROM NEW.user_id)
+    EXECUTE FUNCTION task_counter_apply()
+    ''',
+]
+POSTGRES_DROP = [
+    'DROP TRIGGER IF EXISTS task_counter_insert_delete ON tasks_task',
+    'DROP TRIGGER IF EXISTS task_counter_update ON tasks_task',
+    'DROP FUNCTION IF EXISTS task_counter_apply()',
+]
+
+BACKFILL = '''
+    INSERT INTO tasks_taskstatuscounter (user_id, status, "count")
+    SELECT user_id, status, COUNT(*) FROM tasks_task GROUP BY user_id, status
+'''
+
+
+def create_triggers(apps, schema_editor) -> None:
+    statements = POSTGRES_TRIGGERS if schema_editor.connection.vendor == 'postgresql' else SQLITE_TRIGGERS
+    for statement in [BACKFILL, *statements]:
+        schema_editor.execute(statement)
+
+
+def drop_triggers(apps, schema_editor) -> None:
+    statements = POSTGRES_DROP if schema_editor.connection.vendor == 'postgresql' else SQLITE_DROP
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_task_sync'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskStatusCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('новая', 'New'), ('в процессе', 'In_progress'), ('завершена', 'Completed')], max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'status'), name='task_counter_user_status_uniq')],
+            },
+        ),
+        migrations.RunPython(create_triggers, drop_triggers),
+    ]
@@ -0,0 +1,97 @@
+from django.db import migrations
+
+# Полнотекстовый индекс задач (см. `tasks.search`). Индекс поддерживается базой данных,
+# поэтому остается согласованным при пакетных операциях и каскадном удалении.
+# В индекс попадает текст с `ё`, замененной на `е`: токенизаторы обеих баз их не
+# отождествляют. Для удаления из FTS5 передается тот же нормализованный текст.
+SQLITE_CREATE = [
+    '''
+    CREATE VIRTUAL TABLE tasks_task_fts USING fts5(
+        title, description, content='tasks_task', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='3 4'
+    )
+    ''',
+    '''
+    CREATE TRIGGER task_fts_insert AFTER INSERT ON tasks_task
+    BEGIN
+        INSERT INTO tasks_task_fts (rowid, title, description) VALUES (
+            NEW.id,
+            replace(replace(NEW.title, 'ё', 'е'), 'Ё', 'Е'),
+            replace(replace(NEW.description, 'ё', 'е'), 'Ё', 'Е')
+        );
+    END
+    ''',
+    '''
+    CREATE TRIGGER task_fts_delete AFTER DELETE ON tasks_task
+    BEGIN
+        INSERT INTO tasks_task_fts (tasks_task_fts, rowid, title, description) VALUES (
+            'delete',
+            OLD.id,
+            replace(replace(OLD.title, 'ё', 'е'), 'Ё', 'Е'),
+            replace(replace(OLD.description, 'ё', 'е'), 'Ё', 'Е')
+        );
+    END
+    ''',
+    '''
+    CREATE TRIGGER task_fts_update AFTER UPDATE OF title, description ON tasks_task
+    WHEN OLD.title IS NOT NEW.title OR OLD.description IS NOT NEW.description
+    BEGIN
+        INSERT INTO tasks_task_fts (tasks_task_fts, rowid, title, description) VALUES (
+            'delete',
+            OLD.id,
+            replace(replace(OLD.title, 'ё', 'е'), 'Ё', 'Е'),
+            replace(replace(OLD.description, 'ё', 'е'), 'Ё', 'Е')
+        );
+        INSERT INTO tasks_task_fts (rowid, title, description) VALUES (
+            NEW.id,
+            replace(replace(NEW.title, 'ё', 'е'), 'Ё', 'Е'),
+            replace(replace(NEW.description, 'ё', 'е'), 'Ё', 'Е')
+        );
+    END
+    ''',
+    '''
+    INSERT INTO tasks_task_fts (rowid, title, description)
+    SELECT id, replace(replace(title, 'ё', 'е'), 'Ё', 'Е'), replace(replace(description, 'ё', 'е'), 'Ё', 'Е')
+    FROM tasks_task
+    ''',
+]
+SQLITE_DROP = [
+    'DROP TRIGGER IF EXISTS task_fts_insert',
+    'DROP TRIGGER IF EXISTS task_fts_delete',
+    'DROP TRIGGER IF EXISTS task_fts_update',
+    'DROP TABLE IF EXISTS tasks_task_fts',
+]
+
+# Выражение индекса совпадает с выражением в `tasks.search.POSTGRES_MATCH`.
+POSTGRES_CREATE = [
+    '''
+    CREATE INDEX task_search_idx ON tasks_task
+    USING GIN (to_tsvector('simple'::regconfig, translate(title || ' ' || description, 'ёЁ', 'еЕ')))
+    ''',
+]
+POSTGRES_DROP = [
+    'DROP INDEX IF EXISTS task_search_idx',
+]
+
+
+def create_search_index(apps, schema_editor) -> None:
+    statements = POSTGRES_CREATE if schema_editor.connection.vendor == 'postgresql' else SQLITE_CREATE
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor) -> None:
+    statements = POSTGRES_DROP if schema_editor.connection.vendor == 'postgresql' else SQLITE_DROP
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_status_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
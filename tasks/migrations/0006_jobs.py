@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:44
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=50)),
+                ('payload', models.JSONField(default=dict)),
+                ('user_id', models.IntegerField(null=True)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='queued', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('max_attempts', models.PositiveIntegerField(default=1)),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('lease_token', models.CharField(blank=True, max_length=32)),
+                ('progress', models.JSONField(default=dict)),
+                ('result', models.JSONField(null=True)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('finished_at', models.DateTimeField(null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'available_at'], name='job_status_available_idx'), models.Index(fields=['user_id', 'id'], name='job_user_id_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_jobs'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.CharField(choices=[('новая', 'New'), ('в процессе', 'In_progress'), ('завершена', 'Completed')], default='новая', max_length=20),
+        ),
+    ]
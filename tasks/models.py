@@ -3,10 +3,15 @@
 
 Содержит модель Task, которая представляет задачу, связанную с пользователем.
 Каждая задача имеет заголовок, описание, статус и привязку к пользователю.
+Модель TaskTombstone хранит отметки об удаленных задачах для инкрементальной
+синхронизации клиентов (см. `tasks.sync`). Модель TaskStatusCounter хранит число
+задач пользователя в каждом статусе (см. `tasks.counters`). Модель Job хранит
+фоновые задания очереди (см. `tasks.jobs`).
 """
 
 
 from django.db import models
+from django.utils import timezone
 from enum import Enum
 from users.models import User
 
@@ -35,7 +40,111 @@ class Task(models.Model):
         default=TaskStatus.NEW.value  # Установка значения по умолчанию через Enum
     )
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='tasks')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Изменения задач пользователя после курсора синхронизации.
+            models.Index(fields=['user', 'updated_at', 'id'], name='task_user_updated_id_idx'),
+            # Списки задач пользователя в API с фильтром по статусу и курсором по id.
+            models.Index(fields=['user', 'status', 'id'], name='task_user_status_id_idx'),
+            # Фильтр по статусу в админке с сортировкой по id.
+            models.Index(fields=['status', 'id'], name='task_status_id_idx'),
+        ]
 
     def __str__(self) -> str:
         return self.title
 
+
+class TaskTombstone(models.Model):
+    """
+    Отметка об удаленной задаче для инкрементальной синхронизации.
+
+    Владелец хранится без внешнего ключа, чтобы отметки, созданные при каскадном
+    удалении пользователя, не ссылались на удаленную строку. Отметки старше
+    `TASK_TOMBSTONE_RETENTION_DAYS` удаляются командой `prune_task_tombstones`.
+    """
+    task_id = models.IntegerField(primary_key=True)
+    user_id = models.IntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user_id', 'deleted_at', 'task_id'], name='tombstone_user_deleted_idx'),
+            models.Index(fields=['deleted_at'], name='tombstone_deleted_at_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.task_id} ({self.deleted_at})'
+
+
+class TaskStatusCounter(models.Model):
+    """
+    Число задач пользователя в статусе.
+
+    Счетчики поддерживаются триггерами базы данных на таблице задач (миграция
+    `0004_task_status_counters`) в той же транзакции, что и изменение задачи, поэтому
+    учитывают любые пути записи: API, пакетные операции, `QuerySet.update()`/`delete()`
+    и каскадное удаление пользователя.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='task_counters')
+    status = models.CharField(max_length=20, choices=TaskStatus.choices())
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'status'], name='task_counter_user_status_uniq'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.user_id}: {self.status} = {self.count}'
+
+
+class JobStatus(Enum):
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+
+    @classmethod
+    def choices(cls):
+        """
+        Возвращает статусы в формате, подходящем для поля choices Django.
+        """
+        return [(tag.value, tag.name.capitalize()) for tag in cls]
+
+
+class Job(models.Model):
+    """
+    Фоновое задание очереди в базе данных.
+
+    `available_at` — время, с которого задание может взять воркер: момент постановки,
+    время следующей попытки после ошибки или окончание аренды выполняющего воркера.
+    Автор хранится без внешнего ключа, чтобы задание удаления пользователя не удалялось
+    вместе с ним.
+    """
+    kind = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict)
+    user_id = models.IntegerField(null=True)
+    status = models.CharField(max_length=20, choices=JobStatus.choices(), default=JobStatus.QUEUED.value)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=1)
+    available_at = models.DateTimeField(default=timezone.now)
+    lease_token = models.CharField(max_length=32, blank=True)
+    progress = models.JSONField(default=dict)
+    result = models.JSONField(null=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True)
+
+    class Meta:
+        indexes = [
+            # Выбор воркером ближайших доступных заданий.
+            models.Index(fields=['status', 'available_at'], name='job_status_available_idx'),
+            # Список заданий пользователя с курсором по id.
+            models.Index(fields=['user_id', 'id'], name='job_user_id_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.kind} #{self.pk} ({self.status})'
@@ -0,0 +1,149 @@
+"""
+Модуль синтетических данных для нагрузочных замеров.
+
+Содержит:
+- user_email: адрес n-го синтетического пользователя.
+- skewed_counts: распределение задач по пользователям с перекосом в сторону «тяжелых» аккаунтов.
+- seed_perf_data: создание пользователей и задач (команда `seed_perf_data`).
+- delete_perf_data: удаление ранее созданных синтетических данных.
+
+Данные воспроизводимы: при тех же параметрах и `seed` создаются те же пользователи с
+тем же числом задач, заголовками, описаниями и статусами, поэтому замеры разных коммитов
+сравнимы. Первые `heavy_users` пользователей владеют долей `heavy_share` всех задач, остальные
+задачи распределены по закону Ципфа (число задач убывает с номером пользователя).
+У всех пользователей один пароль `PERF_PASSWORD`; хеш вычисляется один раз.
+"""
+
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from tasks import deletion
+from tasks.models import Task, TaskStatus, TaskTombstone
+from users.models import User
+
+PERF_EMAIL = 'perf-user-{}@example.com'
+PERF_EMAIL_PREFIX = 'perf-user-'
+PERF_PASSWORD = 'perf-password-123'
+INSERT_BATCH = 5000
+ZIPF_EXPONENT = 1.1
+
+# Доли статусов: большая часть задач новые или в работе.
+STATUS_WEIGHTS = {
+    TaskStatus.NEW.value: 5,
+    TaskStatus.IN_PROGRESS.value: 3,
+    TaskStatus.COMPLETED.value: 2,
+}
+WORDS = (
+    'отчет', 'продажи', 'клиент', 'договор', 'встреча', 'релиз', 'ошибка', 'сервер', 'бюджет',
+    'квартал', 'презентация', 'проверка', 'счет', 'поставка', 'задача', 'план', 'анализ', 'команда',
+    'дизайн', 'тестирование', 'документация', 'интеграция', 'оплата', 'склад', 'маркетинг',
+)
+
+
+def user_email(number: int) -> str:
+    """
+    Возвращает адрес синтетического пользователя с номером `number` (с нуля).
+    """
+    return PERF_EMAIL.format(number)
+
+
+def skewed_counts(total: int, users: int, heavy_users: int, heavy_share: float) -> list:
+    """
+    Распределяет задачи по пользователям с перекосом.
+
+    Args:
+        total (int): Общее число задач.
+        users (int): Число пользователей.
+        heavy_users (int): Число «тяжелых» пользователей (первые по номеру).
+        heavy_share (float): Доля задач, принадлежащих тяжелым пользователям (0-1).
+
+    Returns:
+        list: Число задач каждого пользователя; сумма равна `total`.
+    """
+    heavy_users = min(heavy_users, users)
+    regular = users - heavy_users
+    if not regular:
+        heavy_share = 1.0
+    elif not heavy_users:
+        heavy_share = 0.0
+    weights = [heavy_share / heavy_users] * heavy_users if heavy_users else []
+    zipf = [1 / rank ** ZIPF_EXPONENT for rank in range(1, regular + 1)]
+    weights += [(1 - heavy_share) * weight / sum(zipf) for weight in zipf]
+
+    # Метод наибольших остатков: целые доли с суммой, точно равной total.
+    shares = [weight * total for weight in weights]
+    counts = [int(share) for share in shares]
+    by_remainder = sorted(range(users), key=lambda number: (counts[number] - shares[number], number))
+    for number in by_remainder[:total - sum(counts)]:
+        counts[number] += 1
+    return counts
+
+
+def _tasks(user: User, count: int, rng: random.Random):
+    statuses, status_weights = list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values())
+    for number in range(count):
+        words = rng.sample(WORDS, 3)
+        yield Task(
+            user=user,
+            title=f'{words[0].capitalize()} {words[1]} №{number}',
+            description=' '.join(rng.choices(WORDS, k=rng.randint(5, 30))),
+            status=rng.choices(statuses, status_weights)[0],
+        )
+
+
+def seed_perf_data(users: int, tasks: int, heavy_users: int, heavy_share: float, seed: int = 0) -> list:
+    """
+    Создает синтетических пользователей и их задачи.
+
+    Задачи вставляются пакетами по `INSERT_BATCH` без сигналов; триггеры счетчиков и
+    поискового индекса срабатывают как при обычной записи.
+
+    Args:
+        users (int): Число пользователей.
+        tasks (int): Общее число задач.
+        heavy_users (int): Число тяжелых пользователей.
+        heavy_share (float): Доля задач тяжелых пользователей.
+        seed (int): Зерно генератора случайных чисел.
+
+    Returns:
+        list: Число задач каждого пользователя.
+
+    Raises:
+        ValueError: Если синтетические пользователи уже созданы.
+    """
+    if User.objects.filter(email__startswith=PERF_EMAIL_PREFIX).exists():
+        raise ValueError('Синтетические данные уже созданы; удалите их перед повторным созданием.')
+    rng = random.Random(seed)
+    counts = skewed_counts(tasks, users, heavy_users, heavy_share)
+    password = make_password(PERF_PASSWORD)
+    with transaction.atomic():
+        User.objects.bulk_create(
+            User(email=user_email(number), name=f'Perf {number}', password=password) for number in range(users)
+        )
+    # bulk_create возвращает первичные ключи не на всех базах; порядок id совпадает с порядком вставки.
+    created = list(User.objects.filter(email__startswith=PERF_EMAIL_PREFIX).order_by('id'))
+    batch = []
+    for user, count in zip(created, counts):
+        for task in _tasks(user, count, rng):
+            batch.append(task)
+            if len(batch) == INSERT_BATCH:
+                Task.objects.bulk_create(batch)
+                batch = []
+    Task.objects.bulk_create(batch)
+    return counts
+
+
+def delete_perf_data() -> int:
+    """
+    Удаляет синтетических пользователей с задачами и отметки об удалении их задач.
+
+    Returns:
+        int: Число удаленных пользователей.
+    """
+    user_ids = list(User.objects.filter(email__startswith=PERF_EMAIL_PREFIX).values_list('id', flat=True))
+    for user_id in user_ids:
+        deletion.delete_user(user_id)
+        TaskTombstone.objects.filter(user_id=user_id).delete()
+    return len(user_ids)
@@ -0,0 +1,44 @@
+"""
+Модуль общих средств замеров производительности.
+
+Содержит:
+- git_commit: короткий хеш текущего коммита для отчетов и базовых замеров.
+- clear_caches: очистка кэшей процесса между замерами и тестами.
+
+Используется командой `run_loadtest`, микро-бенчмарками (`benchmarks`) и тестами.
+"""
+
+import subprocess
+
+from django.conf import settings
+from django.core.cache import caches
+
+from task_manager.throttling import get_bucket_store
+from users.authentication import user_state_cache
+
+
+def git_commit() -> str | None:
+    """
+    Возвращает короткий хеш текущего коммита или None вне git-репозитория.
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def clear_caches() -> None:
+    """
+    Очищает все кэши, кэш состояния пользователей аутентификации и корзины ограничения
+    частоты запросов.
+
+    Идентификаторы в тестовой базе повторяются после отката транзакций, поэтому
+    данные, закэшированные одним тестом или замером, не должны попадать в другой.
+    """
+    for cache in caches.all():
+        cache.clear()
+    user_state_cache.clear()
+    get_bucket_store().clear()
@@ -0,0 +1,81 @@
+"""
+Модуль полнотекстового поиска задач по названию и описанию.
+
+Индекс строится базой данных (миграция `0005_task_search`) и обновляется триггерами
+в той же транзакции, что и задача, поэтому учитывает любые пути записи:
+- SQLite: виртуальная таблица FTS5 `tasks_task_fts` с внешним содержимым (`content=tasks_task`),
+  токенизатор `unicode61` без учета регистра и диакритики.
+- PostgreSQL: GIN-индекс по выражению `to_tsvector('simple', title || ' ' || description)`.
+
+В индексе и в запросе `ё` заменяется на `е`, поэтому `отчёт` и `отчет` совпадают.
+
+На обеих базах используется одна семантика без стемминга: запрос разбивается на слова,
+задача подходит, если содержит все слова. Последнее слово запроса длиной от
+`MIN_PREFIX_LENGTH` символов может быть началом слова задачи (`отч` находит `отчет`), что
+удобно для поиска по мере ввода. Остальные слова ищутся целиком: поиск по префиксу
+объединяет списки всех слов с этим началом и стоит дороже точного совпадения.
+
+Содержит:
+- parse_terms: слова поискового запроса.
+- search_filter: условие `Q` для фильтрации задач по запросу.
+"""
+
+import re
+
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+MAX_TERMS = 10
+MIN_PREFIX_LENGTH = 3
+
+SQLITE_MATCH = 'SELECT rowid FROM tasks_task_fts WHERE tasks_task_fts MATCH %s'
+# Выражение должно совпадать с выражением индекса `task_search_idx`, иначе индекс не используется.
+POSTGRES_MATCH = (
+    "SELECT id FROM tasks_task "
+    "WHERE to_tsvector('simple'::regconfig, translate(title || ' ' || description, 'ёЁ', 'еЕ')) "
+    "@@ to_tsquery('simple'::regconfig, %s)"
+)
+
+
+def parse_terms(query: str) -> list:
+    """
+    Возвращает слова поискового запроса.
+
+    Из запроса берутся только буквенно-цифровые слова, поэтому синтаксис FTS5 и tsquery
+    (кавычки, операторы, скобки) не может попасть в запрос к базе.
+
+    Args:
+        query (str): Строка поиска от пользователя.
+
+    Returns:
+        list: Не более `MAX_TERMS` уникальных слов в нижнем регистре с `ё`, замененной на `е`.
+    """
+    return list(dict.fromkeys(re.findall(r'\w+', query.lower().replace('ё', 'е'))))[:MAX_TERMS]
+
+
+def search_filter(query: str, using: str = 'default') -> Q:
+    """
+    Возвращает условие для отбора задач, подходящих под поисковый запрос.
+
+    Условие — подзапрос идентификаторов из полнотекстового индекса, поэтому его можно
+    сочетать с любыми другими фильтрами и сортировкой (например, курсорной пагинацией).
+
+    Args:
+        query (str): Строка поиска от пользователя.
+        using (str): Псевдоним базы данных, к которой относится запрос.
+
+    Returns:
+        Q: Условие фильтрации; для запроса без слов — условие, которому не подходит ни одна задача.
+    """
+    terms = parse_terms(query)
+    if not terms:
+        return Q(pk__in=[])
+    prefix = len(terms[-1]) >= MIN_PREFIX_LENGTH
+    if connections[using].vendor == 'postgresql':
+        words = [*terms[:-1], f'{terms[-1]}:*' if prefix else terms[-1]]
+        return Q(id__in=RawSQL(POSTGRES_MATCH, [' & '.join(words)]))
+    words = [f'"{term}"' for term in terms]
+    if prefix:
+        words[-1] += '*'
+    return Q(id__in=RawSQL(SQLITE_MATCH, [' '.join(words)]))
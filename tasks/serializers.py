@@ -2,19 +2,102 @@
 Модуль сериализаторов для приложения Tasks.
 
 Содержит сериализатор TaskSerializer для преобразования модели Task
-в формат JSON и обратно, что используется в API.
+в формат JSON и обратно, что используется в API, и сериализатор JobSerializer
+для представления фоновых заданий (только чтение).
 """
 
 
+from django.utils import timezone
 from rest_framework import serializers
-from tasks.models import Task
+from tasks.models import Job, Task
 
 
 class TaskSerializer(serializers.ModelSerializer):
     """
     Сериализатор для модели задачи.
+
+    Принимает необязательный аргумент `fields` со списком полей, которые нужно
+    оставить в представлении (проекция полей для списков).
     """
 
     class Meta:
         model = Task
         fields = ['id', 'title', 'description', 'status', 'user']
+
+    def __init__(self, *args, fields: list = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class TaskListSerializer(serializers.ListSerializer):
+    """
+    Списочный сериализатор задач, сохраняющий все элементы пакетными запросами.
+
+    Создание выполняется одним `bulk_create`, обновление — одним `bulk_update`
+    (экземпляры передаются в `instance` в том же порядке, что и данные).
+    `bulk_update` не заполняет `auto_now`, поэтому `updated_at` обновляется явно.
+    """
+
+    def create(self, validated_data: list) -> list:
+        """
+        Создает задачи одним пакетным запросом.
+
+        Args:
+            validated_data (list): Проверенные данные задач.
+
+        Returns:
+            list: Созданные задачи с заполненными идентификаторами.
+        """
+        return Task.objects.bulk_create([Task(**attrs) for attrs in validated_data])
+
+    def update(self, instances: list, validated_data: list) -> list:
+        """
+        Обновляет задачи одним пакетным запросом.
+
+        Args:
+            instances (list): Задачи в порядке следования данных.
+            validated_data (list): Проверенные данные задач.
+
+        Returns:
+            list: Обновленные задачи.
+        """
+        fields = set()
+        for instance, attrs in zip(instances, validated_data):
+            for name, value in attrs.items():
+                setattr(instance, name, value)
+            fields.update(attrs)
+        if fields:
+            now = timezone.now()
+            for instance in instances:
+                instance.updated_at = now
+            Task.objects.bulk_update(instances, sorted(fields | {'updated_at'}))
+        return instances
+
+
+class TaskBulkSerializer(TaskSerializer):
+    """
+    Сериализатор задачи для пакетных операций.
+
+    Владелец задачи не проверяется для каждого элемента отдельным запросом,
+    а назначается текущим пользователем при сохранении.
+    """
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+
+    class Meta(TaskSerializer.Meta):
+        list_serializer_class = TaskListSerializer
+
+
+class JobSerializer(serializers.ModelSerializer):
+    """
+    Сериализатор фонового задания для эндпоинтов статуса заданий.
+    """
+
+    class Meta:
+        model = Job
+        fields = [
+            'id', 'kind', 'status', 'attempts', 'max_attempts', 'progress', 'result', 'error',
+            'created_at', 'updated_at', 'finished_at',
+        ]
+        read_only_fields = fields
@@ -0,0 +1,50 @@
+"""
+Модуль обработчиков сигналов для приложения Tasks.
+
+Содержит обработчики сигналов `post_save` и `post_delete` модели Task, которые
+инвалидируют кэш списка задач владельца при любом изменении задачи: через API,
+админку или ORM. Пакетные операции (`bulk_create`, `bulk_update`) сигналы не
+отправляют и инвалидируют кэш явно.
+
+При удалении задачи (в том числе `QuerySet.delete()` и каскадном удалении владельца)
+создается отметка `TaskTombstone` для инкрементальной синхронизации клиентов.
+
+Удаление задач пользователя порциями (`tasks.deletion`) выполняет работу обработчиков из
+`BULK_DELETE_HANDLED` для всей порции сразу и поэтому обходится без загрузки задач.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from tasks.cache import invalidate_user_tasks
+from tasks.models import Task, TaskTombstone
+
+
+@receiver(post_save, sender=Task, dispatch_uid='tasks_invalidate_list_cache_on_save')
+def invalidate_list_cache_on_save(sender, instance: Task, using: str, **kwargs) -> None:
+    """
+    Инвалидирует кэш списка задач владельца после сохранения задачи.
+    """
+    invalidate_user_tasks(instance.user_id, using=using)
+
+
+@receiver(post_delete, sender=Task, dispatch_uid='tasks_invalidate_list_cache_on_delete')
+def invalidate_list_cache_on_delete(sender, instance: Task, using: str, **kwargs) -> None:
+    """
+    Инвалидирует кэш списка задач владельца после удаления задачи.
+    """
+    invalidate_user_tasks(instance.user_id, using=using)
+
+
+@receiver(post_delete, sender=Task, dispatch_uid='tasks_record_tombstone_on_delete')
+def record_tombstone_on_delete(sender, instance: Task, using: str, **kwargs) -> None:
+    """
+    Создает отметку об удалении задачи для синхронизации клиентов.
+    """
+    TaskTombstone.objects.using(using).create(task_id=instance.pk, user_id=instance.user_id)
+
+
+# Обработчики удаления, которые пакетное удаление (`tasks.deletion`) заменяет собственной
+# пакетной записью отметок и инвалидацией кэша. Другие получатели сигналов удаления задач
+# возвращают удаление к сборщику Django.
+BULK_DELETE_HANDLED = (invalidate_list_cache_on_delete, record_tombstone_on_delete)
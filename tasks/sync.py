@@ -0,0 +1,153 @@
+"""
+Модуль инкрементальной синхронизации задач.
+
+Содержит:
+- SyncCursor: позиция в потоке изменений задач пользователя.
+- CursorExpired: курсор старше срока хранения отметок об удалении.
+- encode_cursor / decode_cursor: преобразование курсора в непрозрачную строку и обратно.
+- get_changes: страница изменений (измененные и удаленные задачи) после курсора.
+
+Поток изменений упорядочен по `(момент изменения, id задачи)`: для существующих задач
+это `Task.updated_at`, для удаленных — `TaskTombstone.deleted_at`. Оба источника
+читаются по индексам `(user, updated_at, id)` и `(user_id, deleted_at, task_id)`,
+поэтому стоимость синхронизации зависит от числа изменений, а не от числа задач.
+
+Запись, начатая раньше, может быть зафиксирована позже записи с большим моментом
+изменения. Поэтому на последней странице курсор не продвигается дальше
+`now - TASK_SYNC_LAG_SECONDS`: изменения из этого окна придут повторно, и клиент
+применяет их идемпотентно (по `id`), но не пропускает.
+"""
+
+import base64
+import binascii
+import heapq
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from tasks.models import Task, TaskTombstone
+
+
+class CursorExpired(Exception):
+    """
+    Исключение для курсора, изменения после которого уже не могут быть восстановлены.
+    """
+
+
+@dataclass(frozen=True, order=True)
+class SyncCursor:
+    """
+    Позиция в потоке изменений.
+
+    Attributes:
+        moment (datetime): Момент изменения последнего полученного элемента.
+        task_id (int): Идентификатор задачи последнего полученного элемента;
+            0 — все изменения в момент `moment` еще не получены.
+    """
+    moment: datetime
+    task_id: int = 0
+
+
+def encode_cursor(cursor: SyncCursor) -> str:
+    """
+    Возвращает курсор в виде непрозрачной строки для клиента.
+    """
+    raw = f'{cursor.moment.isoformat()}|{cursor.task_id}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(value: str) -> SyncCursor:
+    """
+    Разбирает курсор, полученный от клиента.
+
+    Args:
+        value (str): Строка из `encode_cursor`.
+
+    Returns:
+        SyncCursor: Позиция в потоке изменений.
+
+    Raises:
+        ValueError: Курсор поврежден.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(value + '=' * (-len(value) % 4)).decode()
+        moment, task_id = raw.split('|')
+        cursor = SyncCursor(datetime.fromisoformat(moment), int(task_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise ValueError('Некорректный курсор.') from error
+    if timezone.is_naive(cursor.moment):
+        raise ValueError('Некорректный курсор.')
+    return cursor
+
+
+def _after(cursor: SyncCursor, moment_field: str, id_field: str) -> Q:
+    # Диапазон по индексу (`>=`) с исключением уже полученных элементов в момент курсора.
+    return Q(**{f'{moment_field}__gte': cursor.moment}) & ~Q(
+        **{moment_field: cursor.moment, f'{id_field}__lte': cursor.task_id}
+    )
+
+
+def get_changes(user_id: int, cursor: SyncCursor | None, fields: list, limit: int) -> dict:
+    """
+    Возвращает страницу изменений задач пользователя после курсора.
+
+    Без курсора возвращаются все существующие задачи (первичная загрузка) без отметок
+    об удалении.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+        cursor (SyncCursor | None): Позиция, после которой нужны изменения.
+        fields (list): Поля задач в ответе (`updated_at` добавляется всегда).
+        limit (int): Максимальное число элементов страницы.
+
+    Returns:
+        dict: `changed` — задачи, `deleted` — идентификаторы удаленных задач,
+        `cursor` — курсор для следующего запроса, `has_more` — есть ли еще изменения.
+
+    Raises:
+        CursorExpired: Курсор старше срока хранения отметок об удалении; нужна полная загрузка.
+    """
+    now = timezone.now()
+    if cursor is not None and cursor.moment < now - timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS):
+        raise CursorExpired('Курсор устарел, выполните полную синхронизацию без параметра since.')
+
+    tasks = Task.objects.filter(user_id=user_id).order_by('updated_at', 'id')
+    if cursor is not None:
+        tasks = tasks.filter(_after(cursor, 'updated_at', 'id'))
+    changed = (
+        (row['updated_at'], row['id'], row)
+        for row in tasks.values(*dict.fromkeys([*fields, 'id', 'updated_at']))[:limit + 1]
+    )
+    streams = [changed]
+    if cursor is not None:
+        tombstones = (
+            TaskTombstone.objects.filter(user_id=user_id).filter(_after(cursor, 'deleted_at', 'task_id'))
+            .order_by('deleted_at', 'task_id').values_list('deleted_at', 'task_id')[:limit + 1]
+        )
+        streams.append((moment, task_id, None) for moment, task_id in tombstones)
+
+    items = list(heapq.merge(*streams, key=lambda item: item[:2]))
+    has_more = len(items) > limit
+    items = items[:limit]
+
+    position = SyncCursor(*items[-1][:2]) if items else cursor
+    if not has_more:
+        # Окно, в котором еще могут фиксироваться более ранние записи, будет прочитано повторно.
+        horizon = SyncCursor(now - timedelta(seconds=settings.TASK_SYNC_LAG_SECONDS))
+        position = min(position, horizon) if position is not None else horizon
+        if cursor is not None:
+            position = max(position, cursor)
+
+    requested = set(fields)
+    return {
+        'changed': [
+            {name: value for name, value in row.items() if name in requested or name == 'updated_at'}
+            for _, _, row in items if row is not None
+        ],
+        'deleted': [task_id for _, task_id, row in items if row is None],
+        'cursor': encode_cursor(position),
+        'has_more': has_more,
+    }
@@ -0,0 +1,29 @@
+"""
+Точка входа процесса воркера очереди фоновых заданий (см. `tasks.jobs`).
+
+Процессы запускаются командой `run_workers` методом spawn: дочерний процесс импортирует
+этот модуль до настройки Django, поэтому модуль не импортирует модели на верхнем уровне.
+"""
+
+import signal
+
+import django
+
+
+def worker_process(stop, once: bool) -> None:
+    """
+    Настраивает Django и выполняет задания до установки события остановки.
+
+    SIGINT игнорируется (его получает вся группа процессов терминала), SIGTERM
+    останавливает воркер после текущего задания; остановкой управляет родительский процесс.
+
+    Args:
+        stop (Event): Общее для процессов событие остановки.
+        once (bool): Завершиться, когда доступных заданий не останется.
+    """
+    django.setup()
+    from tasks.jobs import run_worker
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    run_worker(stop, once)
@@ -0,0 +1,25 @@
+"""
+Общие фикстуры pytest для тестов проекта Task Manager.
+"""
+
+import pytest
+from tasks import perfutils
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Очищает кэши процесса перед каждым тестом (см. `tasks.perfutils.clear_caches`).
+    """
+    perfutils.clear_caches()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def raise_on_query_budget(settings):
+    """
+    Включает исключение при превышении бюджета SQL-запросов (`QUERY_BUDGET_RAISE`).
+
+    Вне тестов превышение только пишется в журнал, а в тестах должно проваливать тест.
+    """
+    settings.QUERY_BUDGET_RAISE = True
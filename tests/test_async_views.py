@@ -0,0 +1,182 @@
+"""
+Модуль тестов асинхронных представлений задач и генератора нагрузки.
+
+Содержит тесты для проверки:
+- Получения страницы списка, отдельной задачи и создания задачи через асинхронные эндпоинты.
+- Совпадения формата ответа с синхронным `TaskViewSet` и обхода списка по курсорам `next` и `previous`.
+- Выбора throttle-классов по текущим настройкам при каждом запросе.
+- Аутентификации по JWT и изоляции задач между пользователями.
+- Одновременной обработки нескольких запросов в одном событийном цикле.
+- Расчета перцентилей и сводки нагрузочного прогона.
+"""
+
+
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from tasks.loadtest import LoadResult, percentile
+from tasks.models import Task
+from users.authentication import add_user_claims
+from users.models import User
+
+from tests.utils import create_tasks
+
+
+def bearer(user: User) -> dict:
+    """
+    Возвращает заголовок Authorization с access-токеном пользователя.
+    """
+    token = AccessToken.for_user(user)
+    add_user_claims(token, user)
+    return {'Authorization': f'Bearer {token}'}
+
+
+class AsyncTaskViewsTest(TestCase):
+    """
+    Тесты асинхронных эндпоинтов задач.
+    """
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="async@example.com", name="Async", password="password123")
+        self.headers = bearer(self.user)
+
+    async def test_list_matches_sync_format(self) -> None:
+        """
+        Тест того, что асинхронный список совпадает по содержимому с синхронным.
+        """
+        await sync_to_async(create_tasks)(self.user, 3)
+        response = await self.async_client.get('/api/async/tasks/', headers=self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        expected = await sync_to_async(client.get)('/api/tasks/')
+        self.assertEqual(response.json(), expected.json())
+
+    async def test_list_pagination(self) -> None:
+        """
+        Тест обхода списка вперед по курсорам `next` и назад по курсорам `previous`.
+        """
+        await sync_to_async(create_tasks)(self.user, 5)
+        pages, data = [], None
+        url = '/api/async/tasks/?page_size=2'
+        while url:
+            data = (await self.async_client.get(url, headers=self.headers)).json()
+            pages.append([task['id'] for task in data['results']])
+            url = data['next']
+        seen = [task_id for page in pages for task_id in page]
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(seen, sorted(seen))
+
+        backward = []
+        url = data['previous']
+        while url:
+            data = (await self.async_client.get(url, headers=self.headers)).json()
+            backward.insert(0, [task['id'] for task in data['results']])
+            url = data['previous']
+        self.assertEqual(backward, pages[:-1])
+        self.assertIsNotNone(data['next'])
+
+    @override_settings(REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        'DEFAULT_THROTTLE_CLASSES': (),
+        'DEFAULT_THROTTLE_RATES': {**settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'], 'user': '1/min'},
+    })
+    async def test_throttle_classes_follow_settings(self) -> None:
+        """
+        Тест того, что throttle-классы берутся из настроек на момент запроса.
+        """
+        for _ in range(3):
+            response = await self.async_client.get('/api/async/tasks/', headers=self.headers)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    async def test_invalid_cursor(self) -> None:
+        """
+        Тест ответа 404 на поврежденный курсор.
+        """
+        response = await self.async_client.get('/api/async/tasks/?cursor=broken', headers=self.headers)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_retrieve(self) -> None:
+        """
+        Тест получения своей задачи и отказа для чужой.
+        """
+        other = await sync_to_async(User.objects.create_user)(email="o@example.com", name="O", password="password123")
+        own = await Task.objects.acreate(user=self.user, title="Mine", description="x")
+        foreign = await Task.objects.acreate(user=other, title="Other", description="x")
+
+        response = await self.async_client.get(f'/api/async/tasks/{own.id}/', headers=self.headers)
+        self.assertEqual(response.json()['title'], "Mine")
+        response = await self.async_client.get(f'/api/async/tasks/{foreign.id}/', headers=self.headers)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_create(self) -> None:
+        """
+        Тест создания задачи от имени пользователя из токена.
+        """
+        response = await self.async_client.post(
+            '/api/async/tasks/', {"title": "Async", "description": "x", "status": "в процессе"},
+            content_type='application/json', headers=self.headers,
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['user'], self.user.id)
+        self.assertEqual(await Task.objects.filter(user=self.user, status='в процессе').acount(), 1)
+
+    async def test_create_validation(self) -> None:
+        """
+        Тест ошибок валидации при создании задачи.
+        """
+        response = await self.async_client.post(
+            '/api/async/tasks/', {"description": "x", "status": "удалена"},
+            content_type='application/json', headers=self.headers,
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.json()), {'title', 'status'})
+
+    async def test_requires_authentication(self) -> None:
+        """
+        Тест отказа без токена и с поврежденным токеном.
+        """
+        response = await self.async_client.get('/api/async/tasks/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = await self.async_client.get('/api/async/tasks/', headers={'Authorization': 'Bearer broken'})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_concurrent_requests(self) -> None:
+        """
+        Тест одновременной обработки запросов в одном событийном цикле.
+        """
+        await sync_to_async(create_tasks)(self.user, 3)
+        responses = await asyncio.gather(
+            *(self.async_client.get('/api/async/tasks/', headers=self.headers) for _ in range(20))
+        )
+        self.assertTrue(all(response.status_code == status.HTTP_200_OK for response in responses))
+
+
+class LoadResultTest(TestCase):
+    """
+    Тесты расчета сводки нагрузочного прогона.
+    """
+    def test_percentile(self) -> None:
+        """
+        Тест перцентилей по методу ближайшего ранга.
+        """
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([], 99), 0.0)
+
+    def test_summary(self) -> None:
+        """
+        Тест сводки: пропускная способность, доля ошибок и задержки в миллисекундах.
+        """
+        result = LoadResult(target='asgi', connections=10, duration=2.0, completed=8, errors=2,
+                            latencies=[0.01] * 8)
+        summary = result.summary()
+        self.assertEqual(summary['rps'], 4.0)
+        self.assertEqual(summary['error_rate'], 0.2)
+        self.assertEqual(summary['p99_ms'], 10.0)
@@ -0,0 +1,145 @@
+"""
+Модуль тестов JWT-аутентификации без запроса пользователя к базе данных.
+
+Содержит тесты для проверки:
+- Наличия claims состояния пользователя в выдаваемых токенах.
+- Выполнения `GET /api/tasks/` одним запросом к базе данных.
+- Отзыва токенов при деактивации и удалении пользователя.
+- Режима с TTL-кэшем состояния пользователей и срока, за который деактивация доходит до других воркеров.
+- Совместимости с токенами без claims состояния.
+"""
+
+
+import time
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from users.authentication import forget_user_state
+from users.models import User
+
+
+class StatelessJWTAuthenticationTest(TestCase):
+    """
+    Тесты аутентификации по claims токена.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="jwt@example.com", name="JWT", password="password123")
+
+    def _login(self) -> dict:
+        response = self.client.post('/api/token/', {"email": self.user.email, "password": "password123"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def _authorize(self, access: str) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+
+    def test_token_contains_user_state_claims(self) -> None:
+        """
+        Тест наличия claims `is_active` и `is_staff` в access- и refresh-токенах.
+        """
+        tokens = self._login()
+        access = AccessToken(tokens['access'])
+        self.assertIs(access['is_active'], True)
+        self.assertIs(access['is_staff'], False)
+        self.assertIs(RefreshToken(tokens['refresh'])['is_active'], True)
+
+    def test_task_list_costs_one_query(self) -> None:
+        """
+        Тест того, что список задач с JWT выполняется одним запросом, пока состояние пользователя
+        в кэше, и в режиме только claims (без загрузки пользователя).
+        """
+        self._authorize(self._login()['access'])
+        self.client.get('/api/tasks/')
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/tasks/?status=новая')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with override_settings(STATELESS_JWT={'USER_STATE_TTL': 0}):
+            with self.assertNumQueries(1):
+                response = self.client.get('/api/tasks/?status=завершена')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_deactivation_in_other_worker_expires_with_ttl(self) -> None:
+        """
+        Тест того, что деактивация без отзыва в этом процессе (в другом воркере) действует
+        не позже чем через USER_STATE_TTL.
+        """
+        self._authorize(self._login()['access'])
+        self.assertEqual(self.client.get('/api/tasks/').status_code, status.HTTP_200_OK)
+
+        # Другой воркер деактивировал пользователя: сигналы этого процесса не сработали.
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertEqual(self.client.get('/api/tasks/').status_code, status.HTTP_200_OK)
+        with mock.patch('users.authentication.time.monotonic', return_value=time.monotonic() + 31):
+            self.assertEqual(self.client.get('/api/tasks/').status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_created_task_belongs_to_token_user(self) -> None:
+        """
+        Тест создания задачи от имени пользователя из токена.
+        """
+        self._authorize(self._login()['access'])
+        task_data = {"title": "T", "description": "D", "user": self.user.id}
+        response = self.client.post('/api/tasks/', task_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.user.tasks.count(), 1)
+
+    def test_deactivation_revokes_tokens(self) -> None:
+        """
+        Тест отзыва выданных токенов при деактивации пользователя.
+        """
+        tokens = self._login()
+        self._authorize(tokens['access'])
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get('/api/tasks/').status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.credentials()
+        response = self.client.post('/api/token/refresh/', {"refresh": tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deletion_revokes_tokens(self) -> None:
+        """
+        Тест отзыва выданных токенов при удалении пользователя.
+        """
+        self._authorize(self._login()['access'])
+        self.user.delete()
+        self.assertEqual(self.client.get('/api/tasks/').status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_refresh_embeds_current_state(self) -> None:
+        """
+        Тест того, что обновленный access-токен содержит актуальное состояние пользователя.
+        """
+        tokens = self._login()
+        User.objects.filter(pk=self.user.pk).update(is_staff=True)
+        response = self.client.post('/api/token/refresh/', {"refresh": tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIs(AccessToken(response.data['access'])['is_staff'], True)
+
+    def test_token_without_claims_loads_user(self) -> None:
+        """
+        Тест того, что токен без claims состояния проверяется с загрузкой пользователя из базы.
+        """
+        self._authorize(str(AccessToken.for_user(self.user)))
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/tasks/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(STATELESS_JWT={'USER_STATE_TTL': 60})
+    def test_user_state_ttl_cache(self) -> None:
+        """
+        Тест режима с TTL-кэшем: состояние пользователя читается из базы один раз за TTL.
+        """
+        self._authorize(self._login()['access'])
+        with self.assertNumQueries(2):
+            self.client.get('/api/tasks/')
+        with self.assertNumQueries(0):
+            self.client.get('/api/tasks/')
+
+        # Изменение, не прошедшее через сигналы, видно после сброса состояния хуком.
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        forget_user_state(self.user.pk)
+        self.assertEqual(self.client.get('/api/tasks/').status_code, status.HTTP_403_FORBIDDEN)
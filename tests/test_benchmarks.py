@@ -0,0 +1,66 @@
+"""
+Модуль тестов средств микро-бенчмарков.
+
+Содержит тесты для проверки:
+- Замера времени вызова с калибровкой числа вызовов.
+- Обнаружения регрессии относительно базовых замеров с учетом порога.
+- Сохранения базовых замеров с сохранением замеров других бенчмарков.
+"""
+
+
+import json
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+
+from benchmarks.utils import BenchmarkSession, measure
+
+
+class BenchmarkSessionTest(SimpleTestCase):
+    """
+    Тесты замеров и сравнения с базовыми замерами.
+    """
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'baseline.json')
+        with open(self.path, 'w', encoding='utf-8') as file:
+            json.dump({'meta': {'commit': 'abc1234'}, 'benchmarks': {
+                'fast': {'median_us': 10.0}, 'other': {'median_us': 5.0},
+            }}, file)
+
+    def test_measure(self) -> None:
+        """
+        Тест результата замера: вызовов в раунде достаточно для длительности раунда.
+        """
+        result = measure(lambda: sum(range(100)), rounds=3)
+        self.assertEqual(result['rounds'], 3)
+        self.assertGreater(result['iterations'], 1)
+        self.assertLessEqual(result['min_us'], result['median_us'])
+
+    def test_regression(self) -> None:
+        """
+        Тест регрессии только при росте медианы сверх порога и без нее для новых бенчмарков.
+        """
+        session = BenchmarkSession(self.path, threshold=0.25)
+        self.assertEqual(session.meta['commit'], 'abc1234')
+        self.assertIsNone(session.record('fast', {'median_us': 12.0}))
+        self.assertIn('+30.0%', session.record('fast', {'median_us': 13.0}))
+        self.assertIsNone(session.record('new', {'median_us': 100.0}))
+        self.assertIsNone(session.change('new'))
+
+        saving = BenchmarkSession(self.path, threshold=0.25, save=True)
+        self.assertIsNone(saving.record('fast', {'median_us': 13.0}))
+
+    def test_write_baseline(self) -> None:
+        """
+        Тест записи базовых замеров: новые результаты заменяют старые, прочие сохраняются.
+        """
+        session = BenchmarkSession(self.path, save=True)
+        session.record('fast', {'median_us': 8.0})
+        session.write_baseline('def5678')
+
+        reloaded = BenchmarkSession(self.path)
+        self.assertEqual(reloaded.meta['commit'], 'def5678')
+        self.assertEqual(reloaded.baseline, {'fast': {'median_us': 8.0}, 'other': {'median_us': 5.0}})
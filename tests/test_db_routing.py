@@ -0,0 +1,111 @@
+"""
+Модуль тестов маршрутизации чтения в реплику базы данных.
+
+Основную базу и реплику представляют два локальных алиаса SQLite (`default` и `replica`);
+данные в них независимы, поэтому по содержимому ответа видно, из какой базы он прочитан.
+
+Содержит тесты для проверки:
+- Чтения списков и отдельных задач из реплики.
+- Записи только в основную базу.
+- Чтения собственных записей в том же запросе и в течение времени закрепления (cookie).
+- Чтения из основной базы, когда реплики не настроены.
+"""
+
+
+import json
+
+from django.db import connections
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from task_manager.db_routers import PrimaryReplicaRouter, RoutingState, _state
+from tasks.models import Task
+from users.models import User
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRoutingTest(TestCase):
+    """
+    Тесты маршрутизации API при настроенной реплике.
+    """
+    databases = {'default', 'replica'}
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="replica@example.com", name="Replica", password="password123")
+        self.client.force_authenticate(user=self.user)
+        User.objects.using('replica').create(id=self.user.id, email=self.user.email, name=self.user.name)
+        self.primary_task = Task.objects.create(user=self.user, title="Primary", description="x")
+        self.replica_task = Task.objects.using('replica').create(user_id=self.user.id, title="Replica", description="x")
+
+    def _titles(self, response) -> list:
+        return [task['title'] for task in response.data['results']]
+
+    def test_reads_from_replica(self) -> None:
+        """
+        Тест того, что список, задача и выгрузка читаются из реплики.
+        """
+        with CaptureQueriesContext(connections['default']) as primary:
+            self.assertEqual(self._titles(self.client.get('/api/tasks/')), ["Replica"])
+            response = self.client.get(f'/api/tasks/{self.replica_task.id}/')
+            self.assertEqual(response.data['title'], "Replica")
+            response = self.client.get('/api/tasks/export/')
+            rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual([row['title'] for row in rows], ["Replica"])
+        self.assertEqual(len(primary), 0)
+
+    def test_writes_go_to_primary(self) -> None:
+        """
+        Тест записи в основную базу и закрепления чтения за ней после записи.
+        """
+        task_data = {"title": "New", "description": "x", "user": self.user.id}
+        response = self.client.post('/api/tasks/', task_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Task.objects.using('default').filter(title="New").exists())
+        self.assertFalse(Task.objects.using('replica').filter(title="New").exists())
+        self.assertIn('db_primary_pin', response.cookies)
+
+        # Следующий запрос клиента с cookie закрепления видит собственную запись.
+        self.assertEqual(self._titles(self.client.get('/api/tasks/')), ["Primary", "New"])
+
+        # Без cookie (по истечении времени закрепления) чтение снова идет в реплику;
+        # другой URL, чтобы страница не была взята из кэша списка.
+        self.client.cookies.clear()
+        self.assertEqual(self._titles(self.client.get('/api/tasks/?page_size=10')), ["Replica"])
+
+    def test_pin_within_request(self) -> None:
+        """
+        Тест того, что после записи в рамках запроса чтение этого запроса идет в основную базу.
+        """
+        router = PrimaryReplicaRouter()
+        token = _state.set(RoutingState(replica_reads=True))
+        try:
+            self.assertEqual(router.db_for_read(Task), 'replica')
+            self.assertEqual(router.db_for_write(Task), 'default')
+            self.assertEqual(router.db_for_read(Task), 'default')
+        finally:
+            _state.reset(token)
+
+    def test_outside_request_reads_primary(self) -> None:
+        """
+        Тест того, что вне запроса (команды, фоновые задачи) чтение идет в основную базу.
+        """
+        self.assertEqual(PrimaryReplicaRouter().db_for_read(Task), 'default')
+        self.assertEqual(list(Task.objects.values_list('title', flat=True)), ["Primary"])
+
+
+class NoReplicaRoutingTest(TestCase):
+    """
+    Тесты маршрутизации без настроенных реплик.
+    """
+    def test_reads_from_primary(self) -> None:
+        """
+        Тест того, что без реплик чтение идет в основную базу, а cookie закрепления не ставится.
+        """
+        client = APIClient()
+        user = User.objects.create_user(email="single@example.com", name="Single", password="password123")
+        client.force_authenticate(user=user)
+        response = client.post('/api/tasks/', {"title": "Only", "description": "x", "user": user.id}, format='json')
+        self.assertNotIn('db_primary_pin', response.cookies)
+        self.assertEqual(client.get('/api/tasks/').data['results'][0]['title'], "Only")
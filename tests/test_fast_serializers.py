@@ -0,0 +1,175 @@
+"""
+Модуль тестов быстрого пути сериализации списков и рендерера на orjson.
+
+Содержит тесты для проверки:
+- Побайтного совпадения ответов списков задач и пользователей с обычной сериализацией,
+  в том числе с проекцией полей, сортировкой и переходом по курсору.
+- Совпадения вывода `FastJSONRenderer` с `JSONRenderer` DRF.
+- Неприменимости быстрого пути к сериализаторам с вычисляемыми полями.
+- Ускорения построения ответа по сравнению с `ModelSerializer`.
+"""
+
+
+import datetime
+import decimal
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import TestCase
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from tasks.models import Task
+from users.models import User
+from users.renderers import FastJSONRenderer
+from users.serializers import TaskSerializer, get_values_fields
+from users.views import TaskViewSet, UserViewSet
+
+from tests.utils import create_tasks, median_duration
+
+
+class FastListPathTest(TestCase):
+    """
+    Тесты совпадения ответов быстрого и обычного пути списков.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="fast@example.com", name="Быстрый", password="password123")
+        self.client.force_authenticate(user=self.user)
+        create_tasks(self.user, 3, status='завершена', title='Задача "в кавычках"')
+        create_tasks(self.user, 4, status='новая', description='Строка\u2028с разделителем')
+
+    def _both(self, viewset, url: str) -> tuple[bytes, bytes]:
+        caches['task_lists'].clear()
+        fast = self.client.get(url)
+        caches['task_lists'].clear()
+        with mock.patch.object(viewset, 'values_list_fast_path', False):
+            slow = self.client.get(url)
+        self.assertEqual(fast.status_code, 200)
+        return fast.content, slow.content
+
+    def test_task_list_identical(self) -> None:
+        """
+        Тест побайтного совпадения списка задач с разными параметрами.
+        """
+        for url in (
+            '/api/tasks/',
+            '/api/tasks/?page_size=2',
+            '/api/tasks/?fields=title,id',
+            '/api/tasks/?ordering=-status&page_size=3',
+            '/api/tasks/?fields=id&ordering=title&page_size=2',
+            '/api/tasks/?status=новая',
+        ):
+            with self.subTest(url=url):
+                fast, slow = self._both(TaskViewSet, url)
+                self.assertEqual(fast, slow)
+
+    def test_cursor_pages_identical(self) -> None:
+        """
+        Тест совпадения страниц при переходе по курсору `next`.
+        """
+        url = '/api/tasks/?ordering=status&page_size=2'
+        while url:
+            fast, slow = self._both(TaskViewSet, url)
+            self.assertEqual(fast, slow)
+            url = self.client.get(url).json()['next']
+
+    def test_user_list_identical(self) -> None:
+        """
+        Тест побайтного совпадения списка пользователей; пароль не выводится.
+        """
+        fast, slow = self._both(UserViewSet, '/api/users/')
+        self.assertEqual(fast, slow)
+        self.assertNotIn(b'password', fast)
+
+    def test_list_skips_model_instances(self) -> None:
+        """
+        Тест того, что быстрый путь не создает экземпляры модели.
+        """
+        with mock.patch.object(Task, '__init__', side_effect=AssertionError('model instantiated')):
+            response = self.client.get('/api/tasks/')
+        self.assertEqual(len(response.json()['results']), 7)
+
+
+class GetValuesFieldsTest(TestCase):
+    """
+    Тесты выбора полей для быстрого пути.
+    """
+    def test_plain_fields(self) -> None:
+        """
+        Тест полей задачи и проекции полей.
+        """
+        self.assertEqual(get_values_fields(TaskSerializer()), ['id', 'title', 'description', 'status', 'user'])
+        self.assertEqual(get_values_fields(TaskSerializer(fields=['id', 'title'])), ['id', 'title'])
+
+    def test_computed_field_disables_fast_path(self) -> None:
+        """
+        Тест того, что вычисляемое поле отключает быстрый путь.
+        """
+        class ComputedTaskSerializer(TaskSerializer):
+            upper_title = serializers.SerializerMethodField()
+
+            class Meta(TaskSerializer.Meta):
+                fields = TaskSerializer.Meta.fields + ['upper_title']
+
+            def get_upper_title(self, task) -> str:
+                return task.title.upper()
+
+        self.assertIsNone(get_values_fields(ComputedTaskSerializer()))
+
+
+class FastJSONRendererTest(TestCase):
+    """
+    Тесты совпадения вывода FastJSONRenderer и JSONRenderer.
+    """
+    def test_identical_output(self) -> None:
+        """
+        Тест совпадения для Unicode, разделителей строк, дат, Decimal и вложенных структур.
+        """
+        data = {
+            'title': 'Задача \u2028\u2029 "кавычки" \\ \n',
+            'when': datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.timezone.utc),
+            'day': datetime.date(2024, 5, 1),
+            'amount': decimal.Decimal('1.50'),
+            'items': [1, True, None, {'nested': []}],
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indent_falls_back(self) -> None:
+        """
+        Тест того, что при запросе отступа используется рендерер DRF.
+        """
+        data = {'id': 1}
+        context = {'indent': 2}
+        self.assertEqual(FastJSONRenderer().render(data, renderer_context=context),
+                         JSONRenderer().render(data, renderer_context=context))
+
+    def test_big_integers_fall_back(self) -> None:
+        """
+        Тест того, что целые больше 64 бит кодируются рендерером DRF.
+        """
+        data = {'id': 2 ** 70}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+
+class FastListBenchmarkTest(TestCase):
+    """
+    Тест ускорения построения ответа списка.
+    """
+    def test_speedup(self) -> None:
+        """
+        Тест того, что быстрый путь строит ответ на 2000 задач минимум в 2 раза быстрее.
+        """
+        user = User.objects.create_user(email="bench@example.com", name="Bench", password="password123")
+        create_tasks(user, 2000)
+        queryset = Task.objects.filter(user=user).order_by('id')
+        fields = get_values_fields(TaskSerializer())
+
+        def serializer_path() -> bytes:
+            return JSONRenderer().render(TaskSerializer(queryset, many=True).data)
+
+        def fast_path() -> bytes:
+            return FastJSONRenderer().render(list(queryset.values(*fields)))
+
+        self.assertEqual(serializer_path(), fast_path())
+        self.assertGreater(median_duration(serializer_path, 7) / median_duration(fast_path, 7), 2)
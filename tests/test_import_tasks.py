@@ -0,0 +1,139 @@
+"""
+Модуль тестов команды загрузки задач `import_tasks`.
+
+Содержит тесты для проверки:
+- Загрузки задач из NDJSON и CSV с сопоставлением email пользователей.
+- Пропуска некорректных строк и строгого режима.
+- Одного запроса пользователей на порцию и пакетной вставки.
+- Сброса кэша списков задач после загрузки.
+"""
+
+
+import io
+import json
+import os
+import tempfile
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from rest_framework.test import APIClient
+from tasks.importer import import_tasks, read_rows
+from tasks.models import Task
+from users.models import User
+
+
+def ndjson(rows: list) -> io.StringIO:
+    """
+    Возвращает файл NDJSON в памяти.
+    """
+    return io.StringIO(''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows))
+
+
+class ImportTasksTest(TestCase):
+    """
+    Тесты потоковой загрузки задач.
+    """
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="import@example.com", name="Import", password="password123")
+        self.other = User.objects.create_user(email="other@example.com", name="Other", password="password123")
+
+    def _call(self, path: str, *args) -> tuple[str, str]:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command('import_tasks', path, *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def _write(self, suffix: str, content: str) -> str:
+        file = tempfile.NamedTemporaryFile('w', suffix=suffix, encoding='utf-8', delete=False)
+        with file:
+            file.write(content)
+        self.addCleanup(os.unlink, file.name)
+        return file.name
+
+    def test_ndjson(self) -> None:
+        """
+        Тест загрузки NDJSON с назначением задач пользователям по email.
+        """
+        path = self._write('.ndjson', ndjson([
+            {"title": "A", "description": "x", "status": "завершена", "user": "import@example.com"},
+            {"title": "B", "user": "other@EXAMPLE.com"},
+        ]).getvalue())
+        stdout, _stderr = self._call(path)
+        self.assertIn('Создано задач: 2', stdout)
+        self.assertEqual(self.user.tasks.get().status, 'завершена')
+        self.assertEqual(self.other.tasks.get().status, 'новая')
+
+    def test_csv(self) -> None:
+        """
+        Тест загрузки CSV; формат определяется по расширению.
+        """
+        path = self._write('.csv', 'title,description,status,user\n"A, B",desc,в процессе,import@example.com\n')
+        self._call(path)
+        task = self.user.tasks.get()
+        self.assertEqual((task.title, task.status), ("A, B", 'в процессе'))
+
+    def test_invalid_rows_are_skipped(self) -> None:
+        """
+        Тест пропуска некорректных строк с указанием номеров строк.
+        """
+        path = self._write('.ndjson', '\n'.join([
+            json.dumps({"title": "ok", "user": "import@example.com"}),
+            'not json',
+            json.dumps({"title": "", "user": "import@example.com"}),
+            json.dumps({"title": "bad", "status": "удалена", "user": "import@example.com"}),
+            json.dumps({"title": "nobody", "user": "missing@example.com"}),
+        ]))
+        stdout, stderr = self._call(path)
+        self.assertIn('Создано задач: 1, пропущено строк: 4', stdout)
+        for line_number in (2, 3, 4, 5):
+            self.assertIn(f'Строка {line_number}:', stderr)
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_non_string_values_are_skipped(self) -> None:
+        """
+        Тест пропуска строк NDJSON, в которых поля не являются строками.
+        """
+        rows = [
+            {"title": 123, "user": "import@example.com"},
+            {"title": "user", "user": 5},
+            {"title": "status", "status": ["новая"], "user": "import@example.com"},
+            {"title": "description", "description": {"text": "x"}, "user": "import@example.com"},
+            {"title": "ok", "description": None, "user": "import@example.com"},
+        ]
+        stdout, stderr = self._call(self._write('.ndjson', ndjson(rows).getvalue()))
+        self.assertIn('Создано задач: 1, пропущено строк: 4', stdout)
+        for line_number, field in ((1, 'title'), (2, 'user'), (3, 'status'), (4, 'description')):
+            self.assertIn(f'Строка {line_number}: Поле {field} должно быть строкой.', stderr)
+        self.assertEqual(self.user.tasks.get().description, '')
+
+    def test_strict(self) -> None:
+        """
+        Тест строгого режима: загрузка останавливается, уже загруженные порции сохраняются.
+        """
+        rows = [{"title": f"T{i}", "user": "import@example.com"} for i in range(4)]
+        rows.append({"title": "bad", "status": "удалена", "user": "import@example.com"})
+        path = self._write('.ndjson', ndjson(rows).getvalue())
+        with self.assertRaisesMessage(CommandError, 'Строка 5'):
+            self._call(path, '--strict', '--chunk-size', '2')
+        self.assertEqual(Task.objects.count(), 4)
+
+    def test_one_user_query_per_chunk(self) -> None:
+        """
+        Тест того, что порция загружается одним запросом пользователей и пакетной вставкой.
+        """
+        rows = [{"title": f"T{i}", "user": ("import@example.com", "other@example.com")[i % 2]} for i in range(400)]
+        # На порцию: запрос пользователей, две пачки вставки и точки сохранения транзакции.
+        with self.assertNumQueries(10):
+            result = import_tasks(read_rows(ndjson(rows), 'ndjson'), chunk_size=200, batch_size=100)
+        self.assertEqual(result.created, 400)
+        self.assertEqual(self.user.tasks.count(), 200)
+
+    def test_invalidates_list_cache(self) -> None:
+        """
+        Тест того, что после загрузки список задач пользователя не отдается из устаревшего кэша.
+        """
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        self.assertEqual(client.get('/api/tasks/').data['results'], [])
+        import_tasks(read_rows(ndjson([{"title": "New", "user": "import@example.com"}]), 'ndjson'))
+        self.assertEqual(len(client.get('/api/tasks/').data['results']), 1)
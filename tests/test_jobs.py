@@ -0,0 +1,171 @@
+"""
+Модуль тестов очереди фоновых заданий.
+
+Содержит тесты для проверки:
+- Захвата задания одним воркером и его скрытия на время аренды.
+- Повторного выполнения задания после окончания аренды и защиты результата от воркера,
+  потерявшего аренду.
+- Повторов с экспоненциальной задержкой и завершения ошибкой после исчерпания попыток.
+- Сохранения прогресса с продлением аренды.
+- Отложенного удаления пользователя (`?async=true`): ответа 202, деактивации пользователя,
+  выполнения командой `run_workers` и статуса задания в `/api/jobs/<id>/`.
+"""
+
+
+import io
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks import jobs
+from tasks.models import Job, JobStatus, Task
+from users.models import User
+
+from tests.utils import create_tasks
+
+TEST_HANDLERS = {
+    'ok': 'tests.test_jobs.ok_handler',
+    'fail': 'tests.test_jobs.failing_handler',
+}
+
+
+def ok_handler(job: Job) -> dict:
+    """
+    Обработчик, возвращающий параметры задания.
+    """
+    return {'echo': job.payload}
+
+
+def failing_handler(job: Job) -> None:
+    """
+    Обработчик, всегда завершающийся ошибкой.
+    """
+    raise RuntimeError('сбой')
+
+
+@override_settings(JOB_HANDLERS=TEST_HANDLERS)
+class JobQueueTest(TestCase):
+    """
+    Тесты захвата, выполнения и повторов заданий.
+    """
+    def test_claim_and_run(self) -> None:
+        """
+        Тест захвата задания одним воркером и сохранения результата.
+        """
+        job = jobs.enqueue('ok', {'value': 1}, max_attempts=1)
+        claimed = jobs.claim_job()
+        self.assertEqual(claimed.pk, job.pk)
+        self.assertEqual((claimed.status, claimed.attempts), (JobStatus.RUNNING.value, 1))
+        self.assertIsNone(jobs.claim_job())
+
+        self.assertEqual(jobs.run_job(claimed), JobStatus.SUCCEEDED.value)
+        job.refresh_from_db()
+        self.assertEqual(job.result, {'echo': {'value': 1}})
+        self.assertIsNotNone(job.finished_at)
+
+    def test_unknown_kind(self) -> None:
+        """
+        Тест отказа в постановке задания без обработчика.
+        """
+        with self.assertRaises(ValueError):
+            jobs.enqueue('missing')
+
+    def test_expired_lease(self) -> None:
+        """
+        Тест повторного захвата после окончания аренды и отказа в записи прежнему воркеру.
+        """
+        job = jobs.enqueue('ok', max_attempts=2)
+        stale = jobs.claim_job()
+        Job.objects.filter(pk=job.pk).update(available_at=timezone.now() - timedelta(seconds=1))
+
+        fresh = jobs.claim_job()
+        self.assertEqual((fresh.pk, fresh.attempts), (job.pk, 2))
+        self.assertFalse(jobs.report_progress(stale, done=1))
+        self.assertTrue(jobs.report_progress(fresh, done=1))
+
+        Job.objects.filter(pk=job.pk).update(available_at=timezone.now() - timedelta(seconds=1))
+        self.assertIsNone(jobs.claim_job())
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (JobStatus.FAILED.value, 2))
+        self.assertEqual(job.progress, {'done': 1})
+
+    @override_settings(JOB_QUEUE={'VISIBILITY_TIMEOUT': 60, 'MAX_ATTEMPTS': 2, 'RETRY_DELAY': 10, 'POLL_INTERVAL': 0})
+    def test_retries(self) -> None:
+        """
+        Тест возврата в очередь с задержкой и завершения ошибкой после последней попытки.
+        """
+        job = jobs.enqueue('fail')
+        before = timezone.now()
+        self.assertEqual(jobs.run_job(jobs.claim_job()), JobStatus.QUEUED.value)
+        job.refresh_from_db()
+        self.assertEqual(job.error, 'RuntimeError: сбой')
+        self.assertGreaterEqual(job.available_at, before + timedelta(seconds=10))
+        self.assertIsNone(jobs.claim_job())
+
+        Job.objects.filter(pk=job.pk).update(available_at=timezone.now())
+        self.assertEqual(jobs.run_job(jobs.claim_job()), JobStatus.FAILED.value)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (JobStatus.FAILED.value, 2))
+
+    def test_report_progress_extends_lease(self) -> None:
+        """
+        Тест продления аренды при сохранении прогресса.
+        """
+        jobs.enqueue('ok')
+        job = jobs.claim_job()
+        leased_until = job.available_at
+        self.assertTrue(jobs.report_progress(job, deleted=10, total=20))
+        job.refresh_from_db()
+        self.assertEqual(job.progress, {'deleted': 10, 'total': 20})
+        self.assertGreaterEqual(job.available_at, leased_until)
+
+
+class AsyncUserDeleteTest(TransactionTestCase):
+    """
+    Тесты отложенного удаления пользователя.
+
+    Команда воркера закрывает устаревшие соединения, поэтому данные должны быть зафиксированы.
+    """
+    def setUp(self) -> None:
+        self.admin = User.objects.create_user(email="jobs-admin@example.com", name="Админ", password="password123")
+        self.victim = User.objects.create_user(email="jobs-victim@example.com", name="Удаляемый")
+        create_tasks(self.victim, 30)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_async_delete(self) -> None:
+        """
+        Тест ответа 202, деактивации пользователя и удаления воркером.
+        """
+        response = self.client.delete(f'/api/users/{self.victim.id}/?async=true')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.json()['status'], JobStatus.QUEUED.value)
+        self.assertTrue(response['Location'].endswith(f'/api/jobs/{response.json()["id"]}/'))
+        self.victim.refresh_from_db()
+        self.assertFalse(self.victim.is_active)
+        self.assertEqual(Task.objects.filter(user=self.victim).count(), 30)
+
+        call_command('run_workers', '--once', stdout=io.StringIO())
+
+        self.assertFalse(User.objects.filter(pk=self.victim.pk).exists())
+        self.assertFalse(Task.objects.filter(user_id=self.victim.pk).exists())
+        job = self.client.get(response['Location']).json()
+        self.assertEqual(job['status'], JobStatus.SUCCEEDED.value)
+        self.assertEqual(job['result']['per_model']['tasks.Task'], 30)
+
+        other = APIClient()
+        other.force_authenticate(User.objects.create_user(email="jobs-other@example.com", name="Другой"))
+        self.assertEqual(other.get(response['Location']).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(other.get('/api/jobs/').json()['results'], [])
+
+    def test_sync_delete_by_default(self) -> None:
+        """
+        Тест удаления в запросе без параметра `async`.
+        """
+        response = self.client.delete(f'/api/users/{self.victim.id}/')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(User.objects.filter(pk=self.victim.pk).exists())
+        self.assertFalse(Job.objects.exists())
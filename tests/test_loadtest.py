@@ -0,0 +1,132 @@
+"""
+Модуль тестов синтетических данных и сценария нагрузки.
+
+Содержит тесты для проверки:
+- Распределения задач с перекосом в сторону тяжелых пользователей.
+- Воспроизводимости данных команды `seed_perf_data` и входа синтетических пользователей.
+- Разбора пропорции операций сценария.
+- Прогона команды `run_loadtest` на живом сервере и сравнения с базовым отчетом.
+"""
+
+
+import io
+import json
+import os
+import tempfile
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import LiveServerTestCase, SimpleTestCase, TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks.loadtest import SCENARIO_OPERATIONS, parse_mix
+from tasks.models import Task
+from tasks.perfdata import PERF_PASSWORD, delete_perf_data, skewed_counts, user_email
+from users.models import User
+
+from tests.test_password_hashing import FAST_HASHING, profile_hashers
+
+NO_THROTTLING = {
+    **settings.REST_FRAMEWORK,
+    'DEFAULT_THROTTLE_RATES': {scope: None for scope in settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']},
+}
+
+
+class ScenarioHelpersTest(SimpleTestCase):
+    """
+    Тесты распределения задач и разбора пропорции операций.
+    """
+    def test_skewed_counts(self) -> None:
+        """
+        Тест доли тяжелых пользователей и убывания числа задач у остальных.
+        """
+        counts = skewed_counts(1000, 20, 2, 0.5)
+        self.assertEqual(sum(counts), 1000)
+        self.assertEqual(counts[:2], [250, 250])
+        self.assertEqual(counts[2:], sorted(counts[2:], reverse=True))
+        self.assertEqual(sum(skewed_counts(7, 3, 0, 0.5)), 7)
+        self.assertEqual(skewed_counts(10, 2, 2, 0.3), [5, 5])
+
+    def test_parse_mix(self) -> None:
+        """
+        Тест разбора весов и ошибок в пропорции операций.
+        """
+        self.assertEqual(parse_mix('list=80, create=20'), {'list': 80.0, 'create': 20.0})
+        for value in ('list=80,search=20', 'list=-1', 'list=0', 'list=x'):
+            with self.assertRaises(ValueError):
+                parse_mix(value)
+
+
+@override_settings(PASSWORD_HASHERS=profile_hashers('pbkdf2'), PASSWORD_HASHING=FAST_HASHING)
+class SeedPerfDataTest(TestCase):
+    """
+    Тесты команды создания синтетических данных.
+    """
+    def seed(self, *args) -> list:
+        call_command('seed_perf_data', '--users', '10', '--tasks', '200', '--heavy-users', '1', *args,
+                     stdout=io.StringIO())
+        return list(Task.objects.order_by('user__email', 'id').values_list('user__email', 'title', 'status'))
+
+    def test_reproducible(self) -> None:
+        """
+        Тест совпадения данных при том же зерне и отличия при другом.
+        """
+        first = self.seed('--seed', '3')
+        self.assertEqual(self.seed('--seed', '3', '--reset'), first)
+        self.assertNotEqual(self.seed('--seed', '4', '--reset'), first)
+
+    def test_skew_and_login(self) -> None:
+        """
+        Тест перекоса задач в сторону тяжелого пользователя и входа синтетического пользователя.
+        """
+        self.seed()
+        self.assertEqual(User.objects.filter(email__startswith='perf-user-').count(), 10)
+        self.assertEqual(Task.objects.filter(user__email=user_email(0)).count(), 100)
+
+        response = APIClient().post('/api/token/', {'email': user_email(5), 'password': PERF_PASSWORD})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_existing_data(self) -> None:
+        """
+        Тест ошибки при повторном создании без `--reset` и удаления данных.
+        """
+        self.seed()
+        with self.assertRaises(CommandError):
+            self.seed()
+        self.assertEqual(delete_perf_data(), 10)
+        self.assertFalse(Task.objects.exists())
+
+
+@override_settings(
+    PASSWORD_HASHERS=profile_hashers('pbkdf2'), PASSWORD_HASHING=FAST_HASHING, REST_FRAMEWORK=NO_THROTTLING,
+)
+class RunLoadtestTest(LiveServerTestCase):
+    """
+    Тесты команды нагрузочного прогона на живом сервере.
+
+    Потоки живого сервера используют одно соединение с базой в памяти, поэтому при
+    одновременных запросах замеры SQL-запросов (и бюджеты) учитывают чужие запросы;
+    прогон выполняется одним виртуальным пользователем.
+    """
+    def test_report_and_compare(self) -> None:
+        """
+        Тест отчета по всем операциям сценария и сравнения с базовым отчетом.
+        """
+        call_command('seed_perf_data', '--users', '3', '--tasks', '30', stdout=io.StringIO())
+        args = ['--base-url', self.live_server_url, '--users', '3', '--connections', '1', '--duration', '1',
+                '--mix', 'list=30,create=30,update=20,delete=10,token=10']
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            call_command('run_loadtest', *args, '--json', path, stdout=io.StringIO())
+            with open(path, encoding='utf-8') as file:
+                report = json.load(file)
+            output = io.StringIO()
+            call_command('run_loadtest', *args, '--compare', path, stdout=output)
+
+        self.assertEqual(report['meta']['connections'], 1)
+        self.assertEqual(set(report['operations']), set(SCENARIO_OPERATIONS))
+        self.assertEqual(report['total']['errors'], 0)
+        self.assertEqual(report['total']['requests'], sum(row['requests'] for row in report['operations'].values()))
+        self.assertTrue(all(row['p50_ms'] <= row['p95_ms'] <= row['p99_ms'] for row in report['operations'].values()))
+        self.assertIn('Сравнение с коммитом', output.getvalue())
@@ -0,0 +1,121 @@
+"""
+Модуль тестов метрик производительности запросов.
+
+Содержит тесты для проверки:
+- Заголовка `Server-Timing` с числом и временем SQL-запросов и временем рендеринга.
+- Учета запросов по представлениям (`TaskViewSet.list`, `UserViewSet.create`, токены).
+- Эндпоинта `/metrics` в формате Prometheus и ограничения доступа к нему.
+- Работы с асинхронными представлениями.
+- Малых накладных расходов middleware.
+"""
+
+
+import re
+
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from task_manager.metrics import PerformanceMiddleware, registry
+from users.models import User
+
+from tests.test_async_views import bearer
+from tests.utils import median_duration
+
+
+class PerformanceMiddlewareTest(TestCase):
+    """
+    Тесты замеров запросов и эндпоинта метрик.
+    """
+    def setUp(self) -> None:
+        registry.clear()
+        self.addCleanup(registry.clear)
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="metrics@example.com", name="Метрики", password="password123")
+        self.client.force_authenticate(user=self.user)
+
+    def _server_timing(self, response) -> dict:
+        return {
+            name: (float(duration), description)
+            for name, duration, description in re.findall(
+                r'(\w+);dur=([\d.]+)(?:;desc="([^"]*)")?', response['Server-Timing']
+            )
+        }
+
+    def test_server_timing(self) -> None:
+        """
+        Тест заголовка Server-Timing: число запросов совпадает с фактическим.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                '/api/tasks/', {'title': 'Задача', 'description': 'Описание', 'status': 'новая', 'user': self.user.pk},
+            )
+        self.assertEqual(response.status_code, 201)
+
+        timing = self._server_timing(response)
+        self.assertEqual(timing['db'][1], f'{len(queries)} queries')
+        self.assertGreater(timing['render'][0], 0)
+        self.assertGreaterEqual(timing['total'][0], timing['db'][0])
+
+    @override_settings(SERVER_TIMING_ENABLED=False)
+    def test_server_timing_disabled(self) -> None:
+        """
+        Тест отключения заголовка; метрики при этом продолжают собираться.
+        """
+        response = self.client.get('/api/tasks/?page_size=1')
+        self.assertNotIn('Server-Timing', response)
+        self.assertIn('view="TaskViewSet.list"', registry.render())
+
+    def test_metrics_by_view(self) -> None:
+        """
+        Тест учета запросов по представлениям в формате Prometheus.
+        """
+        self.client.get('/api/tasks/?page_size=2')
+        self.client.post('/api/users/', {'email': 'new@example.com', 'name': 'Новый', 'password': 'password123'})
+        APIClient().post('/api/token/', {'email': 'metrics@example.com', 'password': 'password123'})
+        self.client.get('/missing/')
+
+        body = self.client.get('/metrics').content.decode()
+        self.assertIn('task_manager_requests_total{view="TaskViewSet.list",status="200"} 1', body)
+        self.assertIn('task_manager_requests_total{view="UserViewSet.create",status="201"} 1', body)
+        self.assertIn('task_manager_requests_total{view="TokenObtainPairView.post",status="200"} 1', body)
+        self.assertIn('task_manager_requests_total{view="unmatched",status="404"} 1', body)
+        self.assertIn('task_manager_request_duration_seconds_count{view="TaskViewSet.list"} 1', body)
+        self.assertIn('task_manager_request_duration_seconds_bucket{view="TaskViewSet.list",le="+Inf"} 1', body)
+        self.assertRegex(body, r'task_manager_db_queries_total\{view="UserViewSet.create"\} [1-9]')
+        self.assertRegex(body, r'task_manager_response_bytes_total\{view="TaskViewSet.list"\} [1-9]')
+
+    @override_settings(METRICS_ALLOWED_IPS=['10.0.0.1'])
+    def test_metrics_allowed_ips(self) -> None:
+        """
+        Тест ограничения доступа к /metrics по адресу клиента.
+        """
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='10.0.0.1').status_code, 200)
+
+    def test_metrics_loopback_only_by_default(self) -> None:
+        """
+        Тест того, что по умолчанию /metrics доступен только с локального адреса.
+        """
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='127.0.0.1').status_code, 200)
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='::1').status_code, 200)
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='203.0.113.5').status_code, 403)
+        with override_settings(METRICS_ALLOWED_IPS=[]):
+            self.assertEqual(self.client.get('/metrics').status_code, 403)
+
+    async def test_async_view(self) -> None:
+        """
+        Тест замеров асинхронного представления.
+        """
+        response = await self.async_client.get('/api/async/tasks/', headers=bearer(self.user))
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(float(re.search(r'total;dur=([\d.]+)', response['Server-Timing']).group(1)), 0)
+
+    def test_overhead(self) -> None:
+        """
+        Тест того, что собственные накладные расходы middleware меньше 0.2 мс на запрос.
+        """
+        middleware = PerformanceMiddleware(lambda request: HttpResponse(b'ok'))
+        request = RequestFactory().get('/')
+        self.assertLess(median_duration(lambda: middleware(request), 200), 0.0002)
@@ -0,0 +1,154 @@
+"""
+Модуль тестов курсорной пагинации списков задач и пользователей.
+
+Содержит тесты для проверки:
+- Ограниченного размера страницы и перехода по непрозрачным курсорам.
+- Отсутствия запросов `COUNT(*)` при выдаче страницы.
+- Постоянного времени ответа страницы при росте таблицы задач (бенчмарк).
+"""
+
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks.cache import invalidate_user_tasks
+from users.models import User
+from users.pagination import IdCursorPagination
+
+from tests.utils import create_tasks, median_duration
+
+
+class TaskCursorPaginationTest(TestCase):
+    """
+    Тесты курсорной пагинации списка задач.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="pager@example.com", name="Pager", password="password123")
+        self.client.force_authenticate(user=self.user)
+
+    def test_page_size_is_bounded(self) -> None:
+        """
+        Тест ограничения размера страницы, в том числе запрошенного клиентом.
+        """
+        create_tasks(self.user, IdCursorPagination.max_page_size + 10)
+        response = self.client.get('/api/tasks/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), IdCursorPagination.page_size)
+
+        response = self.client.get('/api/tasks/', {'page_size': 10 ** 6})
+        self.assertEqual(len(response.data['results']), IdCursorPagination.max_page_size)
+
+    def test_cursor_walks_all_tasks_in_id_order(self) -> None:
+        """
+        Тест обхода всех задач по ссылкам `next` без пропусков и повторов.
+        """
+        create_tasks(self.user, 25)
+        seen = []
+        url = '/api/tasks/?page_size=10'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(task['id'] for task in response.data['results'])
+            url = response.data['next']
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(seen, sorted(seen))
+
+    def test_invalid_cursor(self) -> None:
+        """
+        Тест ответа на поврежденный курсор.
+        """
+        response = self.client.get('/api/tasks/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_does_not_count_rows(self) -> None:
+        """
+        Тест отсутствия запроса `COUNT(*)` при выдаче страницы.
+        """
+        create_tasks(self.user, 120)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/tasks/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(any('COUNT(' in query['sql'].upper() for query in queries.captured_queries))
+
+    def test_only_own_tasks_are_paginated(self) -> None:
+        """
+        Тест того, что в страницы не попадают задачи других пользователей.
+        """
+        other = User.objects.create_user(email="other@example.com", name="Other", password="password123")
+        create_tasks(other, 5)
+        create_tasks(self.user, 3)
+        response = self.client.get('/api/tasks/')
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertIsNone(response.data['next'])
+
+
+class UserCursorPaginationTest(TestCase):
+    """
+    Тесты курсорной пагинации списка пользователей.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="admin@example.com", name="Admin", password="password123")
+        self.client.force_authenticate(user=self.user)
+
+    def test_users_are_paginated_by_id(self) -> None:
+        """
+        Тест постраничной выдачи пользователей в порядке `id`.
+        """
+        User.objects.bulk_create(
+            User(email=f"user{i}@example.com", name=f"User {i}") for i in range(5)
+        )
+        response = self.client.get('/api/users/', {'page_size': 4})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [user['id'] for user in response.data['results']]
+        self.assertEqual(len(ids), 4)
+        self.assertEqual(ids, sorted(ids))
+        self.assertIsNotNone(response.data['next'])
+
+
+class PaginationBenchmarkTest(TestCase):
+    """
+    Бенчмарк: время выдачи страницы не должно расти вместе с таблицей задач.
+    """
+    small_size = 200
+    large_size = 20000
+    max_slowdown = 3.0
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+
+    def _page_latency(self, task_count: int) -> float:
+        """
+        Создает пользователя с `task_count` задачами и замеряет выдачу страницы из середины списка.
+
+        Перед каждым замером кэш списка пользователя сбрасывается, чтобы страница читалась из базы.
+        """
+        user = User.objects.create_user(email=f"bench{task_count}@example.com", name="Bench", password="password123")
+        create_tasks(user, task_count)
+        self.client.force_authenticate(user=user)
+
+        url = '/api/tasks/'
+        for _ in range(3):
+            url = self.client.get(url).data['next']
+
+        def fetch_page() -> None:
+            invalidate_user_tasks(user.id)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert len(queries), 'страница отдана из кэша'
+
+        fetch_page()  # Прогрев
+        return median_duration(fetch_page)
+
+    def test_page_latency_is_flat(self) -> None:
+        """
+        Тест того, что страница на большой таблице отдается не медленнее, чем на маленькой,
+        с учетом допустимого шума измерений.
+        """
+        small = self._page_latency(self.small_size)
+        large = self._page_latency(self.large_size)
+        self.assertLess(large, small * self.max_slowdown)
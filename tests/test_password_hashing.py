@@ -0,0 +1,155 @@
+"""
+Модуль тестов профилей хеширования паролей.
+
+Содержит тесты для проверки:
+- Хеширования новых паролей алгоритмом и параметрами профиля.
+- Перехеширования при входе после смены профиля или параметров стоимости.
+- Хеширования в пуле процессов при регистрации и входе.
+- Ответа 503 при переполненной очереди пула.
+- Команды `benchmark_logins`.
+"""
+
+
+import io
+import json
+import os
+import tempfile
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+from users.hashers import hashing_pool
+from users.models import User
+
+FAST_HASHING = {
+    'PBKDF2_ITERATIONS': 1000,
+    'SCRYPT_WORK_FACTOR': 2 ** 10,
+    'SCRYPT_BLOCK_SIZE': 8,
+    'SCRYPT_PARALLELISM': 1,
+    'ARGON2_TIME_COST': 1,
+    'ARGON2_MEMORY_COST': 64,
+    'ARGON2_PARALLELISM': 1,
+}
+
+
+def profile_hashers(profile: str) -> list:
+    """
+    Возвращает PASSWORD_HASHERS для профиля так же, как настройки проекта.
+    """
+    preferred = settings.PASSWORD_HASHER_PROFILES[profile]
+    return [preferred, *(path for path in settings.PASSWORD_HASHER_PROFILES.values() if path != preferred)]
+
+
+@override_settings(PASSWORD_HASHERS=profile_hashers('pbkdf2'), PASSWORD_HASHING=FAST_HASHING)
+class PasswordHashingTest(TestCase):
+    """
+    Тесты профилей хеширования и перехеширования при входе.
+    """
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="hash@example.com", name="Хеш", password="password123")
+
+    def _login(self, password: str = 'password123') -> int:
+        return APIClient().post('/api/token/', {'email': 'hash@example.com', 'password': password}).status_code
+
+    def test_profile_parameters(self) -> None:
+        """
+        Тест того, что новый хеш использует алгоритм и число итераций профиля.
+        """
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$1000$'))
+
+    def test_rehash_on_profile_change(self) -> None:
+        """
+        Тест перехеширования по новому профилю при успешном входе и его отсутствия при ошибке.
+        """
+        with override_settings(PASSWORD_HASHERS=profile_hashers('scrypt')):
+            self.assertEqual(self._login('wrong-password'), status.HTTP_401_UNAUTHORIZED)
+            self.user.refresh_from_db()
+            self.assertTrue(self.user.password.startswith('pbkdf2_sha256$'))
+
+            self.assertEqual(self._login(), status.HTTP_200_OK)
+            self.user.refresh_from_db()
+            self.assertTrue(self.user.password.startswith('scrypt$1024$'))
+            self.assertEqual(self._login(), status.HTTP_200_OK)
+
+    def test_argon2_profile(self) -> None:
+        """
+        Тест перехеширования в argon2id с параметрами профиля (пакет argon2-cffi из зависимостей).
+        """
+        with override_settings(PASSWORD_HASHERS=profile_hashers('argon2')):
+            self.assertEqual(self._login(), status.HTTP_200_OK)
+            self.user.refresh_from_db()
+            self.assertTrue(self.user.password.startswith('argon2$argon2id$v=19$m=64,t=1,p=1$'))
+            self.assertEqual(self._login(), status.HTTP_200_OK)
+
+    def test_rehash_on_cost_change(self) -> None:
+        """
+        Тест перехеширования при изменении параметров стоимости текущего алгоритма.
+        """
+        with override_settings(PASSWORD_HASHING={**FAST_HASHING, 'PBKDF2_ITERATIONS': 2000}):
+            self.assertEqual(self._login(), status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$2000$'))
+
+
+@override_settings(PASSWORD_HASHERS=profile_hashers('scrypt'), PASSWORD_HASHING={**FAST_HASHING, 'POOL_SIZE': 1})
+class HashingPoolTest(TestCase):
+    """
+    Тесты хеширования в пуле процессов.
+    """
+    def setUp(self) -> None:
+        self.addCleanup(hashing_pool.shutdown)
+
+    def test_register_and_login(self) -> None:
+        """
+        Тест регистрации и входа с хешированием в пуле процессов.
+        """
+        client = APIClient()
+        client.force_authenticate(User.objects.create_user(email="admin-pool@example.com", name="Админ"))
+        response = client.post('/api/users/', {'email': 'pool@example.com', 'name': 'Пул', 'password': 'password123'})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(User.objects.get(email='pool@example.com').password.startswith('scrypt$'))
+
+        credentials = {'email': 'pool@example.com', 'password': 'password123'}
+        self.assertEqual(APIClient().post('/api/token/', credentials).status_code, status.HTTP_200_OK)
+        credentials['password'] = 'wrong-password'
+        self.assertEqual(APIClient().post('/api/token/', credentials).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(PASSWORD_HASHING={**FAST_HASHING, 'POOL_SIZE': 1, 'POOL_QUEUE': 0, 'POOL_TIMEOUT': 0})
+    def test_busy_pool(self) -> None:
+        """
+        Тест ответа 503 при занятом пуле вместо ожидания в воркере.
+        """
+        User.objects.create_user(email="busy@example.com", name="Занят", password="password123")
+        _, slots = hashing_pool._get_executor()
+        slots.acquire()
+        self.addCleanup(slots.release)
+
+        response = APIClient().post('/api/token/', {'email': 'busy@example.com', 'password': 'password123'})
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+@override_settings(PASSWORD_HASHING=FAST_HASHING)
+class BenchmarkLoginsTest(TransactionTestCase):
+    """
+    Тесты команды замера пропускной способности входа.
+
+    Входы выполняются в других потоках, поэтому данные должны быть зафиксированы.
+    """
+    def test_report(self) -> None:
+        """
+        Тест отчета по профилям и удаления временных пользователей.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'logins.json')
+            call_command(
+                'benchmark_logins', '--profiles', 'pbkdf2', 'scrypt', '--logins', '2', '--json', path,
+                stdout=io.StringIO(),
+            )
+            with open(path, encoding='utf-8') as file:
+                report = json.load(file)
+
+        self.assertEqual([row['profile'] for row in report], ['pbkdf2', 'scrypt'])
+        self.assertTrue(all(row['logins_per_second_per_core'] > 0 for row in report))
+        self.assertFalse(User.objects.filter(email__startswith='benchmark-login-').exists())
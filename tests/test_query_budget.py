@@ -0,0 +1,124 @@
+"""
+Модуль тестов бюджета SQL-запросов API.
+
+Содержит тесты для проверки:
+- Постоянного числа запросов списков и выгрузки при росте числа строк с 10 до 1000.
+- Исключения при превышении бюджета (например, при вложенном сериализаторе, дающем N+1).
+- Предупреждения в журнале вместо исключения при отключенном `QUERY_BUDGET_RAISE`.
+- Выбора бюджета по действию, атрибуту класса и декоратору.
+"""
+
+
+from unittest import mock
+
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import resolve
+from rest_framework.test import APIClient
+from task_manager.metrics import QueryBudgetExceeded, get_query_budget, query_budget
+from users.models import User
+from users.serializers import TaskSerializer, UserSerializer
+from users.views import TaskViewSet
+
+from tests.utils import assert_constant_queries, create_tasks
+
+
+class NestedUserTaskSerializer(TaskSerializer):
+    """
+    Сериализатор задачи с вложенным владельцем: запрос пользователя на каждую задачу.
+    """
+    user = UserSerializer(read_only=True)
+
+
+class QueryBudgetTest(TestCase):
+    """
+    Тесты бюджета запросов представлений.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="budget@example.com", name="Бюджет", password="password123")
+        self.client.force_authenticate(user=self.user)
+
+    def test_task_list_constant(self) -> None:
+        """
+        Тест постоянного числа запросов страницы задач при 10, 100 и 1000 задачах.
+        """
+        counts = assert_constant_queries(
+            self,
+            lambda count: create_tasks(self.user, count),
+            lambda: self.client.get('/api/tasks/?page_size=500'),
+        )
+        self.assertLessEqual(counts[0], TaskViewSet.query_budget['list'])
+
+    def test_task_export_constant(self) -> None:
+        """
+        Тест постоянного числа запросов выгрузки задач.
+        """
+        assert_constant_queries(
+            self,
+            lambda count: create_tasks(self.user, count),
+            lambda: b''.join(self.client.get('/api/tasks/export/').streaming_content),
+        )
+
+    def test_user_list_constant(self) -> None:
+        """
+        Тест постоянного числа запросов страницы пользователей.
+        """
+        def create_users(count: int) -> None:
+            start = User.objects.count()
+            User.objects.bulk_create(
+                [User(email=f'budget-{start + i}@example.com', name='Пользователь') for i in range(count)],
+                batch_size=300,
+            )
+
+        assert_constant_queries(self, create_users, lambda: self.client.get('/api/users/?page_size=500'))
+
+    def test_nested_serializer_exceeds_budget(self) -> None:
+        """
+        Тест того, что вложенный сериализатор пользователя (N+1) превышает бюджет списка.
+        """
+        create_tasks(self.user, 10)
+        with mock.patch.object(TaskViewSet, 'serializer_class', NestedUserTaskSerializer):
+            with self.assertRaisesMessage(QueryBudgetExceeded, 'TaskViewSet.list'):
+                self.client.get('/api/tasks/')
+
+    @override_settings(QUERY_BUDGET_RAISE=False)
+    def test_exceeded_budget_logged(self) -> None:
+        """
+        Тест того, что без QUERY_BUDGET_RAISE превышение только пишется в журнал.
+        """
+        create_tasks(self.user, 10)
+        with mock.patch.object(TaskViewSet, 'serializer_class', NestedUserTaskSerializer):
+            with self.assertLogs('task_manager.metrics', 'WARNING') as logs:
+                response = self.client.get('/api/tasks/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('TaskViewSet.list', logs.output[0])
+
+
+class GetQueryBudgetTest(TestCase):
+    """
+    Тесты выбора бюджета запросов.
+    """
+    def _budget(self, method: str, path: str) -> int | None:
+        request = getattr(RequestFactory(), method)(path)
+        request.resolver_match = resolve(path)
+        return get_query_budget(request)
+
+    def test_action_budgets(self) -> None:
+        """
+        Тест бюджетов по действиям и отсутствия бюджета у пакетных операций.
+        """
+        self.assertEqual(self._budget('get', '/api/tasks/'), TaskViewSet.query_budget['list'])
+        self.assertEqual(self._budget('get', '/api/tasks/export/'), TaskViewSet.query_budget['export'])
+        self.assertIsNone(self._budget('post', '/api/tasks/bulk/'))
+        self.assertIsNone(self._budget('get', '/api/token/'))
+
+    def test_decorator_overrides_class_budget(self) -> None:
+        """
+        Тест того, что декоратор на методе действия имеет приоритет над атрибутом класса.
+        """
+        @query_budget(1)
+        def export(self, request):
+            pass
+
+        with mock.patch.object(TaskViewSet, 'export', export):
+            self.assertEqual(self._budget('get', '/api/tasks/export/'), 1)
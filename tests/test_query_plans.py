@@ -0,0 +1,118 @@
+"""
+Модуль регрессионных тестов планов запросов к таблице задач.
+
+Выполняет `EXPLAIN QUERY PLAN` для запросов, которые реально формируют `TaskViewSet`
+и `TaskAdmin`, и проверяет, что ни один из них не сканирует таблицу задач целиком
+и не сортирует результат во временном B-дереве. Тесты падают, если изменение
+схемы или запросов лишает горячие запросы подходящего индекса.
+"""
+
+
+import re
+
+from django.contrib.admin.sites import site
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks.models import Task
+from users.models import User
+
+from tests.utils import create_tasks
+
+TASK_TABLE = Task._meta.db_table
+
+FULL_SCAN_RE = re.compile(rf'\bSCAN {TASK_TABLE}\b')
+TEMP_SORT_RE = re.compile(r'USE TEMP B-TREE FOR ORDER BY')
+
+
+class TaskQueryPlanTest(TestCase):
+    """
+    Тесты планов горячих запросов к таблице задач.
+    """
+    def setUp(self) -> None:
+        if connection.vendor != 'sqlite':
+            self.skipTest('EXPLAIN QUERY PLAN поддерживается только в SQLite')
+        self.client = APIClient()
+        self.user = User.objects.create_superuser(email="planner@example.com", name="Planner", password="password123")
+        self.client.force_authenticate(user=self.user)
+        create_tasks(self.user, 60)
+        create_tasks(self.user, 60, status='завершена')
+
+    def _task_queries(self, func) -> list:
+        """
+        Выполняет функцию и возвращает SQL всех SELECT-запросов к таблице задач.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            func()
+        return [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and TASK_TABLE in query['sql']
+        ]
+
+    def assertUsesIndexes(self, sql_list: list) -> None:
+        """
+        Проверяет, что планы всех запросов обходятся без полного сканирования и сортировки.
+        """
+        self.assertTrue(sql_list, 'Не перехвачено ни одного запроса к таблице задач')
+        with connection.cursor() as cursor:
+            for sql in sql_list:
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                plan = '\n'.join(row[-1] for row in cursor.fetchall())
+                self.assertNotRegex(plan, FULL_SCAN_RE, f'Полное сканирование:\n{sql}\n{plan}')
+                self.assertNotRegex(plan, TEMP_SORT_RE, f'Сортировка без индекса:\n{sql}\n{plan}')
+
+    def test_task_list_first_page(self) -> None:
+        """
+        Тест плана первой страницы списка задач.
+        """
+        self.assertUsesIndexes(self._task_queries(lambda: self.client.get('/api/tasks/')))
+
+    def test_task_list_next_page(self) -> None:
+        """
+        Тест плана следующей страницы списка задач по курсору.
+        """
+        next_url = self.client.get('/api/tasks/').data['next']
+        self.assertUsesIndexes(self._task_queries(lambda: self.client.get(next_url)))
+
+    def test_task_detail(self) -> None:
+        """
+        Тест плана получения одной задачи.
+        """
+        task = Task.objects.first()
+        self.assertUsesIndexes(self._task_queries(lambda: self.client.get(f'/api/tasks/{task.id}/')))
+
+    def test_task_delete(self) -> None:
+        """
+        Тест плана поиска задачи перед удалением.
+        """
+        task = Task.objects.first()
+
+        def delete() -> None:
+            response = self.client.delete(f'/api/tasks/{task.id}/')
+            self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertUsesIndexes(self._task_queries(delete))
+
+    def test_admin_status_filter(self) -> None:
+        """
+        Тест планов списка задач в админке с фильтром по статусу.
+        """
+        request = RequestFactory().get('/admin/tasks/task/', {'status__exact': 'завершена'})
+        request.user = self.user
+        model_admin = site._registry[Task]
+
+        def changelist() -> None:
+            changelist = model_admin.get_changelist_instance(request)
+            changelist.get_results(request)
+            list(changelist.result_list)
+
+        self.assertUsesIndexes(self._task_queries(changelist))
+
+    def test_task_changes(self) -> None:
+        """
+        Тест плана выборки изменений задач после курсора синхронизации.
+        """
+        cursor = self.client.get('/api/tasks/changes/?limit=10').data['cursor']
+        self.assertUsesIndexes(self._task_queries(lambda: self.client.get(f'/api/tasks/changes/?since={cursor}')))
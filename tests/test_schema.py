@@ -0,0 +1,63 @@
+"""
+Модуль тестов документации API (OpenAPI).
+
+Содержит тесты для проверки:
+- Доступности спецификации и интерфейсов Swagger UI и ReDoc.
+- Однократной генерации схемы на процесс.
+- Отсутствия импорта генератора схемы при загрузке URL-конфигурации.
+"""
+
+
+import subprocess
+import sys
+from unittest import mock
+
+from django.conf import settings
+from django.test import TestCase
+from drf_yasg.generators import OpenAPISchemaGenerator
+from task_manager.schema import clear_schema_cache
+
+
+class SchemaTest(TestCase):
+    """
+    Тесты представлений документации.
+    """
+    def setUp(self) -> None:
+        clear_schema_cache()
+        self.addCleanup(clear_schema_cache)
+
+    def test_spec_and_ui(self) -> None:
+        """
+        Тест спецификации в JSON и страниц интерфейсов.
+        """
+        response = self.client.get('/docs/?format=openapi')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('/tasks/', response.json()['paths'])
+        self.assertEqual(self.client.get('/docs/').status_code, 200)
+        self.assertEqual(self.client.get('/redoc/').status_code, 200)
+
+    def test_schema_generated_once(self) -> None:
+        """
+        Тест того, что схема генерируется при первом обращении и затем переиспользуется.
+        """
+        with mock.patch.object(
+            OpenAPISchemaGenerator, 'get_schema', autospec=True, side_effect=OpenAPISchemaGenerator.get_schema
+        ) as get_schema:
+            first = self.client.get('/docs/?format=openapi').content
+            self.client.get('/docs/')
+            self.client.get('/redoc/')
+            self.assertEqual(self.client.get('/docs/?format=openapi').content, first)
+        self.assertEqual(get_schema.call_count, 1)
+
+    def test_urlconf_import_is_lazy(self) -> None:
+        """
+        Тест того, что загрузка URL-конфигурации не импортирует генератор схемы drf_yasg.
+        """
+        code = (
+            'import sys, django; django.setup(); import task_manager.urls; '
+            'print("drf_yasg.generators" in sys.modules)'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], cwd=settings.BASE_DIR, check=True, capture_output=True, text=True,
+        )
+        self.assertEqual(result.stdout.strip(), 'False')
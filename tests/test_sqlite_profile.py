@@ -0,0 +1,90 @@
+"""
+Модуль тестов профилей подключения к SQLite.
+
+Содержит тесты для проверки:
+- Применения PRAGMA профиля `performance` при открытии соединения.
+- Немедленного захвата блокировки записи в транзакциях.
+- Работы команды сравнения профилей `benchmark_sqlite` без обращения к основной базе.
+"""
+
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase
+
+
+class SQLiteProfileTest(SimpleTestCase):
+    """
+    Тесты профиля `performance` на временной файловой базе данных.
+    """
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        config = connections.configure_settings({
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': os.path.join(directory.name, 'profile.sqlite3'),
+                **settings.SQLITE_PROFILES['performance'],
+            },
+        })['default']
+        self.connection = DatabaseWrapper(config, alias='profile')
+        self.addCleanup(self.connection.close)
+
+    def _pragma(self, name: str):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'PRAGMA {name}')
+            return cursor.fetchone()[0]
+
+    def test_pragmas(self) -> None:
+        """
+        Тест того, что соединение открывается с WAL, synchronous=NORMAL, mmap и busy_timeout.
+        """
+        self.assertEqual(self._pragma('journal_mode'), 'wal')
+        self.assertEqual(self._pragma('synchronous'), 1)  # NORMAL
+        self.assertEqual(self._pragma('busy_timeout'), settings.SQLITE_PRAGMAS['busy_timeout'])
+        self.assertEqual(self._pragma('cache_size'), settings.SQLITE_PRAGMAS['cache_size'])
+        self.assertGreater(self._pragma('mmap_size'), 0)
+
+    def test_persistent_connections_and_immediate_transactions(self) -> None:
+        """
+        Тест переиспользования соединений и транзакций с режимом IMMEDIATE.
+        """
+        self.connection.ensure_connection()
+        self.assertGreater(self.connection.settings_dict['CONN_MAX_AGE'], 0)
+        self.assertEqual(self.connection.transaction_mode, 'IMMEDIATE')
+
+
+class BenchmarkSQLiteCommandTest(SimpleTestCase):
+    """
+    Тесты команды `benchmark_sqlite`.
+    """
+    def test_reports_every_profile(self) -> None:
+        """
+        Тест короткого прогона: по строке отчета на каждый профиль и отсутствие ошибок блокировки.
+        """
+        # Команда открывает собственные базы данных, поэтому запускается в отдельном процессе.
+        default_database = os.path.join(settings.BASE_DIR, 'db.sqlite3')
+        existed = os.path.exists(default_database)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'report.json')
+            subprocess.run(
+                [sys.executable, 'manage.py', 'benchmark_sqlite', '--threads', '4', '--duration', '0.5',
+                 '--seed-tasks', '200', '--json', path],
+                cwd=settings.BASE_DIR, check=True, capture_output=True,
+            )
+            with open(path, encoding='utf-8') as file:
+                report = json.load(file)
+
+        self.assertEqual([run['target'] for run in report], list(settings.SQLITE_PROFILES))
+        performance = report[-1]
+        self.assertGreater(performance['requests'], 0)
+        self.assertEqual(performance['errors'], 0)
+        # Запись задач и сигналы кэша работают только с временной базой профиля.
+        self.assertEqual(os.path.exists(default_database), existed)
@@ -0,0 +1,91 @@
+"""
+Модуль тестов холодного старта воркера.
+
+Содержит тесты для проверки:
+- Разбора вывода `python -X importtime` по фазам старта и первого запроса.
+- Соблюдения бюджета времени до первого ответа (`STARTUP_TIME_BUDGET_MS`).
+- Ленивой загрузки стека документации и отключаемой админки.
+- Доступности статики документации без подключения drf_yasg как приложения.
+"""
+
+
+import io
+import json
+import os
+import tempfile
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from tasks.management.commands.profile_startup import PHASE_MARKER, parse_importtime, summarize_imports
+
+
+class ParseImporttimeTest(SimpleTestCase):
+    """
+    Тесты разбора вывода `-X importtime`.
+    """
+    def test_phases_and_packages(self) -> None:
+        """
+        Тест разделения на фазы, глубины вложенности и сводки по пакетам.
+        """
+        lines = [
+            'import time: self [us] | cumulative | imported package',
+            'import time:       100 |        100 |     django.utils',
+            'import time:       300 |        400 |   django.conf',
+            'import time:        50 |        450 | task_manager.wsgi',
+            PHASE_MARKER,
+            'Forbidden: /api/tasks/',
+            'import time:      2000 |       2000 | rest_framework.views',
+        ]
+        phases = parse_importtime(lines)
+
+        self.assertEqual([entry['depth'] for entry in phases['startup']], [2, 1, 0])
+        self.assertEqual(phases['first_request'][0]['module'], 'rest_framework.views')
+        summary = summarize_imports(phases['startup'], top=1)
+        self.assertEqual(summary['total_ms'], 0.5)
+        self.assertEqual(summary['packages'], [{'package': 'django', 'self_ms': 0.4}])
+        self.assertEqual(summary['slowest'][0]['module'], 'django.conf')
+
+
+class ProfileStartupCommandTest(SimpleTestCase):
+    """
+    Тесты команды `profile_startup`; каждый прогон выполняется в отдельном процессе.
+    """
+    def _profile(self, *env: str) -> dict:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'startup.json')
+            call_command('profile_startup', repeat=1, top=1000, env=list(env), json_path=path, stdout=io.StringIO())
+            with open(path, encoding='utf-8') as file:
+                return json.load(file)
+
+    def _startup_modules(self, report: dict) -> set:
+        return {entry['module'] for entry in report['imports']['startup']['slowest']}
+
+    def test_within_budget_and_docs_lazy(self) -> None:
+        """
+        Тест бюджета времени до первого ответа и отсутствия drf_yasg и pkg_resources на старте.
+        """
+        report = self._profile()
+
+        self.assertLessEqual(report['ttfr_ms'], settings.STARTUP_TIME_BUDGET_MS)
+        self.assertEqual(report['status'], 403)
+        packages = {entry['package'] for entry in report['imports']['startup']['packages']}
+        self.assertNotIn('drf_yasg', packages)
+        self.assertNotIn('pkg_resources', packages)
+        self.assertIn('django.contrib.admin.sites', self._startup_modules(report))
+
+    def test_admin_disabled(self) -> None:
+        """
+        Тест того, что при ADMIN_ENABLED=False админка не загружается.
+        """
+        report = self._profile('ADMIN_ENABLED=False')
+
+        self.assertNotIn('django.contrib.admin.sites', self._startup_modules(report))
+
+    def test_docs_static_files(self) -> None:
+        """
+        Тест того, что статика документации находится без подключения drf_yasg как приложения.
+        """
+        self.assertNotIn('drf_yasg', settings.INSTALLED_APPS)
+        self.assertIsNotNone(finders.find('drf-yasg/swagger-ui-dist/swagger-ui-bundle.js'))
@@ -0,0 +1,218 @@
+"""
+Модуль тестов пакетных операций над задачами.
+
+Содержит тесты для проверки:
+- Пакетного создания, обновления и удаления задач через `/api/tasks/bulk/`.
+- Отчета об ошибках по каждому элементу и отката всей пачки при ошибке.
+- Постоянного количества запросов к базе независимо от размера пачки, в том числе при
+  пакетном удалении с отметками об удалении.
+- Выигрыша в пропускной способности по сравнению с поштучными запросами (бенчмарк).
+"""
+
+
+import time
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks.models import Task, TaskTombstone
+from users.models import User
+
+from tests.utils import assert_constant_queries, create_tasks
+
+BULK_URL = '/api/tasks/bulk/'
+
+
+def task_payload(count: int) -> list:
+    """
+    Возвращает список данных для создания `count` задач.
+    """
+    return [{"title": f"Task {i}", "description": "Bulk", "status": "новая"} for i in range(count)]
+
+
+class TaskBulkAPITest(TestCase):
+    """
+    Тесты пакетных операций над задачами.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="bulk@example.com", name="Bulk", password="password123")
+        self.other = User.objects.create_user(email="stranger@example.com", name="Stranger", password="password123")
+        self.client.force_authenticate(user=self.user)
+
+    def test_bulk_create(self) -> None:
+        """
+        Тест пакетного создания задач, назначенных текущему пользователю.
+        """
+        response = self.client.post(BULK_URL, data=task_payload(5), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 5)
+        self.assertTrue(all(task['id'] for task in response.data))
+        self.assertEqual(Task.objects.filter(user=self.user).count(), 5)
+
+    def test_bulk_create_reports_errors_per_item(self) -> None:
+        """
+        Тест того, что ошибки возвращаются по каждому элементу, а пачка не сохраняется.
+        """
+        payload = task_payload(3)
+        payload[1]['status'] = 'удалена'
+        del payload[2]['title']
+        response = self.client.post(BULK_URL, data=payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data['errors']
+        self.assertEqual(errors[0], {})
+        self.assertIn('status', errors[1])
+        self.assertIn('title', errors[2])
+        self.assertEqual(Task.objects.count(), 0)
+
+    def test_bulk_create_rejects_non_list(self) -> None:
+        """
+        Тест отказа, если тело запроса не является списком.
+        """
+        response = self.client.post(BULK_URL, data=task_payload(1)[0], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_update(self) -> None:
+        """
+        Тест пакетного обновления задач.
+        """
+        create_tasks(self.user, 3)
+        payload = [
+            {"id": task.id, "title": f"Updated {task.id}", "description": "Changed", "status": "завершена"}
+            for task in Task.objects.all()
+        ]
+        response = self.client.put(BULK_URL, data=payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Task.objects.filter(status='завершена', description='Changed').count(), 3)
+        self.assertEqual(response.data[0]['title'], payload[0]['title'])
+
+    def test_bulk_update_foreign_and_missing_tasks(self) -> None:
+        """
+        Тест того, что чужие и несуществующие задачи отклоняются без частичного обновления.
+        """
+        create_tasks(self.user, 1)
+        create_tasks(self.other, 1)
+        own = Task.objects.get(user=self.user)
+        foreign = Task.objects.get(user=self.other)
+        payload = [
+            {"id": own.id, "title": "Mine", "description": "x", "status": "новая"},
+            {"id": foreign.id, "title": "Not mine", "description": "x", "status": "новая"},
+            {"title": "No id", "description": "x", "status": "новая"},
+        ]
+        response = self.client.put(BULK_URL, data=payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data['errors']
+        self.assertEqual(errors[0], {})
+        self.assertIn('id', errors[1])
+        self.assertIn('id', errors[2])
+        own.refresh_from_db()
+        self.assertNotEqual(own.title, "Mine")
+
+    def test_bulk_delete(self) -> None:
+        """
+        Тест пакетного удаления задач.
+        """
+        create_tasks(self.user, 4)
+        ids = list(Task.objects.values_list('id', flat=True)[:3])
+        response = self.client.delete(BULK_URL, data=ids, format='json')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_bulk_delete_foreign_task(self) -> None:
+        """
+        Тест того, что чужая задача не удаляется вместе с пачкой.
+        """
+        create_tasks(self.user, 1)
+        create_tasks(self.other, 1)
+        ids = list(Task.objects.values_list('id', flat=True))
+        response = self.client.delete(BULK_URL, data=ids, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Task.objects.count(), 2)
+
+    def test_bulk_delete_query_count_is_constant(self) -> None:
+        """
+        Тест удаления пачки без поштучных запросов: отметки созданы, кэш списка сброшен.
+        """
+        self.assertEqual(len(self.client.get('/api/tasks/').json()['results']), 0)
+
+        def delete_all() -> None:
+            ids = list(Task.objects.filter(user=self.user).values_list('id', flat=True))
+            response = self.client.delete(BULK_URL, data=ids, format='json')
+            self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        assert_constant_queries(self, lambda count: create_tasks(self.user, count), delete_all, sizes=(10, 100, 500))
+        self.assertFalse(Task.objects.filter(user=self.user).exists())
+        self.assertEqual(TaskTombstone.objects.filter(user_id=self.user.id).count(), 500)
+        self.assertEqual(self.client.get('/api/tasks/').json()['results'], [])
+
+    def test_bulk_non_integer_ids(self) -> None:
+        """
+        Тест ошибок по элементам для нехешируемых и нецелых id в пакетном удалении и обновлении.
+        """
+        create_tasks(self.user, 1)
+        own = Task.objects.get(user=self.user)
+        response = self.client.delete(BULK_URL, data=[own.id, {"id": 1}, [1], "1", True], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data['errors']
+        self.assertEqual(errors[0], {})
+        self.assertTrue(all('id' in item for item in errors[1:]))
+        self.assertTrue(Task.objects.filter(pk=own.pk).exists())
+
+        payload = [
+            {"id": own.id, "title": "Mine", "description": "x", "status": "новая"},
+            {"id": [1], "title": "List id", "description": "x", "status": "новая"},
+            {"id": {"pk": 1}, "title": "Dict id", "description": "x", "status": "новая"},
+        ]
+        response = self.client.put(BULK_URL, data=payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data['errors']
+        self.assertEqual(errors[0], {})
+        self.assertIn('id', errors[1])
+        self.assertIn('id', errors[2])
+
+    def test_bulk_query_count_is_constant(self) -> None:
+        """
+        Тест того, что число запросов не зависит от размера пачки.
+        """
+        counts = []
+        # SQLite ограничивает запрос 999 параметрами: 199 задач с пятью колонками — одна вставка.
+        for size in (10, 199):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(BULK_URL, data=task_payload(size), format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+
+
+class TaskBulkBenchmarkTest(TestCase):
+    """
+    Бенчмарк: пакетное создание против поштучных запросов.
+    """
+    size = 300
+    min_speedup = 10.0
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="bulkbench@example.com", name="Bench", password="password123")
+        self.client.force_authenticate(user=self.user)
+
+    def test_bulk_create_throughput(self) -> None:
+        """
+        Тест того, что пакетное создание минимум на порядок быстрее поштучного.
+        """
+        payload = task_payload(self.size)
+
+        started = time.perf_counter()
+        for item in payload:
+            self.client.post('/api/tasks/', data={**item, "user": self.user.id}, format='json')
+        single = time.perf_counter() - started
+
+        started = time.perf_counter()
+        response = self.client.post(BULK_URL, data=payload, format='json')
+        bulk = time.perf_counter() - started
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Task.objects.count(), self.size * 2)
+        self.assertGreater(single / bulk, self.min_speedup)
@@ -0,0 +1,149 @@
+"""
+Модуль тестов кэша списка задач.
+
+Содержит тесты для проверки:
+- Повторной выдачи списка из кэша без запросов к базе данных.
+- Условных запросов с ETag и Last-Modified и ответа 304, в том числе после записи в ту же секунду.
+- Инвалидации кэша при создании, изменении и удалении задач через API, ORM и пакетные операции.
+- Изоляции кэша между пользователями.
+"""
+
+
+from unittest import mock
+
+from django.test import TestCase
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks.cache import invalidate_user_tasks
+from tasks.models import Task
+from users.models import User
+
+from tests.utils import create_tasks
+
+
+class TaskListCacheTest(TestCase):
+    """
+    Тесты кэширования списка задач.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="cache@example.com", name="Cache", password="password123")
+        self.client.force_authenticate(user=self.user)
+        create_tasks(self.user, 3)
+
+    def _titles(self) -> list:
+        response = self.client.get('/api/tasks/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task['title'] for task in response.data['results']]
+
+    def test_repeated_list_is_served_from_cache(self) -> None:
+        """
+        Тест того, что повторный запрос списка не обращается к базе данных.
+        """
+        first = self.client.get('/api/tasks/')
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/tasks/')
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first['ETag'], second['ETag'])
+
+    def test_if_none_match_returns_304(self) -> None:
+        """
+        Тест ответа 304 на запрос с актуальным ETag без обращения к базе данных.
+        """
+        etag = self.client.get('/api/tasks/')['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/tasks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertFalse(response.content)
+
+    def test_if_modified_since_returns_304(self) -> None:
+        """
+        Тест ответа 304 на запрос с актуальной датой Last-Modified.
+        """
+        with mock.patch('tasks.cache.time.time', return_value=1000.2):
+            invalidate_user_tasks(self.user.id)
+        with mock.patch('tasks.cache.time.time', return_value=1001.5):
+            last_modified = self.client.get('/api/tasks/')['Last-Modified']
+            response = self.client.get('/api/tasks/', HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(last_modified, http_date(1001))
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_write_in_same_second_is_not_modified_since(self) -> None:
+        """
+        Тест того, что запись в ту же секунду, что и предыдущая версия, не дает ответа 304.
+        """
+        with mock.patch('tasks.cache.time.time', return_value=1000.2):
+            invalidate_user_tasks(self.user.id)
+        with mock.patch('tasks.cache.time.time', return_value=1000.5):
+            # Секунда версии еще не закончилась: дата не отдается, проверка только по ETag.
+            self.assertNotIn('Last-Modified', self.client.get('/api/tasks/'))
+        task = Task.objects.first()
+        task.title = 'Same second'
+        with mock.patch('tasks.cache.time.time', return_value=1000.7):
+            task.save()
+        with mock.patch('tasks.cache.time.time', return_value=1002.0):
+            response = self.client.get('/api/tasks/', HTTP_IF_MODIFIED_SINCE=http_date(1000))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Same second', [task['title'] for task in response.data['results']])
+        self.assertEqual(response['Last-Modified'], http_date(1001))
+
+    def test_etag_depends_on_query(self) -> None:
+        """
+        Тест того, что разные параметры запроса кэшируются под разными ETag.
+        """
+        full = self.client.get('/api/tasks/')
+        projected = self.client.get('/api/tasks/', {'fields': 'id'})
+        self.assertNotEqual(full['ETag'], projected['ETag'])
+        self.assertEqual(list(projected.data['results'][0]), ['id'])
+
+    def test_create_via_api_invalidates(self) -> None:
+        """
+        Тест инвалидации кэша после создания задачи через API.
+        """
+        etag = self.client.get('/api/tasks/')['ETag']
+        self.client.post('/api/tasks/', {"title": "Fresh", "description": "x", "user": self.user.id}, format='json')
+        response = self.client.get('/api/tasks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Fresh', [task['title'] for task in response.data['results']])
+
+    def test_orm_save_invalidates(self) -> None:
+        """
+        Тест инвалидации кэша после сохранения задачи через ORM (в том числе из админки).
+        """
+        self._titles()
+        task = Task.objects.first()
+        task.title = 'Renamed'
+        task.save()
+        self.assertIn('Renamed', self._titles())
+
+    def test_delete_invalidates(self) -> None:
+        """
+        Тест инвалидации кэша после удаления задачи.
+        """
+        self._titles()
+        task = Task.objects.first()
+        self.client.delete(f'/api/tasks/{task.id}/')
+        self.assertEqual(len(self._titles()), 2)
+
+    def test_bulk_operations_invalidate(self) -> None:
+        """
+        Тест инвалидации кэша после пакетного создания и обновления.
+        """
+        self._titles()
+        self.client.post('/api/tasks/bulk/', [{"title": "Bulk", "description": "x"}], format='json')
+        self.assertIn('Bulk', self._titles())
+
+        task = Task.objects.get(title='Bulk')
+        self.client.put('/api/tasks/bulk/', [{"id": task.id, "title": "Bulk 2", "description": "x"}], format='json')
+        self.assertIn('Bulk 2', self._titles())
+
+    def test_cache_is_per_user(self) -> None:
+        """
+        Тест того, что пользователи не видят закэшированные списки друг друга.
+        """
+        self._titles()
+        other = User.objects.create_user(email="cache2@example.com", name="Other", password="password123")
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self._titles(), [])
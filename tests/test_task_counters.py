@@ -0,0 +1,166 @@
+"""
+Модуль тестов счетчиков задач по статусам.
+
+Содержит тесты для проверки:
+- Обновления счетчиков при создании, смене статуса и удалении задачи через API.
+- Обновления счетчиков пакетными операциями, `QuerySet.update()` и загрузкой задач.
+- Удаления счетчиков вместе с пользователем при каскадном удалении.
+- Эндпоинта `/api/tasks/stats/` с постоянным числом запросов.
+- Команды `task_counters`: обнаружения расхождений и пересчета.
+"""
+
+
+import io
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks.counters import find_mismatches, get_status_counts
+from tasks.importer import import_tasks
+from tasks.models import Task, TaskStatusCounter
+from users.models import User
+
+from tests.utils import assert_constant_queries, create_tasks
+
+STATS_URL = '/api/tasks/stats/'
+
+
+class TaskCountersTest(TestCase):
+    """
+    Тесты поддержания счетчиков при изменении задач.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="counters@example.com", name="Счетчики", password="password123")
+        self.client.force_authenticate(user=self.user)
+
+    def _counts(self) -> tuple:
+        counts = get_status_counts(self.user.id)
+        return counts['новая'], counts['в процессе'], counts['завершена']
+
+    def test_single_task_lifecycle(self) -> None:
+        """
+        Тест создания, смены статуса и удаления задачи через API.
+        """
+        response = self.client.post(
+            '/api/tasks/', {'title': 'Задача', 'description': 'Описание', 'status': 'новая', 'user': self.user.id},
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self._counts(), (1, 0, 0))
+
+        task_id = response.json()['id']
+        self.client.put(
+            f'/api/tasks/{task_id}/',
+            {'title': 'Задача', 'description': 'Описание', 'status': 'в процессе', 'user': self.user.id},
+        )
+        self.assertEqual(self._counts(), (0, 1, 0))
+
+        self.client.delete(f'/api/tasks/{task_id}/')
+        self.assertEqual(self._counts(), (0, 0, 0))
+        self.assertEqual(find_mismatches(), [])
+
+    def test_bulk_operations(self) -> None:
+        """
+        Тест пакетного создания, обновления и удаления задач.
+        """
+        payload = [{'title': f'Задача {i}', 'description': 'Описание', 'status': 'новая'} for i in range(5)]
+        ids = [row['id'] for row in self.client.post('/api/tasks/bulk/', payload, format='json').json()]
+        self.assertEqual(self._counts(), (5, 0, 0))
+
+        updates = [{'id': pk, 'title': 'Готово', 'description': 'Описание', 'status': 'завершена'} for pk in ids[:3]]
+        self.assertEqual(self.client.put('/api/tasks/bulk/', updates, format='json').status_code, status.HTTP_200_OK)
+        self.assertEqual(self._counts(), (2, 0, 3))
+
+        self.client.delete('/api/tasks/bulk/', ids[1:], format='json')
+        self.assertEqual(self._counts(), (0, 0, 1))
+        self.assertEqual(find_mismatches(), [])
+
+    def test_queryset_update_and_import(self) -> None:
+        """
+        Тест `QuerySet.update()` и загрузки задач `import_tasks` в обход сигналов моделей.
+        """
+        create_tasks(self.user, 4)
+        Task.objects.filter(user=self.user).update(status='в процессе')
+        rows = [(1, {'title': 'Импорт', 'description': '', 'status': 'завершена', 'user': self.user.email})]
+        import_tasks(rows)
+        self.assertEqual(self._counts(), (0, 4, 1))
+        self.assertEqual(find_mismatches(), [])
+
+    def test_owner_change(self) -> None:
+        """
+        Тест переноса задачи другому пользователю.
+        """
+        other = User.objects.create_user(email="counters-other@example.com", name="Другой", password="password123")
+        create_tasks(self.user, 2)
+        task = Task.objects.filter(user=self.user).first()
+        Task.objects.filter(pk=task.pk).update(user=other)
+        self.assertEqual(self._counts(), (1, 0, 0))
+        self.assertEqual(get_status_counts(other.id)['новая'], 1)
+
+    def test_cascade_delete(self) -> None:
+        """
+        Тест того, что счетчики удаляются вместе с пользователем.
+        """
+        create_tasks(self.user, 3)
+        user_id = self.user.id
+        self.user.delete()
+        self.assertFalse(TaskStatusCounter.objects.filter(user_id=user_id).exists())
+        self.assertEqual(find_mismatches(), [])
+
+
+class TaskStatsTest(TestCase):
+    """
+    Тесты эндпоинта сводки по статусам.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="stats@example.com", name="Сводка", password="password123")
+        self.client.force_authenticate(user=self.user)
+
+    def test_stats(self) -> None:
+        """
+        Тест сводки по статусам и изоляции пользователей.
+        """
+        create_tasks(self.user, 2)
+        create_tasks(self.user, 1, status='завершена')
+        other = User.objects.create_user(email="stats-other@example.com", name="Другой", password="password123")
+        create_tasks(other, 5)
+
+        response = self.client.get(STATS_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(), {'counts': {'новая': 2, 'в процессе': 0, 'завершена': 1}, 'total': 3},
+        )
+
+    def test_queries_independent_of_dataset(self) -> None:
+        """
+        Тест того, что число запросов сводки не растет с числом задач.
+        """
+        assert_constant_queries(
+            self, lambda count: create_tasks(self.user, count), lambda: self.client.get(STATS_URL),
+        )
+
+
+class TaskCountersCommandTest(TestCase):
+    """
+    Тесты команды проверки и пересчета счетчиков.
+    """
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="rebuild@example.com", name="Пересчет", password="password123")
+        create_tasks(self.user, 3)
+
+    def test_verify_and_rebuild(self) -> None:
+        """
+        Тест обнаружения расхождения и его исправления пересчетом.
+        """
+        call_command('task_counters', '--verify', stdout=io.StringIO())
+
+        TaskStatusCounter.objects.filter(user=self.user).update(count=7)
+        with self.assertRaisesMessage(CommandError, 'Расхождений: 1'):
+            call_command('task_counters', stdout=io.StringIO())
+
+        call_command('task_counters', '--rebuild', stdout=io.StringIO())
+        self.assertEqual(find_mismatches(), [])
+        self.assertEqual(get_status_counts(self.user.id)['новая'], 3)
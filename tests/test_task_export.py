@@ -0,0 +1,116 @@
+"""
+Модуль тестов потоковой выгрузки задач.
+
+Содержит тесты для проверки:
+- Выгрузки задач текущего пользователя в форматах NDJSON и CSV.
+- Фильтрации, сортировки и проекции полей при выгрузке.
+- Ответа на неизвестный формат.
+- Постоянного объема памяти при росте числа задач.
+"""
+
+
+import csv
+import io
+import json
+import tracemalloc
+
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+from users.models import User
+
+from tests.utils import create_tasks
+
+
+def consume(response) -> str:
+    """
+    Читает тело потокового ответа целиком.
+    """
+    return b''.join(response.streaming_content).decode()
+
+
+class TaskExportTest(TestCase):
+    """
+    Тесты выгрузки задач по маршруту `/api/tasks/export/`.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="export@example.com", name="Export", password="password123")
+        self.client.force_authenticate(user=self.user)
+
+    def test_ndjson(self) -> None:
+        """
+        Тест выгрузки в NDJSON: по одному объекту задачи на строку, только свои задачи.
+        """
+        other = User.objects.create_user(email="other@example.com", name="Other", password="password123")
+        create_tasks(self.user, 3)
+        create_tasks(other, 2)
+
+        response = self.client.get('/api/tasks/export/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertTrue(response['Content-Type'].startswith('application/x-ndjson'))
+        self.assertIn('tasks.ndjson', response['Content-Disposition'])
+
+        rows = [json.loads(line) for line in consume(response).splitlines()]
+        expected = self.client.get('/api/tasks/').data['results']
+        self.assertEqual(rows, [dict(task) for task in expected])
+        self.assertEqual(rows[0]['user'], self.user.id)
+
+    def test_csv(self) -> None:
+        """
+        Тест выгрузки в CSV с заголовком и проекцией полей.
+        """
+        create_tasks(self.user, 2, title='Задача, с запятой')
+        response = self.client.get('/api/tasks/export/?output=csv&fields=title,id')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/csv'))
+
+        rows = list(csv.reader(io.StringIO(consume(response))))
+        self.assertEqual(rows[0], ['id', 'title'])
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1][1], 'Задача, с запятой')
+
+    def test_filter_and_ordering(self) -> None:
+        """
+        Тест фильтра по статусу и сортировки в выгрузке.
+        """
+        create_tasks(self.user, 2, status='новая')
+        create_tasks(self.user, 3, status='завершена')
+        response = self.client.get('/api/tasks/export/?status=завершена&ordering=-id')
+        ids = [json.loads(line)['id'] for line in consume(response).splitlines()]
+        self.assertEqual(len(ids), 3)
+        self.assertEqual(ids, sorted(ids, reverse=True))
+
+    def test_unknown_format(self) -> None:
+        """
+        Тест ответа 400 на неизвестный формат выгрузки.
+        """
+        response = self.client.get('/api/tasks/export/?output=xml')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requires_authentication(self) -> None:
+        """
+        Тест отказа в выгрузке без аутентификации.
+        """
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get('/api/tasks/export/').status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_constant_memory(self) -> None:
+        """
+        Тест того, что пиковая память выгрузки не растет пропорционально числу задач.
+        """
+        def peak_memory() -> int:
+            response = self.client.get('/api/tasks/export/?output=csv')
+            tracemalloc.start()
+            for _chunk in response.streaming_content:
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak
+
+        create_tasks(self.user, 2000)
+        small = peak_memory()
+        create_tasks(self.user, 18000)
+        large = peak_memory()
+        self.assertLess(large, small * 2)
@@ -0,0 +1,155 @@
+"""
+Модуль тестов фильтрации, сортировки и проекции полей списка задач.
+
+Содержит тесты для проверки:
+- Фильтрации по одному и нескольким статусам, отказа на неизвестный статус.
+- Сортировки и обхода страниц курсором при сортировке по неуникальному полю.
+- Проекции полей `fields=`, которая не читает из базы лишние колонки.
+"""
+
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks.models import Task
+from users.models import User
+
+from tests.utils import create_tasks
+
+
+class TaskFilterTest(TestCase):
+    """
+    Тесты фильтрации и сортировки списка задач.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="filter@example.com", name="Filter", password="password123")
+        self.client.force_authenticate(user=self.user)
+        create_tasks(self.user, 3, status='новая')
+        create_tasks(self.user, 2, status='в процессе')
+        create_tasks(self.user, 4, status='завершена')
+
+    def test_filter_by_status(self) -> None:
+        """
+        Тест фильтрации по одному статусу.
+        """
+        response = self.client.get('/api/tasks/', {'status': 'завершена'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 4)
+        self.assertEqual({task['status'] for task in response.data['results']}, {'завершена'})
+
+    def test_filter_by_several_statuses(self) -> None:
+        """
+        Тест фильтрации по нескольким статусам через запятую.
+        """
+        response = self.client.get('/api/tasks/', {'status': 'новая,в процессе'})
+        self.assertEqual(len(response.data['results']), 5)
+
+    def test_filter_by_unknown_status(self) -> None:
+        """
+        Тест отказа при неизвестном статусе.
+        """
+        response = self.client.get('/api/tasks/', {'status': 'удалена'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('status', response.data)
+
+    def test_ordering(self) -> None:
+        """
+        Тест сортировки по статусу в обратном порядке с уточнением по id.
+        """
+        response = self.client.get('/api/tasks/', {'ordering': '-status'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = [(task['status'], task['id']) for task in response.data['results']]
+        self.assertEqual(rows, sorted(rows, reverse=True))
+
+    def test_ordering_by_unknown_field_is_ignored(self) -> None:
+        """
+        Тест того, что сортировка по неразрешенному полю игнорируется.
+        """
+        response = self.client.get('/api/tasks/', {'ordering': 'description'})
+        ids = [task['id'] for task in response.data['results']]
+        self.assertEqual(ids, sorted(ids))
+
+    def test_cursor_walk_with_non_unique_ordering(self) -> None:
+        """
+        Тест обхода всех страниц вперед и назад при сортировке по неуникальному полю.
+        """
+        seen = []
+        url = '/api/tasks/?ordering=status&page_size=2'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend((task['status'], task['id']) for task in response.data['results'])
+            last_page = response
+            url = response.data['next']
+        self.assertEqual(seen, sorted(seen))
+        self.assertEqual(len(seen), Task.objects.count())
+
+        response = self.client.get(last_page.data['previous'])
+        previous = [(task['status'], task['id']) for task in response.data['results']]
+        self.assertEqual(previous, seen[-3:-1])
+
+    def test_invalid_composite_cursor(self) -> None:
+        """
+        Тест того, что курсор от другой сортировки отклоняется, а не приводит к ошибке сервера.
+        """
+        next_url = self.client.get('/api/tasks/', {'page_size': 2}).data['next']
+        response = self.client.get(next_url + '&ordering=status')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TaskFieldsProjectionTest(TestCase):
+    """
+    Тесты проекции полей списка задач.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="fields@example.com", name="Fields", password="password123")
+        self.client.force_authenticate(user=self.user)
+        create_tasks(self.user, 3, description='Очень длинное описание')
+
+    def test_projection_limits_output(self) -> None:
+        """
+        Тест того, что в ответе присутствуют только запрошенные поля.
+        """
+        response = self.client.get('/api/tasks/', {'fields': 'title,id'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for task in response.data['results']:
+            self.assertEqual(list(task), ['id', 'title'])
+
+    def test_projection_limits_selected_columns(self) -> None:
+        """
+        Тест того, что незапрошенная колонка `description` не читается из базы.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/tasks/', {'fields': 'id,title'})
+        task_queries = [query['sql'] for query in queries.captured_queries if 'tasks_task' in query['sql']]
+        self.assertEqual(len(task_queries), 1)
+        self.assertNotIn('description', task_queries[0])
+
+    def test_projection_with_ordering(self) -> None:
+        """
+        Тест того, что поля сортировки догружаются одним запросом вместе с проекцией.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/tasks/', {'fields': 'id', 'ordering': 'status', 'page_size': 2})
+        self.assertIsNotNone(response.data['next'])
+        self.assertEqual(len([q for q in queries.captured_queries if 'tasks_task' in q['sql']]), 1)
+
+    def test_projection_on_detail(self) -> None:
+        """
+        Тест проекции полей при получении одной задачи.
+        """
+        task = Task.objects.first()
+        response = self.client.get(f'/api/tasks/{task.id}/', {'fields': 'status'})
+        self.assertEqual(response.data, {'status': task.status})
+
+    def test_unknown_field(self) -> None:
+        """
+        Тест отказа при запросе неизвестного поля.
+        """
+        response = self.client.get('/api/tasks/', {'fields': 'id,secret'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('fields', response.data)
@@ -0,0 +1,139 @@
+"""
+Модуль тестов полнотекстового поиска задач.
+
+Содержит тесты для проверки:
+- Поиска по названию и описанию, по началу последнего слова и по нескольким словам.
+- Поиска без учета регистра и диакритики.
+- Обновления индекса при изменении, удалении и пакетной вставке задач.
+- Безопасной обработки синтаксиса FTS5 в запросе и запросов без слов.
+- Изоляции пользователей и сочетания с другими фильтрами.
+- Поиска в админке по индексу и по email владельца.
+"""
+
+
+from django.contrib.admin.sites import AdminSite
+from django.test import RequestFactory, TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks.models import Task
+from tasks.search import parse_terms
+from users.admin import TaskAdmin
+from users.models import User
+
+from tests.utils import assert_constant_queries, create_tasks
+
+
+class TaskSearchTest(TestCase):
+    """
+    Тесты поиска задач через API.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="search@example.com", name="Поиск", password="password123")
+        self.client.force_authenticate(user=self.user)
+        self.report = Task.objects.create(
+            user=self.user, title='Квартальный отчёт', description='Собрать цифры продаж', status='новая',
+        )
+        self.meeting = Task.objects.create(
+            user=self.user, title='Встреча', description='Обсудить отчет с командой', status='завершена',
+        )
+        Task.objects.create(user=self.user, title='Покупки', description='Молоко и хлеб', status='новая')
+
+    def _search(self, query: str, **params) -> list:
+        response = self.client.get('/api/tasks/', {'q': query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row['id'] for row in response.json()['results']]
+
+    def test_title_and_description(self) -> None:
+        """
+        Тест поиска по названию и описанию без учета регистра, диакритики и окончаний.
+        """
+        self.assertEqual(self._search('ОТЧЕТ'), [self.report.id, self.meeting.id])
+        self.assertEqual(self._search('продаж'), [self.report.id])
+        self.assertEqual(self._search('отч'), [self.report.id, self.meeting.id])
+        self.assertEqual(self._search('от'), [])
+
+    def test_all_terms_required(self) -> None:
+        """
+        Тест того, что задача должна содержать все слова запроса.
+        """
+        self.assertEqual(self._search('отчет командой'), [self.meeting.id])
+        self.assertEqual(self._search('отчет ком'), [self.meeting.id])
+        self.assertEqual(self._search('отч командой'), [])
+        self.assertEqual(self._search('отчет хлеб'), [])
+
+    def test_combined_with_filters(self) -> None:
+        """
+        Тест сочетания поиска с фильтром по статусу и проекцией полей.
+        """
+        self.assertEqual(self._search('отчет', status='новая', fields='id'), [self.report.id])
+
+    def test_index_follows_changes(self) -> None:
+        """
+        Тест обновления индекса при изменении, удалении и пакетной вставке задач.
+        """
+        self.client.put(
+            f'/api/tasks/{self.report.id}/',
+            {'title': 'Годовой план', 'description': 'Без цифр', 'status': 'новая', 'user': self.user.id},
+        )
+        self.assertEqual(self._search('отчет'), [self.meeting.id])
+        self.assertEqual(self._search('годовой'), [self.report.id])
+
+        self.client.delete(f'/api/tasks/{self.meeting.id}/')
+        self.assertEqual(self._search('отчет'), [])
+
+        create_tasks(self.user, 3, title='Пакетная задача')
+        self.assertEqual(len(self._search('пакетная')), 3)
+
+    def test_query_syntax_is_escaped(self) -> None:
+        """
+        Тест того, что операторы и кавычки FTS5 в запросе не вызывают ошибок.
+        """
+        self.assertEqual(self._search('"отчет OR NEAR(*'), [])
+        self.assertEqual(self._search('отчет*'), [self.report.id, self.meeting.id])
+        self.assertEqual(self._search('!!!'), [])
+        self.assertEqual(parse_terms('Отчет, отчет и ОТЧЕТ'), ['отчет', 'и'])
+
+    def test_other_users_isolated(self) -> None:
+        """
+        Тест того, что поиск не находит задачи других пользователей.
+        """
+        other = User.objects.create_user(email="search-other@example.com", name="Другой", password="password123")
+        create_tasks(other, 2, title='Чужой отчет')
+        self.assertEqual(self._search('чужой'), [])
+
+    def test_queries_independent_of_dataset(self) -> None:
+        """
+        Тест постоянного числа запросов поиска при росте числа задач.
+        """
+        assert_constant_queries(
+            self, lambda count: create_tasks(self.user, count, title='Отчет'),
+            lambda: self.client.get('/api/tasks/', {'q': 'отчет', 'page_size': 500}),
+        )
+
+
+class TaskAdminSearchTest(TestCase):
+    """
+    Тесты поиска задач в админке.
+    """
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="admin-search@example.com", name="Админ", password="password123")
+        self.other = User.objects.create_user(email="owner@example.com", name="Владелец", password="password123")
+        self.task = Task.objects.create(user=self.user, title='Отчет', description='Описание', status='новая')
+        self.owned = Task.objects.create(user=self.other, title='Другое', description='Описание', status='новая')
+        self.admin = TaskAdmin(Task, AdminSite())
+
+    def _search(self, term: str) -> list:
+        request = RequestFactory().get('/admin/tasks/task/', {'q': term})
+        queryset, may_have_duplicates = self.admin.get_search_results(request, Task.objects.all(), term)
+        self.assertFalse(may_have_duplicates)
+        return sorted(queryset.values_list('id', flat=True))
+
+    def test_search_by_text_and_owner_email(self) -> None:
+        """
+        Тест поиска по тексту задачи и по email владельца.
+        """
+        self.assertEqual(self._search('отчет'), [self.task.id])
+        self.assertEqual(self._search('owner@example.com'), [self.owned.id])
+        self.assertEqual(self._search('описание'), [self.task.id, self.owned.id])
+        self.assertEqual(self._search(' '), [self.task.id, self.owned.id])
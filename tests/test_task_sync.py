@@ -0,0 +1,189 @@
+"""
+Модуль тестов инкрементальной синхронизации задач.
+
+Содержит тесты для проверки:
+- Первичной загрузки и получения только изменений после курсора.
+- Отметок об удалении для одиночного, пакетного и каскадного удаления.
+- Обновления `updated_at` пакетным обновлением.
+- Обхода изменений постранично без пропусков и повторов.
+- Повторной выдачи изменений из окна `TASK_SYNC_LAG_SECONDS`.
+- Ошибок некорректного и устаревшего курсора и изоляции пользователей.
+- Постоянного числа запросов синхронизации при росте числа задач.
+- Удаления устаревших отметок командой `prune_task_tombstones`.
+"""
+
+
+import io
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks.models import Task, TaskTombstone
+from tasks.sync import SyncCursor, encode_cursor
+from users.models import User
+
+from tests.utils import assert_constant_queries, create_tasks
+
+CHANGES_URL = '/api/tasks/changes/'
+
+
+@override_settings(TASK_SYNC_LAG_SECONDS=0)
+class TaskChangesTest(TestCase):
+    """
+    Тесты эндпоинта изменений задач.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(email="sync@example.com", name="Синхронизация", password="password123")
+        self.client.force_authenticate(user=self.user)
+        create_tasks(self.user, 3)
+
+    def _sync(self, cursor: str | None = None, **params) -> dict:
+        if cursor is not None:
+            params['since'] = cursor
+        response = self.client.get(CHANGES_URL, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Cache-Control'], 'private, no-store')
+        return response.json()
+
+    def test_initial_and_incremental(self) -> None:
+        """
+        Тест первичной загрузки и последующей синхронизации только измененных задач.
+        """
+        initial = self._sync()
+        self.assertEqual(len(initial['changed']), 3)
+        self.assertEqual(initial['deleted'], [])
+        self.assertFalse(initial['has_more'])
+        self.assertEqual(
+            set(initial['changed'][0]), {'id', 'title', 'description', 'status', 'user', 'updated_at'}
+        )
+        self.assertEqual(self._sync(initial['cursor'])['changed'], [])
+
+        task = Task.objects.filter(user=self.user).first()
+        response = self.client.put(
+            f'/api/tasks/{task.id}/',
+            {'title': 'Новое название', 'description': 'Описание', 'status': 'завершена', 'user': self.user.id},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        changes = self._sync(initial['cursor'])
+        self.assertEqual([(row['id'], row['title']) for row in changes['changed']], [(task.id, 'Новое название')])
+        self.assertEqual(self._sync(changes['cursor'])['changed'], [])
+
+    def test_deletions(self) -> None:
+        """
+        Тест отметок об удалении для одиночного и пакетного удаления.
+        """
+        cursor = self._sync()['cursor']
+        first, second, third = Task.objects.filter(user=self.user).order_by('id')
+        self.client.delete(f'/api/tasks/{first.id}/')
+        self.client.delete('/api/tasks/bulk/', [second.id, third.id], format='json')
+
+        changes = self._sync(cursor)
+        self.assertEqual(changes['changed'], [])
+        self.assertEqual(sorted(changes['deleted']), [first.id, second.id, third.id])
+
+    def test_cascade_delete_records_tombstones(self) -> None:
+        """
+        Тест того, что каскадное удаление владельца не ломается из-за отметок об удалении.
+        """
+        other = User.objects.create_user(email="cascade@example.com", name="Каскад", password="password123")
+        create_tasks(other, 2)
+        other_id = other.id
+        other.delete()
+        self.assertEqual(TaskTombstone.objects.filter(user_id=other_id).count(), 2)
+
+    def test_bulk_update_touches_updated_at(self) -> None:
+        """
+        Тест того, что пакетное обновление попадает в изменения.
+        """
+        cursor = self._sync()['cursor']
+        tasks = list(Task.objects.filter(user=self.user).order_by('id')[:2])
+        payload = [{'id': task.id, 'title': 'Пакет', 'description': 'Описание', 'status': 'новая'} for task in tasks]
+        self.assertEqual(self.client.put('/api/tasks/bulk/', payload, format='json').status_code, status.HTTP_200_OK)
+
+        changes = self._sync(cursor)
+        self.assertEqual([row['id'] for row in changes['changed']], [task.id for task in tasks])
+
+    def test_paging_without_gaps(self) -> None:
+        """
+        Тест постраничного обхода изменений с одинаковыми моментами изменения.
+        """
+        cursor = self._sync()['cursor']
+        Task.objects.filter(user=self.user).update(updated_at=timezone.now())
+        create_tasks(self.user, 4)
+        Task.objects.filter(user=self.user).order_by('id').last().delete()
+
+        seen, deleted, has_more = [], [], True
+        while has_more:
+            page = self._sync(cursor, limit=2, fields='id')
+            self.assertLessEqual(len(page['changed']) + len(page['deleted']), 2)
+            seen += [row['id'] for row in page['changed']]
+            deleted += page['deleted']
+            cursor, has_more = page['cursor'], page['has_more']
+
+        alive = list(Task.objects.filter(user=self.user).values_list('id', flat=True))
+        self.assertEqual(sorted(seen), sorted(alive))
+        self.assertEqual(len(deleted), 1)
+
+    @override_settings(TASK_SYNC_LAG_SECONDS=60)
+    def test_recent_changes_repeated(self) -> None:
+        """
+        Тест того, что изменения из окна задержки выдаются повторно, а не пропускаются.
+        """
+        first = self._sync()
+        self.assertEqual(len(self._sync(first['cursor'])['changed']), 3)
+
+    def test_invalid_and_expired_cursor(self) -> None:
+        """
+        Тест ошибок для поврежденного и устаревшего курсора и некорректного limit.
+        """
+        self.assertEqual(self.client.get(CHANGES_URL, {'since': 'garbage'}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(CHANGES_URL, {'limit': '0'}).status_code, status.HTTP_400_BAD_REQUEST)
+        expired = encode_cursor(SyncCursor(timezone.now() - timedelta(days=365)))
+        self.assertEqual(self.client.get(CHANGES_URL, {'since': expired}).status_code, status.HTTP_410_GONE)
+
+    def test_other_users_isolated(self) -> None:
+        """
+        Тест того, что изменения и удаления других пользователей не видны.
+        """
+        cursor = self._sync()['cursor']
+        other = User.objects.create_user(email="other-sync@example.com", name="Другой", password="password123")
+        create_tasks(other, 2)
+        Task.objects.filter(user=other).first().delete()
+
+        changes = self._sync(cursor)
+        self.assertEqual((changes['changed'], changes['deleted']), ([], []))
+
+    def test_queries_independent_of_dataset(self) -> None:
+        """
+        Тест того, что число запросов синхронизации не растет с числом задач.
+        """
+        cursor = self._sync()['cursor']
+
+        def create_old_tasks(count: int) -> None:
+            create_tasks(self.user, count)
+            Task.objects.filter(user=self.user).update(updated_at=timezone.now() - timedelta(days=1))
+
+        assert_constant_queries(
+            self, create_old_tasks, lambda: self.assertEqual(self._sync(cursor)['changed'], []),
+        )
+
+
+class PruneTaskTombstonesTest(TestCase):
+    """
+    Тесты команды удаления устаревших отметок об удалении.
+    """
+    def test_prunes_only_old(self) -> None:
+        """
+        Тест того, что удаляются только отметки старше срока хранения.
+        """
+        TaskTombstone.objects.create(task_id=1, user_id=1)
+        TaskTombstone.objects.create(task_id=2, user_id=1)
+        TaskTombstone.objects.filter(task_id=1).update(deleted_at=timezone.now() - timedelta(days=40))
+
+        call_command('prune_task_tombstones', '--days', '30', stdout=io.StringIO())
+        self.assertEqual(list(TaskTombstone.objects.values_list('task_id', flat=True)), [2])
@@ -58,7 +58,7 @@ class TaskAPITest(TestCase):
         """
         response = self.client.get('/api/tasks/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
 
     def test_update_task(self) -> None:
         """
@@ -0,0 +1,229 @@
+"""
+Модуль тестов ограничения частоты запросов и сброса нагрузки.
+
+Содержит тесты для проверки:
+- Корзины токенов в памяти и в общем файле SQLite (всплеск, пополнение, общий счет процессов).
+- Ограничений на пользователя и на адрес клиента с ответом 429 и заголовком `Retry-After`.
+- Ограничений попыток входа на адрес и на учетную запись.
+- Ограничений в асинхронных представлениях.
+- Ответа 503 с `Retry-After` при превышении числа запросов в обработке и времени в очереди.
+- Быстрого отказа лишним запросам при перегрузке.
+"""
+
+
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+from task_manager import load_shedding
+from task_manager.load_shedding import LoadSheddingMiddleware, queue_milliseconds
+from task_manager.throttling import MemoryBucketStore, SQLiteBucketStore, parse_rate
+from users.models import User
+
+from tests.test_async_views import bearer
+
+
+def throttle_rates(**rates) -> dict:
+    """
+    Возвращает настройку REST_FRAMEWORK с заданными частотами ограничений.
+    """
+    return {
+        **settings.REST_FRAMEWORK,
+        'DEFAULT_THROTTLE_RATES': {**settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'], **rates},
+    }
+
+
+class BucketStoreTest(SimpleTestCase):
+    """
+    Тесты хранилищ корзин токенов.
+    """
+    def _check_bucket(self, store) -> None:
+        capacity, refill_rate = parse_rate('3/s')
+        self.assertEqual([store.consume('key', capacity, refill_rate, 100.0) for _ in range(3)], [0, 0, 0])
+        self.assertAlmostEqual(store.consume('key', capacity, refill_rate, 100.0), 1 / 3)
+        self.assertEqual(store.consume('other', capacity, refill_rate, 100.0), 0)
+        self.assertEqual(store.consume('key', capacity, refill_rate, 100.5), 0)
+        self.assertGreater(store.consume('key', capacity, refill_rate, 100.5), 0)
+
+    def test_memory_store(self) -> None:
+        """
+        Тест всплеска до размера корзины, пополнения и независимости ключей в памяти.
+        """
+        self._check_bucket(MemoryBucketStore())
+
+    def test_sqlite_store_shared(self) -> None:
+        """
+        Тест корзин в файле SQLite, общих для хранилищ разных процессов.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'throttle.sqlite3')
+            self._check_bucket(SQLiteBucketStore(path))
+
+            first, second = SQLiteBucketStore(path), SQLiteBucketStore(path)
+            self.assertEqual(first.consume('shared', 1, 1.0, 200.0), 0)
+            self.assertGreater(second.consume('shared', 1, 1.0, 200.0), 0)
+
+    def test_parse_rate(self) -> None:
+        """
+        Тест разбора частоты в формате DRF.
+        """
+        self.assertEqual(parse_rate('120/min'), (120, 2.0))
+        self.assertIsNone(parse_rate(None))
+
+
+class ApiThrottlingTest(TestCase):
+    """
+    Тесты ограничений частоты запросов к API.
+    """
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="throttle@example.com", name="Лимит", password="password123")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    @override_settings(REST_FRAMEWORK=throttle_rates(user='3/min'))
+    def test_user_rate(self) -> None:
+        """
+        Тест ответа 429 с Retry-After после исчерпания корзины пользователя.
+        """
+        statuses = [self.client.get('/api/tasks/').status_code for _ in range(4)]
+        self.assertEqual(statuses, [200, 200, 200, 429])
+        response = self.client.get('/api/tasks/')
+        self.assertEqual(response['Retry-After'], '20')
+
+        other = APIClient()
+        other.force_authenticate(User.objects.create_user(email="other-throttle@example.com", name="Другой"))
+        self.assertEqual(other.get('/api/tasks/').status_code, status.HTTP_200_OK)
+
+    @override_settings(REST_FRAMEWORK=throttle_rates(ip='2/min'))
+    def test_ip_rate(self) -> None:
+        """
+        Тест ограничения на адрес клиента независимо от пользователя.
+        """
+        statuses = [self.client.get('/api/tasks/', REMOTE_ADDR='10.0.0.1').status_code for _ in range(3)]
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(self.client.get('/api/tasks/', REMOTE_ADDR='10.0.0.2').status_code, status.HTTP_200_OK)
+
+    @override_settings(REST_FRAMEWORK=throttle_rates(ip='2/min'))
+    def test_spoofed_forwarded_for(self) -> None:
+        """
+        Тест того, что смена подделанного X-Forwarded-For не обходит ограничение на адрес.
+        """
+        statuses = [
+            self.client.get('/api/tasks/', REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR=f'192.0.2.{i}').status_code
+            for i in range(3)
+        ]
+        self.assertEqual(statuses, [200, 200, 429])
+
+        rest_framework = {**throttle_rates(ip='2/min'), 'NUM_PROXIES': 1}
+        with override_settings(REST_FRAMEWORK=rest_framework):
+            response = self.client.get('/api/tasks/', REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR='192.0.2.9')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(REST_FRAMEWORK=throttle_rates(login='3/min', login_account='2/min'))
+    def test_login_rates(self) -> None:
+        """
+        Тест ограничения попыток входа на учетную запись с разных адресов и на адрес.
+        """
+        def login(email: str, address: str) -> int:
+            return APIClient().post(
+                '/api/token/', {'email': email, 'password': 'wrong-password'}, REMOTE_ADDR=address,
+            ).status_code
+
+        self.assertEqual(login('throttle@example.com', '10.0.0.1'), status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(login('THROTTLE@example.com', '10.0.0.2'), status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(login('throttle@example.com', '10.0.0.3'), status.HTTP_429_TOO_MANY_REQUESTS)
+
+        self.assertEqual(login('a@example.com', '10.0.0.9'), status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(login('b@example.com', '10.0.0.9'), status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(login('c@example.com', '10.0.0.9'), status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(login('d@example.com', '10.0.0.9'), status.HTTP_429_TOO_MANY_REQUESTS)
+
+    @override_settings(REST_FRAMEWORK=throttle_rates(user='1/min'))
+    async def test_async_view(self) -> None:
+        """
+        Тест ограничения частоты в асинхронном представлении.
+        """
+        headers = bearer(await User.objects.aget(pk=self.user.pk))
+        self.assertEqual((await self.async_client.get('/api/async/tasks/', headers=headers)).status_code, 200)
+        response = await self.async_client.get('/api/async/tasks/', headers=headers)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response['Retry-After'], '60')
+
+
+class LoadSheddingTest(TestCase):
+    """
+    Тесты сброса нагрузки.
+    """
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user(email="shed@example.com", name="Нагрузка", password="password123")
+        )
+
+    @override_settings(LOAD_SHEDDING={**settings.LOAD_SHEDDING, 'MAX_IN_FLIGHT': 2})
+    def test_in_flight_limit(self) -> None:
+        """
+        Тест ответа 503 при достижении числа запросов в обработке; /metrics обслуживается всегда.
+        """
+        with mock.patch.object(load_shedding, '_in_flight', 2):
+            response = self.client.get('/api/tasks/')
+            self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+            self.assertEqual(response['Retry-After'], '1')
+            self.assertEqual(self.client.get('/metrics').status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get('/api/tasks/').status_code, status.HTTP_200_OK)
+        self.assertEqual(load_shedding.in_flight(), 0)
+
+    def test_queue_time(self) -> None:
+        """
+        Тест отказа в запросе, который ждал в очереди прокси дольше порога.
+        """
+        now = time.time()
+        stale = self.client.get('/api/tasks/', HTTP_X_REQUEST_START=f't={now - 5:.3f}')
+        self.assertEqual(stale.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        fresh = self.client.get('/api/tasks/', HTTP_X_REQUEST_START=f't={int(now * 1000)}')
+        self.assertEqual(fresh.status_code, status.HTTP_200_OK)
+
+    def test_queue_time_units(self) -> None:
+        """
+        Тест разбора X-Request-Start в секундах, миллисекундах и микросекундах.
+        """
+        factory, now = RequestFactory(), 1700000000.0
+        for value in ('t=1699999999.5', 't=1699999999500', '1699999999500000'):
+            request = factory.get('/', HTTP_X_REQUEST_START=value)
+            self.assertAlmostEqual(queue_milliseconds(request, now), 500.0)
+        self.assertIsNone(queue_milliseconds(factory.get('/'), now))
+
+    @override_settings(LOAD_SHEDDING={**settings.LOAD_SHEDDING, 'MAX_IN_FLIGHT': 2})
+    def test_overload_rejected_fast(self) -> None:
+        """
+        Тест того, что сверх лимита запросы отклоняются сразу, не дожидаясь принятых.
+        """
+        release = threading.Event()
+
+        def slow_view(request) -> HttpResponse:
+            release.wait(5)
+            return HttpResponse(b'ok')
+
+        middleware = LoadSheddingMiddleware(slow_view)
+        request = RequestFactory().get('/api/tasks/')
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            admitted = [executor.submit(middleware, request) for _ in range(2)]
+            while load_shedding.in_flight() < 2:
+                time.sleep(0.001)
+            started = time.perf_counter()
+            shed = [middleware(request).status_code for _ in range(10)]
+            elapsed = time.perf_counter() - started
+            release.set()
+            self.assertEqual([future.result().status_code for future in admitted], [200, 200])
+
+        self.assertEqual(shed, [503] * 10)
+        self.assertLess(elapsed, 0.05)
+        self.assertEqual(load_shedding.in_flight(), 0)
@@ -50,7 +50,7 @@ class UserAPITest(TestCase):
         """
         response = self.client.get('/api/users/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
 
     def test_update_user(self) -> None:
         """
@@ -0,0 +1,149 @@
+"""
+Модуль тестов удаления пользователя с задачами порциями.
+
+Содержит тесты для проверки:
+- Удаления пользователя через API порциями без загрузки задач в память.
+- Отметок об удалении, счетчиков и инвалидации кэша при пакетном удалении.
+- Возврата к сборщику Django при наличии сторонних получателей сигналов удаления.
+- Отчета о прогрессе, прерывания и продолжения удаления.
+- Прогресса в задании отложенного удаления.
+- Команды `benchmark_user_delete`.
+"""
+
+
+import io
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models.signals import post_delete
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks import deletion, jobs
+from tasks.models import Task, TaskStatusCounter, TaskTombstone
+from users.models import User
+
+from tests.utils import create_tasks
+
+
+@override_settings(TASK_DELETE_CHUNK_SIZE=100)
+class ChunkedUserDeleteTest(TestCase):
+    """
+    Тесты удаления задач пользователя порциями.
+    """
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="chunked@example.com", name="Порции")
+        create_tasks(self.user, 250)
+        self.other = User.objects.create_user(email="kept@example.com", name="Остается", password="password123")
+        create_tasks(self.other, 5)
+
+    def test_api_delete(self) -> None:
+        """
+        Тест удаления через API без загрузки задач: отметки созданы, счетчики удалены.
+        """
+        client = APIClient()
+        client.force_authenticate(user=self.other)
+        self.assertTrue(deletion.bulk_delete_supported())
+        with mock.patch.object(Task, 'from_db', side_effect=AssertionError('задача загружена')):
+            response = client.delete(f'/api/users/{self.user.id}/')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+        self.assertFalse(Task.objects.filter(user_id=self.user.pk).exists())
+        self.assertFalse(TaskStatusCounter.objects.filter(user_id=self.user.pk).exists())
+        self.assertEqual(TaskTombstone.objects.filter(user_id=self.user.pk).count(), 250)
+        self.assertEqual(Task.objects.filter(user=self.other).count(), 5)
+
+    def test_cache_invalidated(self) -> None:
+        """
+        Тест сброса кэша списка задач владельца при пакетном удалении.
+        """
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        self.assertEqual(len(client.get('/api/tasks/').json()['results']), 50)
+        deletion.delete_user_tasks(self.user.pk)
+        self.assertEqual(client.get('/api/tasks/').json()['results'], [])
+
+    def test_foreign_receiver_uses_collector(self) -> None:
+        """
+        Тест удаления через сборщик, если у задач есть сторонний получатель сигнала удаления.
+        """
+        deleted_ids = []
+
+        def receiver(sender, instance: Task, **kwargs) -> None:
+            deleted_ids.append(instance.pk)
+
+        post_delete.connect(receiver, sender=Task)
+        self.addCleanup(post_delete.disconnect, receiver, sender=Task)
+
+        self.assertFalse(deletion.bulk_delete_supported())
+        result = deletion.delete_user(self.user.pk)
+        self.assertEqual(len(deleted_ids), 250)
+        self.assertEqual(result['per_model']['tasks.Task'], 250)
+        self.assertEqual(TaskTombstone.objects.filter(user_id=self.user.pk).count(), 250)
+
+    def test_progress_and_resume(self) -> None:
+        """
+        Тест отчета о прогрессе по порциям, прерывания и продолжения удаления.
+        """
+        calls = []
+        result = deletion.delete_user(self.user.pk, on_progress=lambda deleted, total: calls.append((deleted, total)))
+        self.assertEqual(calls, [(100, 250), (200, 250), (250, 250)])
+        self.assertTrue(result['completed'])
+        self.assertEqual(result['per_model']['users.User'], 1)
+
+        user = User.objects.create_user(email="resume@example.com", name="Продолжение")
+        create_tasks(user, 150)
+        result = deletion.delete_user(user.pk, on_progress=lambda deleted, total: False)
+        self.assertEqual((result['completed'], result['deleted']), (False, 100))
+        self.assertTrue(User.objects.filter(pk=user.pk).exists())
+
+        result = deletion.delete_user(user.pk)
+        self.assertTrue(result['completed'])
+        self.assertEqual(result['per_model']['tasks.Task'], 50)
+        self.assertFalse(User.objects.filter(pk=user.pk).exists())
+
+    def test_job_progress(self) -> None:
+        """
+        Тест прогресса в задании отложенного удаления пользователя.
+        """
+        job = jobs.enqueue('delete_user', {'user_id': self.user.pk})
+        jobs.run_job(jobs.claim_job())
+        job.refresh_from_db()
+        self.assertEqual(job.progress, {'deleted': 250, 'total': 250})
+        self.assertEqual(job.result['per_model']['tasks.Task'], 250)
+
+
+class BenchmarkUserDeleteTest(TestCase):
+    """
+    Тесты команды замера удаления пользователя.
+    """
+    def test_report(self) -> None:
+        """
+        Тест отчета по способам удаления и удаления временных данных.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'delete.json')
+            call_command(
+                'benchmark_user_delete', '--tasks', '300', '--chunk-size', '100', '--collector', '--json', path,
+                stdout=io.StringIO(),
+            )
+            with open(path, encoding='utf-8') as file:
+                report = json.load(file)
+
+        self.assertEqual([row['method'] for row in report], ['chunked', 'collector'])
+        self.assertTrue(all(row['tasks'] == 300 and row['peak_memory_mb'] >= 0 for row in report))
+        self.assertFalse(User.objects.filter(email__startswith='benchmark-delete-').exists())
+        self.assertFalse(TaskTombstone.objects.exists())
+
+    def test_memory_budget(self) -> None:
+        """
+        Тест ошибки при превышении бюджета памяти.
+        """
+        with self.assertRaises(CommandError):
+            call_command('benchmark_user_delete', '--tasks', '200', '--memory-budget-mb', '0', stdout=io.StringIO())
+        self.assertFalse(User.objects.filter(email__startswith='benchmark-delete-').exists())
@@ -0,0 +1,115 @@
+"""
+Вспомогательные функции для тестов производительности.
+
+Содержит:
+- median_duration: медианное время выполнения вызываемого объекта.
+- create_tasks: быстрое создание большого количества задач через `bulk_create`.
+- count_queries: число SQL-запросов, выполненных вызываемым объектом.
+- assert_constant_queries: проверка того, что число запросов не растет с числом строк (N+1).
+"""
+
+import statistics
+import time
+from typing import Callable
+
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from tasks.cache import invalidate_user_tasks
+from tasks.models import Task
+from users.models import User
+
+
+def median_duration(func: Callable[[], object], repeat: int = 15) -> float:
+    """
+    Возвращает медианное время выполнения функции в секундах.
+
+    Медиана устойчивее среднего к единичным выбросам (сборка мусора, планировщик ОС).
+
+    Args:
+        func (Callable): Вызываемый объект без аргументов.
+        repeat (int): Количество замеров.
+
+    Returns:
+        float: Медианное время одного вызова.
+    """
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+def create_tasks(user: User, count: int, batch_size: int = 1000, **fields) -> None:
+    """
+    Создает `count` задач пользователя пакетными вставками.
+
+    Как и пакетные операции API, явно инвалидирует кэш списка задач пользователя.
+
+    Args:
+        user (User): Владелец задач.
+        count (int): Количество задач.
+        batch_size (int): Размер пакета для `bulk_create`.
+        **fields: Значения полей задачи, переопределяющие значения по умолчанию.
+    """
+    Task.objects.bulk_create(
+        (
+            Task(
+                user=user,
+                title=fields.get('title', f'Task {i}'),
+                description=fields.get('description', 'Description'),
+                status=fields.get('status', 'новая'),
+            )
+            for i in range(count)
+        ),
+        batch_size=batch_size,
+    )
+    invalidate_user_tasks(user.id)
+
+
+def count_queries(func: Callable[[], object]) -> int:
+    """
+    Возвращает число SQL-запросов к базе `default`, выполненных функцией.
+
+    Args:
+        func (Callable): Вызываемый объект без аргументов.
+
+    Returns:
+        int: Число запросов.
+    """
+    with CaptureQueriesContext(connection) as queries:
+        func()
+    return len(queries)
+
+
+def assert_constant_queries(
+    test_case: SimpleTestCase,
+    create_rows: Callable[[int], object],
+    request: Callable[[], object],
+    sizes: tuple = (10, 100, 1000),
+) -> list:
+    """
+    Проверяет, что число запросов `request` одинаково при росте числа строк.
+
+    Перед каждым замером `create_rows` добавляет строки так, чтобы их общее число
+    достигло очередного значения из `sizes`.
+
+    Args:
+        test_case (SimpleTestCase): Тест, от имени которого выполняется проверка.
+        create_rows (Callable): Функция, создающая указанное число новых строк.
+        request (Callable): Проверяемый вызов, например запрос тестового клиента.
+        sizes (tuple): Возрастающие общие числа строк.
+
+    Returns:
+        list: Число запросов для каждого значения из `sizes`.
+    """
+    counts, created = [], 0
+    for size in sizes:
+        create_rows(size - created)
+        created = size
+        counts.append(count_queries(request))
+    test_case.assertEqual(
+        len(set(counts)), 1, f'Число запросов растет с числом строк: {dict(zip(sizes, counts))}'
+    )
+    return counts
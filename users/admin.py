@@ -10,7 +10,9 @@
 
 
 from django.contrib import admin
+from django.db.models import Q
 from tasks.models import Task
+from tasks.search import search_filter
 from users.models import User
 
 
@@ -34,15 +36,32 @@ class TaskAdmin(admin.ModelAdmin):
 
     Attributes:
         list_display (tuple): Поля, которые отображаются в списке задач.
-        search_fields (tuple): Поля, по которым можно выполнить поиск в админке.
+        search_fields (tuple): Поля, по которым можно выполнить поиск в админке. Поиск по
+            названию и описанию выполняется по полнотекстовому индексу (см. `get_search_results`).
         list_filter (tuple): Поля, используемые для фильтрации задач в админке.
         raw_id_fields (tuple): Поля, в которых используется виджет для выбора связанных объектов
             (оптимизация для большого количества пользователей).
+        show_full_result_count (bool): Отключает подсчет всех задач при фильтрации,
+            который требует полного сканирования таблицы.
     """
     list_display = ('id', 'title', 'description', 'status', 'user')
     search_fields = ('title', 'description', 'user__email')
     list_filter = ('status',)
     raw_id_fields = ('user',)
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Ищет задачи по полнотекстовому индексу названия и описания или по точному email владельца.
+
+        Вместо `LIKE '%...%'` по текстовым полям с соединением таблицы пользователей оба
+        условия читаются по индексам, поэтому поиск не сканирует таблицу задач.
+        """
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        owners = User.objects.filter(email=search_term).values('id')
+        return queryset.filter(search_filter(search_term, queryset.db) | Q(user_id__in=owners)), False
 
 
 
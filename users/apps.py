@@ -2,7 +2,8 @@
 Конфигурация приложения Users.
 
 Определяет базовые настройки приложения, включая имя приложения
-и тип автоматического поля для первичных ключей моделей.
+и тип автоматического поля для первичных ключей моделей, а также подключает
+обработчики сигналов модели User.
 """
 
 
@@ -15,3 +16,6 @@ class UsersConfig(AppConfig):
     """
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self) -> None:
+        from users import signals  # noqa: F401
@@ -0,0 +1,206 @@
+"""
+Модуль асинхронных представлений API задач для запуска под ASGI.
+
+Содержит:
+- AsyncTaskListView: получение страницы списка задач (`GET`) и создание задачи (`POST`).
+- AsyncTaskDetailView: получение одной задачи (`GET`).
+
+Представления написаны на асинхронном ORM Django (`aiterator`, `aget`, `acreate`)
+и не занимают поток воркера на время ожидания базы данных или медленного клиента.
+Задачи сериализуются через `TaskSerializer`, а страница списка имеет тот же вид, что
+и в синхронном `TaskViewSet` (`next`, `previous`, `results`), с курсорами, совместимыми
+с `IdCursorPagination`. Поддерживается только подмножество параметров синхронного списка:
+`cursor` и `page_size`, задачи всегда упорядочены по `id`; `ordering`, `status`, `fields`
+и поиск не поддерживаются и игнорируются.
+
+Аутентификация — по JWT (`StatelessJWTAuthentication`); если для получения
+пользователя нужна база данных, проверка выполняется в потоке через `sync_to_async`.
+Частота запросов ограничивается теми же throttle-классами, что и в синхронном API
+(`DEFAULT_THROTTLE_CLASSES`, читаются при каждом запросе); с хранилищем корзин SQLite
+проверка выполняется в потоке.
+"""
+
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpRequest, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.pagination import Cursor
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from tasks.models import Task
+from tasks.serializers import TaskBulkSerializer, TaskSerializer
+
+from .authentication import StatelessJWTAuthentication
+from .pagination import IdCursorPagination
+
+
+def _json_response(data, status_code: int = status.HTTP_200_OK) -> JsonResponse:
+    """
+    Возвращает JSON-ответ без экранирования не-ASCII символов, как у DRF.
+    """
+    return JsonResponse(data, status=status_code, safe=False, json_dumps_params={'ensure_ascii': False})
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncTaskView(View):
+    """
+    Базовое асинхронное представление задач с JWT-аутентификацией.
+    """
+    authentication_class = StatelessJWTAuthentication
+    throttle_classes = None
+
+    async def dispatch(self, request: HttpRequest, *args, **kwargs):
+        """
+        Аутентифицирует запрос, проверяет частоту запросов и передает его обработчику метода.
+        """
+        try:
+            request.user = await self.authenticate(request)
+        except exceptions.APIException as exc:
+            return _json_response({'detail': exc.detail}, exc.status_code)
+        if request.user is None:
+            return _json_response(
+                {'detail': exceptions.NotAuthenticated.default_detail}, status.HTTP_403_FORBIDDEN
+            )
+        if settings.THROTTLE_STORE == 'sqlite':
+            wait = await sync_to_async(self.check_throttles)(request)
+        else:
+            wait = self.check_throttles(request)
+        if wait is not None:
+            throttled = exceptions.Throttled(wait)
+            response = _json_response({'detail': throttled.detail}, throttled.status_code)
+            response['Retry-After'] = '%d' % throttled.wait
+            return response
+        return await super().dispatch(request, *args, **kwargs)
+
+    def get_throttles(self) -> list:
+        """
+        Возвращает ограничения частоты запроса: `throttle_classes` представления или текущее
+        значение `DEFAULT_THROTTLE_CLASSES`.
+        """
+        classes = self.throttle_classes
+        if classes is None:
+            classes = api_settings.DEFAULT_THROTTLE_CLASSES
+        return [throttle_class() for throttle_class in classes]
+
+    def check_throttles(self, request: HttpRequest) -> float | None:
+        """
+        Возвращает наибольшее время ожидания среди превышенных ограничений или None.
+        """
+        waits = [
+            throttle.wait() or 0 for throttle in self.get_throttles()
+            if not throttle.allow_request(request, self)
+        ]
+        return max(waits) if waits else None
+
+    async def authenticate(self, request: HttpRequest):
+        """
+        Возвращает пользователя из JWT-токена или None, если токен не передан.
+        """
+        authenticator = self.authentication_class()
+        header = authenticator.get_header(Request(request))
+        if header is None:
+            return None
+        raw_token = authenticator.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = authenticator.get_validated_token(raw_token)
+        if authenticator.needs_database(validated_token):
+            return await sync_to_async(authenticator.get_user)(validated_token)
+        return authenticator.get_user(validated_token)
+
+
+class AsyncTaskListView(AsyncTaskView):
+    """
+    Асинхронный список задач текущего пользователя и создание задачи.
+    """
+    pagination_class = IdCursorPagination
+
+    async def get(self, request: HttpRequest) -> JsonResponse:
+        """
+        Возвращает страницу задач текущего пользователя, упорядоченных по `id`.
+
+        Курсор `next` указывает на задачи после последней на странице, `previous` — на задачи
+        перед первой; на первой и последней странице соответствующая ссылка равна None.
+        """
+        paginator = self.pagination_class()
+        drf_request = Request(request)
+        page_size = paginator.get_page_size(drf_request)
+        paginator.base_url = request.build_absolute_uri()
+        try:
+            cursor = paginator.decode_cursor(drf_request)
+            position = int(cursor.position) if cursor and cursor.position is not None else None
+        except (exceptions.NotFound, ValueError):
+            return _json_response({'detail': paginator.invalid_cursor_message}, status.HTTP_404_NOT_FOUND)
+        reverse = bool(cursor and cursor.reverse)
+
+        queryset = Task.objects.filter(user=request.user)
+        if reverse:
+            queryset = queryset.order_by('-id')
+            if position is not None:
+                queryset = queryset.filter(id__lt=position)
+        else:
+            queryset = queryset.order_by('id')
+            if position is not None:
+                queryset = queryset.filter(id__gt=position)
+
+        results = [TaskSerializer(task).data async for task in queryset[:page_size + 1].aiterator()]
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            results.reverse()
+
+        def link(backward: bool, task_id: int) -> str:
+            return paginator.encode_cursor(Cursor(offset=0, reverse=backward, position=str(task_id)))
+
+        # С обратным курсором дальше по направлению обхода лежат более ранние задачи.
+        has_previous, has_next = (has_more, position is not None) if reverse else (position is not None, has_more)
+        next_link = previous_link = None
+        if results:
+            if has_next:
+                next_link = link(False, results[-1]['id'])
+            if has_previous:
+                previous_link = link(True, results[0]['id'])
+        elif position is not None:
+            # Пустая страница за краем списка: ссылка ведет обратно к задачам у позиции курсора.
+            if reverse:
+                next_link = link(False, position - 1)
+            else:
+                previous_link = link(True, position + 1)
+        return _json_response({'next': next_link, 'previous': previous_link, 'results': results})
+
+    async def post(self, request: HttpRequest) -> JsonResponse:
+        """
+        Создает задачу, назначенную текущему пользователю.
+        """
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError:
+            return _json_response({'detail': exceptions.ParseError.default_detail}, status.HTTP_400_BAD_REQUEST)
+
+        # Владелец берется из токена, поэтому проверка данных не обращается к базе.
+        serializer = TaskBulkSerializer(data=data)
+        if not serializer.is_valid():
+            return _json_response(serializer.errors, status.HTTP_400_BAD_REQUEST)
+        task = await Task.objects.acreate(user_id=request.user.id, **serializer.validated_data)
+        return _json_response(TaskSerializer(task).data, status.HTTP_201_CREATED)
+
+
+class AsyncTaskDetailView(AsyncTaskView):
+    """
+    Асинхронное получение задачи текущего пользователя.
+    """
+
+    async def get(self, request: HttpRequest, pk: int) -> JsonResponse:
+        """
+        Возвращает задачу по идентификатору или 404.
+        """
+        try:
+            task = await Task.objects.aget(user=request.user, pk=pk)
+        except Task.DoesNotExist:
+            return _json_response({'detail': exceptions.NotFound.default_detail}, status.HTTP_404_NOT_FOUND)
+        return _json_response(TaskSerializer(task).data)
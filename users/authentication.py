@@ -0,0 +1,210 @@
+"""
+Модуль аутентификации API приложения Task Manager.
+
+Содержит:
+- StatelessJWTAuthentication: JWT-аутентификация без запроса пользователя к базе данных.
+  Состояние пользователя (`is_active`, `is_staff`) берется из подписанных claims,
+  добавленных в токен при выдаче (см. `add_user_claims`).
+- UserStateCache: небольшой TTL-кэш состояния пользователей в памяти процесса.
+  При `STATELESS_JWT['USER_STATE_TTL'] > 0` (по умолчанию 30 секунд) состояние читается
+  из базы не чаще одного раза за TTL, а не берется из claims. Отзыв токенов действует
+  только в процессе, где пользователь был деактивирован или удален; остальные воркеры
+  узнают об этом при следующем чтении состояния, то есть не позже чем через TTL.
+  `USER_STATE_TTL = 0` доверяет claims полностью: в других воркерах токены
+  деактивированного пользователя действуют до истечения срока жизни access-токена.
+- revoke_user_tokens / forget_user_state: хуки отзыва, вызываемые при деактивации,
+  удалении или изменении пользователя (см. `users.signals`).
+
+Пользователь, возвращаемый аутентификацией, — несохраненный экземпляр `User`
+с заполненными `id`, `is_active` и `is_staff`. Его можно использовать в фильтрах
+и внешних ключах, но нельзя сохранять.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+USER_STATE_CLAIMS = ('is_active', 'is_staff')
+
+DEFAULTS = {
+    'USER_STATE_TTL': 30,
+    'USER_STATE_CACHE_SIZE': 10000,
+}
+
+
+def get_setting(name: str):
+    """
+    Возвращает параметр из настройки `STATELESS_JWT` с учетом значений по умолчанию.
+    """
+    return getattr(settings, 'STATELESS_JWT', {}).get(name, DEFAULTS[name])
+
+
+def add_user_claims(token, user) -> None:
+    """
+    Добавляет в токен claims с состоянием пользователя.
+
+    Args:
+        token (Token): Токен simplejwt.
+        user (User): Пользователь, для которого выдается токен.
+    """
+    for claim in USER_STATE_CLAIMS:
+        token[claim] = getattr(user, claim)
+
+
+class UserStateCache:
+    """
+    Потокобезопасный TTL-кэш состояния пользователей с вытеснением по LRU.
+
+    Хранит также моменты отзыва токенов: токены пользователя, выданные не позже
+    момента отзыва, отклоняются до истечения срока жизни access-токена.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._states = OrderedDict()
+        self._revoked = {}
+
+    def get(self, user_id: int) -> dict | None:
+        """
+        Возвращает закэшированное состояние пользователя или None, если оно устарело.
+        """
+        with self._lock:
+            entry = self._states.get(user_id)
+            if entry is None:
+                return None
+            expires_at, state = entry
+            if expires_at < time.monotonic():
+                del self._states[user_id]
+                return None
+            self._states.move_to_end(user_id)
+            return state
+
+    def set(self, user_id: int, state: dict, ttl: float, max_size: int) -> None:
+        """
+        Сохраняет состояние пользователя на `ttl` секунд.
+        """
+        with self._lock:
+            self._states[user_id] = (time.monotonic() + ttl, state)
+            self._states.move_to_end(user_id)
+            while len(self._states) > max_size:
+                self._states.popitem(last=False)
+
+    def forget(self, user_id: int) -> None:
+        """
+        Удаляет закэшированное состояние пользователя.
+        """
+        with self._lock:
+            self._states.pop(user_id, None)
+
+    def revoke(self, user_id: int) -> None:
+        """
+        Отзывает все токены пользователя, выданные до текущего момента.
+        """
+        now = time.time()
+        lifetime = api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()
+        with self._lock:
+            self._states.pop(user_id, None)
+            self._revoked = {uid: (at, until) for uid, (at, until) in self._revoked.items() if until > now}
+            self._revoked[user_id] = (now, now + lifetime)
+
+    def is_revoked(self, user_id: int, issued_at: float | None) -> bool:
+        """
+        Проверяет, отозван ли токен пользователя, выданный в момент `issued_at`.
+        """
+        with self._lock:
+            revocation = self._revoked.get(user_id)
+        if revocation is None:
+            return False
+        revoked_at, _until = revocation
+        return issued_at is None or issued_at <= revoked_at
+
+    def clear(self) -> None:
+        """
+        Очищает кэш состояний и список отзывов.
+        """
+        with self._lock:
+            self._states.clear()
+            self._revoked.clear()
+
+
+user_state_cache = UserStateCache()
+
+
+def forget_user_state(user_id: int) -> None:
+    """
+    Сбрасывает закэшированное состояние пользователя; следующее обращение перечитает его.
+    """
+    user_state_cache.forget(user_id)
+
+
+def revoke_user_tokens(user_id: int) -> None:
+    """
+    Отзывает уже выданные токены пользователя в текущем процессе.
+    """
+    user_state_cache.revoke(user_id)
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT-аутентификация, доверяющая подписанным claims вместо запроса к таблице пользователей.
+
+    Токены без claims состояния (выданные до включения этого режима) проверяются
+    штатным способом с загрузкой пользователя из базы данных.
+    """
+
+    def needs_database(self, validated_token) -> bool:
+        """
+        Проверяет, потребуется ли для получения пользователя обращение к базе данных.
+
+        Используется асинхронными представлениями: если обращение не требуется,
+        пользователь строится прямо в событийном цикле без перехода в поток.
+        """
+        if any(claim not in validated_token for claim in USER_STATE_CLAIMS):
+            return True
+        return get_setting('USER_STATE_TTL') > 0
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if any(claim not in validated_token for claim in USER_STATE_CLAIMS):
+            return super().get_user(validated_token)
+
+        if user_state_cache.is_revoked(user_id, validated_token.get('iat')):
+            raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+
+        ttl = get_setting('USER_STATE_TTL')
+        if ttl > 0:
+            state = self._get_cached_state(user_id, ttl)
+        else:
+            state = {claim: validated_token[claim] for claim in USER_STATE_CLAIMS}
+
+        if not state['is_active']:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return self.user_model(**{api_settings.USER_ID_FIELD: user_id}, **state)
+
+    def _get_cached_state(self, user_id, ttl: float) -> dict:
+        """
+        Возвращает состояние пользователя из TTL-кэша, загружая его из базы при промахе.
+        """
+        state = user_state_cache.get(user_id)
+        if state is None:
+            state = (
+                self.user_model.objects
+                .filter(**{api_settings.USER_ID_FIELD: user_id})
+                .values(*USER_STATE_CLAIMS)
+                .first()
+            )
+            if state is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            user_state_cache.set(user_id, state, ttl, get_setting('USER_STATE_CACHE_SIZE'))
+        return state
@@ -0,0 +1,106 @@
+"""
+Модуль фильтров (filter backends) для API приложения Task Manager.
+
+Содержит:
+- TaskStatusFilter: фильтрация задач по статусу (`?status=новая` или `?status=новая,завершена`).
+- TaskSearchFilter: полнотекстовый поиск по названию и описанию (`?q=отчет`, см. `tasks.search`).
+- TaskOrderingFilter: сортировка задач (`?ordering=-status`) по разрешенным полям.
+- FieldsProjectionFilter: проекция полей (`?fields=id,title`); неиспользуемые колонки
+  не читаются из базы данных благодаря `QuerySet.only()`.
+
+Фильтры применяются к спискам и к получению отдельных объектов; проекция полей
+действует только для чтения.
+"""
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+from rest_framework.permissions import SAFE_METHODS
+from tasks.models import TaskStatus
+from tasks.search import search_filter
+
+
+def get_requested_fields(request, allowed_fields: list) -> list | None:
+    """
+    Возвращает список полей, запрошенных параметром `fields`.
+
+    Args:
+        request (Request): Запрос DRF.
+        allowed_fields (list): Поля, доступные для проекции, в порядке вывода.
+
+    Returns:
+        list | None: Запрошенные поля в порядке `allowed_fields` или None, если проекция не задана.
+
+    Raises:
+        ValidationError: Если запрошены неизвестные поля.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    raw = request.query_params.get(FieldsProjectionFilter.fields_param)
+    if not raw:
+        return None
+    requested = {name.strip() for name in raw.split(',') if name.strip()}
+    unknown = requested - set(allowed_fields)
+    if unknown:
+        raise ValidationError({
+            FieldsProjectionFilter.fields_param: [f'Неизвестные поля: {", ".join(sorted(unknown))}.'],
+        })
+    return [name for name in allowed_fields if name in requested]
+
+
+class TaskStatusFilter(BaseFilterBackend):
+    """
+    Фильтрует задачи по одному или нескольким статусам, перечисленным через запятую.
+    """
+    status_param = 'status'
+
+    def filter_queryset(self, request, queryset, view):
+        raw = request.query_params.get(self.status_param)
+        if not raw:
+            return queryset
+        statuses = {value.strip() for value in raw.split(',') if value.strip()}
+        unknown = statuses - {status.value for status in TaskStatus}
+        if unknown:
+            raise ValidationError({self.status_param: [f'Неизвестные статусы: {", ".join(sorted(unknown))}.']})
+        if len(statuses) == 1:
+            return queryset.filter(status=statuses.pop())
+        return queryset.filter(status__in=statuses)
+
+
+class TaskSearchFilter(BaseFilterBackend):
+    """
+    Отбирает задачи, содержащие все слова запроса (или слова, начинающиеся с них),
+    в названии или описании.
+    """
+    search_param = 'q'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '')
+        if not query.strip():
+            return queryset
+        return queryset.filter(search_filter(query, queryset.db))
+
+
+class TaskOrderingFilter(OrderingFilter):
+    """
+    Сортировка задач по полям `id`, `title` и `status`.
+
+    Итоговая сортировка дополняется полем `id` в пагинации, что делает курсор однозначным.
+    """
+    ordering_fields = ['id', 'title', 'status']
+
+
+class FieldsProjectionFilter(BaseFilterBackend):
+    """
+    Ограничивает выбираемые колонки полями из параметра `fields`.
+
+    К запрошенным полям добавляются поля текущей сортировки: они нужны пагинации
+    для построения курсора и иначе были бы догружены отдельными запросами.
+    """
+    fields_param = 'fields'
+
+    def filter_queryset(self, request, queryset, view):
+        fields = get_requested_fields(request, view.get_serializer_class().Meta.fields)
+        if fields is None:
+            return queryset
+        ordering = [name.lstrip('-') for name in queryset.query.order_by]
+        return queryset.only(*dict.fromkeys(fields + ordering))
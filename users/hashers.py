@@ -0,0 +1,189 @@
+"""
+Модуль хеширования паролей приложения Users.
+
+Содержит:
+- TunedPBKDF2PasswordHasher, TunedScryptPasswordHasher, TunedArgon2PasswordHasher: хешеры
+  Django с параметрами стоимости из настройки `PASSWORD_HASHING`. Алгоритмы и формат хешей
+  совпадают со стандартными, поэтому существующие пароли проверяются без изменений.
+  Если алгоритм хеша отличается от профиля (`PASSWORD_HASHER_PROFILE`) или параметры
+  стоимости изменились, пароль перехешируется при следующем успешном входе
+  (`AbstractBaseUser.check_password` сохраняет новый хеш).
+- HashingPool: ограниченный пул процессов для вычисления хешей.
+- HashingPoolBusy: исключение (503) при переполненной очереди пула.
+
+Пул выключен по умолчанию (`POOL_SIZE = 0`), и хеш вычисляется в потоке запроса. При
+`PASSWORD_HASHING['POOL_SIZE'] > 0` хеши вычисляются в пуле процессов: поток запроса ждет
+результат, но одновременно выполняется не больше `POOL_SIZE` хешей, поэтому всплеск
+входов не занимает все ядра хоста. Если свободного места в очереди (`POOL_SIZE + POOL_QUEUE`)
+нет дольше `POOL_TIMEOUT` секунд, запрос получает ответ 503, а не ждет, занимая воркер.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.utils.module_loading import import_string
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+DEFAULTS = {
+    'PBKDF2_ITERATIONS': hashers.PBKDF2PasswordHasher.iterations,
+    'SCRYPT_WORK_FACTOR': hashers.ScryptPasswordHasher.work_factor,
+    'SCRYPT_BLOCK_SIZE': hashers.ScryptPasswordHasher.block_size,
+    'SCRYPT_PARALLELISM': hashers.ScryptPasswordHasher.parallelism,
+    'ARGON2_TIME_COST': hashers.Argon2PasswordHasher.time_cost,
+    'ARGON2_MEMORY_COST': hashers.Argon2PasswordHasher.memory_cost,
+    'ARGON2_PARALLELISM': hashers.Argon2PasswordHasher.parallelism,
+    'POOL_SIZE': 0,
+    'POOL_QUEUE': 16,
+    'POOL_TIMEOUT': 5.0,
+}
+
+
+def get_setting(name: str):
+    """
+    Возвращает параметр из настройки `PASSWORD_HASHING` с учетом значений по умолчанию.
+    """
+    return getattr(settings, 'PASSWORD_HASHING', {}).get(name, DEFAULTS[name])
+
+
+class HashingPoolBusy(APIException):
+    """
+    Исключение для переполненной очереди пула хеширования.
+    """
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Сервис перегружен, повторите попытку позже.'
+    default_code = 'hashing_busy'
+
+
+def _call_hasher(path: str, params: dict, method: str, args: tuple):
+    """
+    Выполняет метод стандартного хешера Django с заданными параметрами (в процессе пула).
+    """
+    hasher = import_string(path)()
+    for name, value in params.items():
+        setattr(hasher, name, value)
+    return getattr(hasher, method)(*args)
+
+
+class HashingPool:
+    """
+    Ограниченный пул процессов для вычисления хешей паролей.
+
+    Пул создается лениво в каждом процессе воркера (после fork gunicorn) методом `spawn`:
+    воркеры могут быть многопоточными, а fork многопоточного процесса небезопасен.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor = None
+        self._slots = None
+        self._key = None
+
+    def _get_executor(self) -> tuple[ProcessPoolExecutor, threading.BoundedSemaphore]:
+        size, queue = get_setting('POOL_SIZE'), get_setting('POOL_QUEUE')
+        key = (os.getpid(), size, queue)
+        with self._lock:
+            if self._key != key:
+                if self._executor is not None and self._key[0] == key[0]:
+                    self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = ProcessPoolExecutor(max_workers=size, mp_context=multiprocessing.get_context('spawn'))
+                self._slots = threading.BoundedSemaphore(size + queue)
+                self._key = key
+            return self._executor, self._slots
+
+    def run(self, func, *args):
+        """
+        Выполняет функцию в пуле и возвращает ее результат.
+
+        Raises:
+            HashingPoolBusy: Место в очереди не освободилось за `POOL_TIMEOUT` секунд.
+        """
+        executor, slots = self._get_executor()
+        if not slots.acquire(timeout=get_setting('POOL_TIMEOUT')):
+            raise HashingPoolBusy()
+        try:
+            return executor.submit(func, *args).result()
+        finally:
+            slots.release()
+
+    def shutdown(self) -> None:
+        """
+        Останавливает процессы пула; следующий вызов `run` создаст пул заново.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = self._slots = self._key = None
+
+
+hashing_pool = HashingPool()
+
+
+def _cost(name: str) -> property:
+    return property(lambda self: get_setting(name))
+
+
+class PooledHasherMixin:
+    """
+    Вычисляет хеш в пуле процессов, если он включен.
+
+    В процесс пула передаются путь к стандартному хешеру Django и текущие параметры
+    стоимости (`cost_attributes`), поэтому там не нужны настройки проекта.
+    """
+    cost_attributes = ()
+
+    def _base_path(self) -> str:
+        base = next(cls for cls in type(self).__mro__ if cls.__module__ == hashers.__name__)
+        return f'{base.__module__}.{base.__qualname__}'
+
+    def _run(self, method: str, *args):
+        params = {name: getattr(self, name) for name in self.cost_attributes}
+        return hashing_pool.run(_call_hasher, self._base_path(), params, method, args)
+
+    def encode(self, password: str, salt: str, *args) -> str:
+        if get_setting('POOL_SIZE') <= 0:
+            return super().encode(password, salt, *args)
+        return self._run('encode', password, salt, *args)
+
+    def verify(self, password: str, encoded: str) -> bool:
+        if get_setting('POOL_SIZE') <= 0:
+            return super().verify(password, encoded)
+        return self._run('verify', password, encoded)
+
+
+class TunedPBKDF2PasswordHasher(PooledHasherMixin, hashers.PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 с числом итераций `PBKDF2_ITERATIONS`.
+    """
+    cost_attributes = ('iterations',)
+    iterations = _cost('PBKDF2_ITERATIONS')
+
+
+class TunedScryptPasswordHasher(PooledHasherMixin, hashers.ScryptPasswordHasher):
+    """
+    scrypt с параметрами `SCRYPT_WORK_FACTOR`, `SCRYPT_BLOCK_SIZE` и `SCRYPT_PARALLELISM`.
+    """
+    cost_attributes = ('work_factor', 'block_size', 'parallelism', 'maxmem')
+    work_factor = _cost('SCRYPT_WORK_FACTOR')
+    block_size = _cost('SCRYPT_BLOCK_SIZE')
+    parallelism = _cost('SCRYPT_PARALLELISM')
+
+    @property
+    def maxmem(self) -> int:
+        # scrypt использует 128 * n * r байт; лимит OpenSSL по умолчанию (32 МБ) мал уже для n = 2**15.
+        return 2 * 128 * self.work_factor * self.block_size
+
+
+class TunedArgon2PasswordHasher(PooledHasherMixin, hashers.Argon2PasswordHasher):
+    """
+    Argon2id с параметрами `ARGON2_TIME_COST`, `ARGON2_MEMORY_COST` (КиБ) и `ARGON2_PARALLELISM`.
+    Требует пакет argon2-cffi.
+    """
+    cost_attributes = ('time_cost', 'memory_cost', 'parallelism')
+    time_cost = _cost('ARGON2_TIME_COST')
+    memory_cost = _cost('ARGON2_MEMORY_COST')
+    parallelism = _cost('ARGON2_PARALLELISM')
@@ -0,0 +1,27 @@
+"""
+Модуль обработчиков фоновых заданий приложения Users (см. `tasks.jobs`).
+
+Содержит:
+- delete_user: удаление пользователя вместе с его задачами.
+"""
+
+from tasks import deletion
+from tasks.jobs import report_progress
+from tasks.models import Job
+
+
+def delete_user(job: Job) -> dict:
+    """
+    Удаляет пользователя `payload['user_id']` и его задачи порциями (см. `tasks.deletion`).
+
+    После каждой порции прогресс (`deleted`, `total`) сохраняется в задании, а аренда
+    задания продлевается; если аренда потеряна, удаление прекращается. Повторное
+    выполнение продолжает удаление, уже удаленный пользователь дает нулевой результат.
+
+    Returns:
+        dict: Число удаленных объектов по моделям.
+    """
+    def on_progress(deleted: int, total: int) -> bool:
+        return report_progress(job, deleted=deleted, total=total)
+
+    return deletion.delete_user(job.payload['user_id'], on_progress=on_progress)
@@ -0,0 +1,167 @@
+"""
+Модуль классов пагинации для API приложения Task Manager.
+
+Содержит:
+- IdCursorPagination: курсорная (keyset) пагинация по первичному ключу.
+  Страница выбирается условием `id > <позиция>` с `LIMIT`, поэтому время ответа
+  не зависит от размера таблицы, а запрос `COUNT(*)` не выполняется вовсе.
+
+Курсоры непрозрачны для клиента: DRF кодирует позицию в base64, клиент лишь
+переходит по ссылкам `next` и `previous` из ответа.
+
+При сортировке по неуникальному полю (например, `?ordering=status`) к ней добавляется
+`id` как уточняющий ключ, а позиция курсора хранит значения всех полей сортировки.
+Следующая страница выбирается составным условием вида
+`(status > s) OR (status = s AND id > i)`, которое обслуживается составным индексом.
+"""
+
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+
+
+def _reverse_ordering(ordering: tuple) -> tuple:
+    """
+    Возвращает сортировку в обратном направлении.
+    """
+    return tuple(field[1:] if field.startswith('-') else f'-{field}' for field in ordering)
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Курсорная пагинация, упорядоченная по полю `id`.
+
+    Attributes:
+        ordering (str): Поле сортировки; должно быть уникальным и индексированным.
+        page_size (int): Размер страницы по умолчанию.
+        page_size_query_param (str): Параметр запроса для изменения размера страницы.
+        max_page_size (int): Верхняя граница размера страницы, заданная клиентом.
+        tiebreaker (str): Уникальное поле, добавляемое к неуникальной сортировке.
+    """
+    ordering = 'id'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    tiebreaker = 'id'
+
+    def get_ordering(self, request, queryset, view) -> tuple:
+        """
+        Возвращает сортировку, дополненную уникальным полем `tiebreaker`.
+        """
+        ordering = super().get_ordering(request, queryset, view)
+        names = [field.lstrip('-') for field in ordering]
+        if self.tiebreaker in names:
+            return ordering[:names.index(self.tiebreaker) + 1]
+        direction = '-' if ordering[0].startswith('-') else ''
+        return ordering + (f'{direction}{self.tiebreaker}',)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Возвращает страницу результатов после позиции из курсора.
+
+        Повторяет `CursorPagination.paginate_queryset`, но фильтрует по составной позиции
+        для всех полей сортировки, а не только по первому из них.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            queryset = queryset.filter(self._position_filter(queryset.model, current_position, reverse))
+
+        # Лишняя запись показывает, есть ли следующая страница.
+        results = list(queryset[offset:offset + self.page_size + 1])
+        self.page = list(results[:self.page_size])
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def _position_filter(self, model, position: str, reverse: bool) -> Q:
+        """
+        Строит условие выборки записей, следующих за позицией курсора.
+
+        Args:
+            model: Модель, к которой относится выборка.
+            position (str): Позиция из курсора.
+            reverse (bool): Признак движения к предыдущей странице.
+
+        Returns:
+            Q: Составное условие по всем полям сортировки.
+        """
+        if len(self.ordering) == 1:
+            values = [position]
+        else:
+            try:
+                values = json.loads(position)
+            except ValueError:
+                raise NotFound(self.invalid_cursor_message)
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise NotFound(self.invalid_cursor_message)
+
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip('-')
+            try:
+                value = model._meta.get_field(name).to_python(value)
+            except (FieldDoesNotExist, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+            lookup = 'lt' if field.startswith('-') != reverse else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def _get_position_from_instance(self, instance, ordering) -> str:
+        """
+        Возвращает позицию записи: значение поля `id` либо JSON-список значений всех полей сортировки.
+        """
+        if len(ordering) == 1:
+            return super()._get_position_from_instance(instance, ordering)
+        values = []
+        for field in ordering:
+            name = field.lstrip('-')
+            values.append(instance[name] if isinstance(instance, dict) else getattr(instance, name))
+        return json.dumps(values, ensure_ascii=False, default=str)
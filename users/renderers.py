@@ -0,0 +1,47 @@
+"""
+Модуль рендереров для API приложения Task Manager.
+
+Содержит:
+- FastJSONRenderer: JSON-рендерер на orjson с выводом, побайтно совпадающим с
+  `rest_framework.renderers.JSONRenderer`.
+
+orjson — необязательная зависимость: если он не установлен, запрошен отступ (`indent`)
+или данные содержат значения, которые orjson не кодирует (например, целые больше 64 бит),
+используется стандартный рендерер DRF.
+
+Числа с плавающей точкой orjson записывает иначе, чем модуль json (например, `1e-7`
+вместо `1e-07`); в моделях API таких полей нет.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - зависит от окружения
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Рендерер JSON на orjson для компактного вывода в UTF-8.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        renderer_context = renderer_context or {}
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Даты и датаклассы кодируются так же, как в DRF, — через JSONEncoder.default.
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=options)
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Как и DRF, экранируем разделители строк, недопустимые в JavaScript.
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
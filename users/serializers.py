@@ -4,15 +4,66 @@
 Содержит:
 - UserSerializer: сериализатор для модели пользователя. Поддерживает создание
   нового пользователя с зашифрованным паролем и позволяет безопасно работать с данными.
-- TaskSerializer: сериализатор для модели задачи, предоставляющий преобразование данных
-  задач в формат JSON и обратно.
+- TaskSerializer, JobSerializer: сериализаторы задачи и фонового задания
+  (реэкспорт из `tasks.serializers`).
+- ClaimsTokenObtainPairSerializer, ClaimsTokenRefreshSerializer: выдача и обновление
+  JWT-токенов с claims состояния пользователя для `StatelessJWTAuthentication`.
+- get_values_fields: поля сериализатора, представление которых можно получить прямо
+  из `QuerySet.values()` без создания экземпляров модели (быстрый путь списков).
 """
 
 
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
-from tasks.models import Task
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import (TokenObtainPairSerializer,
+                                                  TokenRefreshSerializer)
+from rest_framework_simplejwt.settings import api_settings
+from tasks.serializers import JobSerializer, TaskSerializer
+from users.authentication import add_user_claims
 from users.models import User
 
+__all__ = [
+    'ClaimsTokenObtainPairSerializer', 'ClaimsTokenRefreshSerializer', 'JobSerializer', 'TaskSerializer',
+    'UserSerializer', 'get_values_fields',
+]
+
+# Поля, у которых `to_representation` возвращает значение колонки без изменений.
+VALUES_FIELD_TYPES = (
+    serializers.IntegerField,
+    serializers.CharField,
+    serializers.EmailField,
+    serializers.ChoiceField,
+    serializers.BooleanField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+
+def get_values_fields(serializer: serializers.Serializer) -> list | None:
+    """
+    Возвращает читаемые поля сериализатора, если их представление совпадает со значениями колонок.
+
+    Для таких сериализаторов строка `QuerySet.values(*fields)` уже является готовым
+    представлением объекта, и сериализатор можно не вызывать.
+
+    Args:
+        serializer (Serializer): Экземпляр сериализатора.
+
+    Returns:
+        list | None: Имена полей в порядке вывода или None, если быстрый путь неприменим.
+    """
+    model_fields = {field.name: field for field in serializer.Meta.model._meta.concrete_fields}
+    names = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if type(field) not in VALUES_FIELD_TYPES or field.source != name or name not in model_fields:
+            return None
+        if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is not None:
+            return None
+        names.append(name)
+    return names
+
 
 class UserSerializer(serializers.ModelSerializer):
     """
@@ -38,11 +89,32 @@ class UserSerializer(serializers.ModelSerializer):
         return user
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
     """
-    Сериализатор для модели задачи.
+    Сериализатор выдачи пары токенов с claims состояния пользователя.
     """
 
-    class Meta:
-        model = Task
-        fields = ['id', 'title', 'description', 'status', 'user']
+    @classmethod
+    def get_token(cls, user: User):
+        token = super().get_token(user)
+        add_user_claims(token, user)
+        return token
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Сериализатор обновления access-токена.
+
+    Перед выдачей нового токена перечитывает состояние пользователя из базы данных:
+    обновление выполняется редко, а claims в новом токене остаются актуальными.
+    """
+
+    def validate(self, attrs: dict) -> dict:
+        refresh = self.token_class(attrs['refresh'])
+        user = User.objects.filter(**{api_settings.USER_ID_FIELD: refresh[api_settings.USER_ID_CLAIM]}).first()
+        if user is None or not user.is_active:
+            raise AuthenticationFailed(
+                _("No active account found with the given credentials"), code='no_active_account'
+            )
+        add_user_claims(refresh, user)
+        return super().validate({'refresh': str(refresh)})
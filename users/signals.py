@@ -0,0 +1,34 @@
+"""
+Модуль обработчиков сигналов для приложения Users.
+
+Содержит обработчики сигналов модели User, поддерживающие актуальность состояния
+пользователей при аутентификации без запроса к базе данных:
+- после сохранения пользователя сбрасывается его закэшированное состояние,
+  а при деактивации отзываются уже выданные токены;
+- после удаления пользователя его токены отзываются.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from users.authentication import forget_user_state, revoke_user_tokens
+from users.models import User
+
+
+@receiver(post_save, sender=User, dispatch_uid='users_refresh_auth_state_on_save')
+def refresh_auth_state_on_save(sender, instance: User, **kwargs) -> None:
+    """
+    Сбрасывает состояние пользователя в кэше аутентификации и отзывает токены неактивного пользователя.
+    """
+    if instance.is_active:
+        forget_user_state(instance.pk)
+    else:
+        revoke_user_tokens(instance.pk)
+
+
+@receiver(post_delete, sender=User, dispatch_uid='users_revoke_tokens_on_delete')
+def revoke_tokens_on_delete(sender, instance: User, **kwargs) -> None:
+    """
+    Отзывает токены удаленного пользователя.
+    """
+    revoke_user_tokens(instance.pk)
@@ -8,25 +8,33 @@
 Маршруты:
 - `/users/`: управление пользователями.
 - `/tasks/`: управление задачами.
-- `/token/`: получение JWT-токена.
+- `/jobs/`: статус фоновых заданий текущего пользователя.
+- `/token/`: получение JWT-токена (с ограничением частоты попыток входа, см. `task_manager.throttling`).
 - `/token/refresh/`: обновление JWT-токена.
+- `/async/tasks/`: асинхронный список и создание задач (для запуска под ASGI).
+- `/async/tasks/<id>/`: асинхронное получение задачи.
 """
 
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 from rest_framework_simplejwt.views import (TokenObtainPairView,
                                             TokenRefreshView)
+from task_manager.throttling import LOGIN_THROTTLE_CLASSES
 
-from .views import TaskViewSet, UserViewSet
+from .async_views import AsyncTaskDetailView, AsyncTaskListView
+from .views import JobViewSet, TaskViewSet, UserViewSet
 
 
 router = DefaultRouter()
 router.register(r'users', UserViewSet, basename='user')
 router.register(r'tasks', TaskViewSet, basename='task')
+router.register(r'jobs', JobViewSet, basename='job')
 
 
 urlpatterns = [
     path('', include(router.urls)),
-    path('token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
+    path('token/', TokenObtainPairView.as_view(throttle_classes=LOGIN_THROTTLE_CLASSES), name='token_obtain_pair'),
     path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('async/tasks/', AsyncTaskListView.as_view(), name='async-task-list'),
+    path('async/tasks/<int:pk>/', AsyncTaskDetailView.as_view(), name='async-task-detail'),
 ]
@@ -6,27 +6,135 @@
   обновления и удаления. Ограничивает доступ только аутентифицированным пользователям.
 - TaskViewSet: управление задачами с фильтрацией по текущему пользователю.
   Поддерживает создание, получение, обновление и удаление задач.
+- JobViewSet: статус фоновых заданий, поставленных текущим пользователем.
+
+Списки пользователей и задач отдаются постранично с курсорной пагинацией по `id`
+(см. `users.pagination.IdCursorPagination`). Список задач поддерживает фильтрацию
+по статусу, полнотекстовый поиск (`?q=`), сортировку и проекцию полей (см. `users.filters`).
+
+Пакетные операции над задачами доступны по маршруту `/tasks/bulk/`: POST создает,
+PUT обновляет, DELETE удаляет список задач в одной транзакции. Если хотя бы один
+элемент некорректен, ничего не сохраняется, а ответ содержит ошибки по каждому элементу.
+
+Страницы списка задач кэшируются для каждого пользователя (см. `tasks.cache`) и
+отдаются с заголовками ETag и Last-Modified (см. `tasks.cache.last_modified`); при
+совпадении условий запроса возвращается 304 без обращения к таблице задач.
+
+Выгрузка всех задач пользователя доступна по маршруту `/tasks/export/?output=ndjson|csv`:
+строки читаются из базы порциями и сразу отправляются клиенту (`StreamingHttpResponse`),
+поэтому память воркера не зависит от числа задач. Фильтры по статусу, сортировка и
+проекция полей действуют так же, как для списка.
+
+Списки в обоих ViewSet'ах строятся по быстрому пути: строки страницы читаются через
+`QuerySet.values()` и сразу являются представлением объектов, без создания экземпляров
+модели и вызова сериализатора (см. `ValuesListMixin`). Вывод совпадает с сериализатором.
+
+Для действий обоих ViewSet'ов задан бюджет SQL-запросов (`query_budget`, см.
+`task_manager.metrics`): число запросов не должно расти с числом строк. Бюджет учитывает
+аутентификацию по сессии (два запроса). Пакетные операции и удаление пользователя
+выполняют число запросов, пропорциональное объему данных, и бюджета не имеют.
+
+Пользователь удаляется вместе с задачами порциями в коротких транзакциях (см. `tasks.deletion`),
+а не одним каскадным удалением, которое загружает все задачи и надолго блокирует базу.
+
+Инкрементальная синхронизация задач доступна по маршруту `/tasks/changes/?since=<cursor>`:
+ответ содержит только задачи, измененные после курсора, и идентификаторы удаленных задач
+(см. `tasks.sync`). Без `since` возвращаются все задачи и курсор для следующей синхронизации.
+
+Сводка по статусам задач доступна по маршруту `/tasks/stats/`: число задач в каждом статусе
+читается из счетчиков, которые база данных обновляет при каждой записи (см. `tasks.counters`),
+поэтому стоимость запроса не зависит от числа задач.
+
+Удаление пользователя с параметром `?async=true` не выполняется в запросе: пользователь
+сразу деактивируется, удаление ставится в очередь фоновых заданий (см. `tasks.jobs`),
+а ответ 202 содержит задание, статус которого доступен по маршруту `/jobs/<id>/`.
+
+Чтение (GET) в обоих ViewSet'ах может обслуживаться репликой базы данных, если она
+настроена; после записи чтение закрепляется за основной базой (см. `task_manager.db_routers`).
+Синхронизация всегда читает из основной базы: отставание реплики привело бы к пропуску изменений.
+Статус заданий также читается из основной базы: его меняют воркеры, а не клиент.
 
 Особенности:
 - Возвращает пустой QuerySet для Swagger-документации.
 - Автоматически связывает задачи с текущим аутентифицированным пользователем при создании.
 """
 
-from rest_framework import viewsets
-from rest_framework.permissions import IsAuthenticated
-from tasks.models import Task
+from django.conf import settings
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+from task_manager.db_routers import use_replica_reads
+from tasks import cache as task_cache
+from tasks import counters as task_counters
+from tasks import sync as task_sync
+from tasks import deletion, jobs
+from tasks.export import EXPORT_FORMATS, EXPORT_WRITERS
+from tasks.models import Job, Task
+from tasks.serializers import TaskBulkSerializer
 from users.models import User
 
-from .serializers import TaskSerializer, UserSerializer
+from .filters import (FieldsProjectionFilter, TaskOrderingFilter,
+                      TaskSearchFilter, TaskStatusFilter, get_requested_fields)
+from .pagination import IdCursorPagination
+from .serializers import (JobSerializer, TaskSerializer, UserSerializer,
+                          get_values_fields)
+
+
+class ReplicaReadMixin:
+    """
+    Разрешает чтение из реплики для безопасных методов (GET, HEAD, OPTIONS).
+
+    Включается после аутентификации и проверки прав, поэтому они читают из основной базы.
+    Действия из `primary_read_actions` всегда читают из основной базы.
+    """
+    primary_read_actions = ()
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS and self.action not in self.primary_read_actions:
+            use_replica_reads()
+
+
+class ValuesListMixin:
+    """
+    Быстрый путь списка: страница строится из `QuerySet.values()` вместо экземпляров модели.
+
+    Применяется, когда представление всех полей сериализатора совпадает со значениями
+    колонок (см. `get_values_fields`); иначе используется обычный `list`.
+    """
+    values_list_fast_path = True
+
+    def list(self, request, *args, **kwargs):
+        fields = get_values_fields(self.get_serializer()) if self.values_list_fast_path else None
+        if fields is None or self.paginator is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        # Пагинатору нужны значения полей сортировки для позиции курсора.
+        ordering = [name.lstrip('-') for name in self.paginator.get_ordering(request, queryset, self)]
+        extra = [name for name in dict.fromkeys(ordering) if name not in fields]
+        page = self.paginate_queryset(queryset.values(*fields, *extra))
+        if extra:
+            page = [{name: row[name] for name in fields} for row in page]
+        return self.get_paginated_response(page)
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(ReplicaReadMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet для управления пользователями.
     """
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = IdCursorPagination
     http_method_names = ['get', 'post', 'delete', 'put']
+    query_budget = {'list': 3, 'retrieve': 3, 'create': 4, 'update': 5}
 
     def get_queryset(self):
         """
@@ -38,14 +146,45 @@ class UserViewSet(viewsets.ModelViewSet):
 
         return User.objects.all()
 
+    def destroy(self, request, *args, **kwargs):
+        """
+        Удаляет пользователя или, с параметром `async`, ставит удаление в очередь фоновых заданий.
+
+        При отложенном удалении пользователь сразу деактивируется (его токены отзываются),
+        а ответ 202 содержит задание и ссылку на его статус в заголовке Location.
+        """
+        if request.query_params.get('async', 'false').lower() not in ('', '1', 'true'):
+            return super().destroy(request, *args, **kwargs)
+        user = self.get_object()
+        with transaction.atomic():
+            user.is_active = False
+            user.save(update_fields=['is_active'])
+            job = jobs.enqueue('delete_user', {'user_id': user.pk}, user_id=request.user.id)
+        location = reverse('job-detail', kwargs={'pk': job.pk}, request=request)
+        return Response(JobSerializer(job).data, status=status.HTTP_202_ACCEPTED, headers={'Location': location})
 
-class TaskViewSet(viewsets.ModelViewSet):
+    def perform_destroy(self, instance):
+        """
+        Удаляет пользователя и его задачи порциями.
+        """
+        deletion.delete_user(instance.pk)
+
+
+class TaskViewSet(ReplicaReadMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet для управления задачами.
     """
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = IdCursorPagination
+    filter_backends = [TaskStatusFilter, TaskSearchFilter, TaskOrderingFilter, FieldsProjectionFilter]
     http_method_names = ['get', 'post', 'delete', 'put']
+    bulk_max_items = 10000
+    export_chunk_size = 2000
+    query_budget = {
+        'list': 3, 'retrieve': 3, 'create': 4, 'update': 5, 'destroy': 5, 'export': 3, 'changes': 4, 'stats': 3,
+    }
+    primary_read_actions = ('changes',)
 
     def get_queryset(self):
         """
@@ -57,8 +196,215 @@ class TaskViewSet(viewsets.ModelViewSet):
 
         return Task.objects.filter(user=self.request.user)
 
+    def list(self, request, *args, **kwargs):
+        """
+        Возвращает страницу списка задач из кэша пользователя или формирует и кэширует ее.
+        Поддерживает условные запросы (If-None-Match, If-Modified-Since).
+        """
+        user_id = request.user.id
+        version = task_cache.get_list_version(user_id)
+        cache_key = task_cache.list_cache_key(
+            user_id, version, f'{request.accepted_renderer.format}:{request.build_absolute_uri()}'
+        )
+        etag = task_cache.make_etag(cache_key)
+        last_modified = task_cache.last_modified(version)
+        headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+        if last_modified is not None:
+            headers['Last-Modified'] = http_date(last_modified)
+
+        not_modified = get_conditional_response(request._request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            for name, value in headers.items():
+                not_modified[name] = value
+            return not_modified
+
+        data = task_cache.get_cached_list(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            task_cache.set_cached_list(cache_key, data)
+        return Response(data, headers=headers)
+
+    def get_serializer(self, *args, **kwargs):
+        """
+        Возвращает сериализатор, ограниченный полями из параметра `fields`, если он задан.
+        """
+        fields = get_requested_fields(self.request, self.get_serializer_class().Meta.fields)
+        if fields is not None:
+            kwargs.setdefault('fields', fields)
+        return super().get_serializer(*args, **kwargs)
+
     def perform_create(self, serializer):
         """
         Сохраняет новую задачу, назначенную текущему пользователю.
         """
         serializer.save(user=self.request.user)
+
+    def _get_bulk_items(self, request) -> list:
+        """
+        Возвращает список элементов пакетного запроса.
+
+        Raises:
+            ValidationError: Если тело запроса не является непустым списком допустимого размера.
+        """
+        items = request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError({'non_field_errors': ['Ожидается непустой список.']})
+        if len(items) > self.bulk_max_items:
+            raise ValidationError({'non_field_errors': [f'Не более {self.bulk_max_items} элементов за запрос.']})
+        return items
+
+    def _find_own_tasks(self, ids: list) -> tuple[dict, list]:
+        """
+        Находит задачи текущего пользователя по идентификаторам одним запросом.
+
+        Args:
+            ids (list): Идентификаторы из запроса в порядке элементов.
+
+        Returns:
+            tuple[dict, list]: Найденные задачи по id и ошибки по каждому элементу.
+        """
+        # Тип проверяется до поиска во множествах: словарь или список в id не хешируется.
+        valid = [isinstance(pk, int) and not isinstance(pk, bool) for pk in ids]
+        tasks = Task.objects.filter(user=self.request.user).in_bulk(
+            {pk for pk, is_valid in zip(ids, valid) if is_valid}
+        )
+        errors = []
+        seen = set()
+        for pk, is_valid in zip(ids, valid):
+            if not is_valid:
+                errors.append({'id': ['Ожидается целочисленный идентификатор задачи.']})
+                continue
+            if pk not in tasks:
+                errors.append({'id': [f'Задача {pk} не найдена.']})
+            elif pk in seen:
+                errors.append({'id': [f'Задача {pk} указана повторно.']})
+            else:
+                errors.append({})
+            seen.add(pk)
+        return tasks, errors
+
+    @action(detail=False, methods=['post'], url_path='bulk', serializer_class=TaskBulkSerializer)
+    def bulk(self, request):
+        """
+        Создает список задач текущего пользователя одним `bulk_create`.
+        """
+        serializer = TaskBulkSerializer(data=self._get_bulk_items(request), many=True)
+        if not serializer.is_valid():
+            return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+        with transaction.atomic():
+            serializer.save(user=request.user)
+            task_cache.invalidate_user_tasks(request.user.id)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @bulk.mapping.put
+    def bulk_update(self, request):
+        """
+        Обновляет список задач текущего пользователя одним `bulk_update`.
+        Каждый элемент должен содержать `id` задачи.
+        """
+        items = self._get_bulk_items(request)
+        ids = [item.get('id') if isinstance(item, dict) else None for item in items]
+        tasks, errors = self._find_own_tasks(ids)
+
+        serializer = TaskBulkSerializer(data=items, many=True)
+        if not serializer.is_valid():
+            errors = [{**item_errors, **id_errors} for item_errors, id_errors in zip(serializer.errors, errors)]
+        if any(errors):
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer.instance = [tasks[pk] for pk in ids]
+        with transaction.atomic():
+            serializer.save()
+            task_cache.invalidate_user_tasks(request.user.id)
+        return Response(serializer.data)
+
+    @bulk.mapping.delete
+    def bulk_destroy(self, request):
+        """
+        Удаляет список задач текущего пользователя по идентификаторам.
+
+        Задачи удаляются без загрузки и поштучных сигналов (см. `tasks.deletion.delete_tasks`).
+        """
+        ids = self._get_bulk_items(request)
+        tasks, errors = self._find_own_tasks(ids)
+        if any(errors):
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+        with transaction.atomic():
+            deletion.delete_tasks(request.user.id, list(tasks))
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=['get'], url_path='export', pagination_class=None)
+    def export(self, request):
+        """
+        Выгружает все задачи текущего пользователя потоком в формате NDJSON (по умолчанию) или CSV.
+        Формат задается параметром `output`.
+        """
+        output = request.query_params.get('output', 'ndjson')
+        if output not in EXPORT_FORMATS:
+            raise ValidationError({'output': [f'Допустимые форматы: {", ".join(EXPORT_FORMATS)}.']})
+
+        fields = get_requested_fields(request, self.serializer_class.Meta.fields) or self.serializer_class.Meta.fields
+        queryset = self.filter_queryset(self.get_queryset())
+        if not queryset.query.order_by:
+            queryset = queryset.order_by('id')
+        # Строки читаются уже после выхода из представления, поэтому база выбирается сейчас.
+        queryset = queryset.using(queryset.db)
+        rows = queryset.values(*fields).iterator(chunk_size=self.export_chunk_size)
+
+        response = StreamingHttpResponse(EXPORT_WRITERS[output](rows, fields), content_type=EXPORT_FORMATS[output])
+        response['Content-Disposition'] = f'attachment; filename="tasks.{output}"'
+        response['Cache-Control'] = 'private, no-store'
+        return response
+
+    @action(detail=False, methods=['get'], url_path='changes', pagination_class=None)
+    def changes(self, request):
+        """
+        Возвращает изменения задач текущего пользователя после курсора `since`.
+        Размер страницы задается параметром `limit`, проекция полей — параметром `fields`.
+        """
+        since = request.query_params.get('since')
+        try:
+            cursor = task_sync.decode_cursor(since) if since else None
+        except ValueError as error:
+            raise ValidationError({'since': [str(error)]})
+        try:
+            limit = int(request.query_params.get('limit', settings.TASK_SYNC_PAGE_SIZE))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= settings.TASK_SYNC_MAX_PAGE_SIZE:
+            raise ValidationError({'limit': [f'Ожидается число от 1 до {settings.TASK_SYNC_MAX_PAGE_SIZE}.']})
+
+        fields = get_requested_fields(request, self.serializer_class.Meta.fields) or self.serializer_class.Meta.fields
+        try:
+            data = task_sync.get_changes(request.user.id, cursor, fields, limit)
+        except task_sync.CursorExpired as error:
+            return Response({'detail': str(error)}, status=status.HTTP_410_GONE)
+        return Response(data, headers={'Cache-Control': 'private, no-store'})
+
+    @action(detail=False, methods=['get'], url_path='stats', pagination_class=None, filter_backends=[])
+    def stats(self, request):
+        """
+        Возвращает число задач текущего пользователя в каждом статусе и общее число задач.
+        """
+        counts = task_counters.get_status_counts(request.user.id)
+        return Response({'counts': counts, 'total': sum(counts.values())})
+
+
+class JobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    ViewSet статуса фоновых заданий текущего пользователя.
+    """
+    serializer_class = JobSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = IdCursorPagination
+    query_budget = {'list': 3, 'retrieve': 3}
+
+    def get_queryset(self):
+        """
+        Возвращает задания, поставленные текущим пользователем.
+        Если запрос поступил от Swagger, возвращается пустой QuerySet.
+        """
+        if getattr(self, 'swagger_fake_view', False):
+            return Job.objects.none()  # Возвращаем пустой QuerySet для Swagger
+
+        return Job.objects.filter(user_id=self.request.user.id)